@@ -53,6 +53,8 @@ def inject_async(func):
         func()
     except KeyError:
         PluginBase.async_reg[func] = injections
+        for i in injections:
+            PluginBase.async_waiters.setdefault(i, []).append(func)
 
     return func
 
@@ -87,6 +89,8 @@ class RegistryHook(dict):
 class PluginBase:
     subclasses = []
     async_reg = {}
+    # Pending async injections indexed by the registry paths they wait for
+    async_waiters = {}
 
     def __init_subclass__(cls, **kwargs):
         super().__init_subclass__(**kwargs)
@@ -112,11 +116,14 @@ class PluginBase:
 
 
 def manage_async_regs(key_path):
+    waiters = PluginBase.async_waiters.get(key_path, None)
+    if not waiters:
+        return
+
     resolved = []
 
-    for func, injections in PluginBase.async_reg.items():
-        if key_path not in injections:
-            continue
+    for func in waiters.copy():
+        injections = PluginBase.async_reg[func]
 
         try:
             all(reg[i] for i in injections)
@@ -126,7 +133,8 @@ def manage_async_regs(key_path):
             pass
 
     for r in resolved:
-        PluginBase.async_reg.pop(r)
+        for i in PluginBase.async_reg.pop(r):
+            PluginBase.async_waiters[i].remove(r)
 
 
 # def bind(key_pattern, value):
@@ -208,13 +216,101 @@ class ConfigVariable:
         return self._val != self.default
 
 
+_path_cache = {}
+
+
+def split_path(path):
+    """Returns the list of the path components, caching the result, since
+    the same paths are accessed over and over again."""
+    try:
+        return _path_cache[path]
+    except KeyError:
+        res = _path_cache[path] = path.split(delimiter)
+        return res
+
+
+class RegistryHandle:
+    """Bound accessor of a single registry path.
+
+    The path is resolved to the registry holding the value only once, and
+    then again only after the structure of the registries changes, which
+    makes the access much faster than indexing the registry with the full
+    path. Obtained via :meth:`Registry.handle`::
+
+        timestep = reg.handle('sim/timestep')
+        timestep.set(timestep.get() + 1)
+    """
+
+    __slots__ = ('registry', 'path', 'subreg', 'key', 'version')
+
+    def __init__(self, registry, path):
+        self.registry = registry
+        self.path = path
+        self.version = None
+
+    def _resolve(self):
+        self.version = Registry.version
+        self.subreg = None
+
+        *names, self.key = split_path(self.path)
+        subreg = self.registry
+        for name in names:
+            subreg = dict.get(subreg, name, None)
+            # Paths that do not lead through registries are accessed the
+            # usual way
+            if type(subreg) is not Registry:
+                return
+
+        self.subreg = subreg
+
+    def get(self):
+        if self.version != Registry.version:
+            self._resolve()
+
+        if self.subreg is None:
+            return self.registry[self.path]
+
+        val = dict.__getitem__(self.subreg, self.key)
+        if isinstance(val, ConfigVariable):
+            return val.val
+
+        return val
+
+    def set(self, val):
+        if self.version != Registry.version:
+            self._resolve()
+
+        if self.subreg is None:
+            self.registry[self.path] = val
+            return
+
+        prev = dict.get(self.subreg, self.key, None)
+        if isinstance(prev, ConfigVariable):
+            prev.val = val
+        else:
+            if isinstance(prev, Registry) or isinstance(val, Registry):
+                Registry.version += 1
+
+            dict.__setitem__(self.subreg, self.key, val)
+
+        if self.registry is reg:
+            manage_async_regs(self.path)
+
+
 class Registry(dict):
+    # Incremented whenever a registry is added to or removed from another
+    # one, which invalidates the resolved RegistryHandle objects
+    version = 0
+
     def __getitem__(self, key):
-        key, _, subpath = key.partition('/')
-        val = super().__getitem__(key)
+        path = split_path(key)
+
+        val = self
+        for i, name in enumerate(path):
+            if type(val) is not Registry:
+                return val[delimiter.join(path[i:])]
 
-        if subpath:
-            return val[subpath]
+            val = dict.__getitem__(val, name)
 
         if isinstance(val, ConfigVariable):
             return val.val
@@ -230,6 +326,23 @@ class Registry(dict):
 
         return val
 
+    def __delitem__(self, key):
+        Registry.version += 1
+        super().__delitem__(key)
+
+    def pop(self, *args):
+        Registry.version += 1
+        return super().pop(*args)
+
+    def clear(self):
+        Registry.version += 1
+        super().clear()
+
+    def handle(self, path):
+        """Returns the :class:`RegistryHandle` for fast access to the
+        ``path``."""
+        return RegistryHandle(self, path)
+
     def _setitem(self, key, val):
         key, _, subpath = key.partition('/')
         if not subpath:
@@ -242,10 +355,17 @@ class Registry(dict):
                     cfgvar.val = val
                     return
 
+                if isinstance(cfgvar, Registry):
+                    Registry.version += 1
+
+            if isinstance(val, Registry):
+                Registry.version += 1
+
             return super().__setitem__(key, val)
 
         if key not in self:
             subreg = Registry()
+            Registry.version += 1
             super().__setitem__(key, subreg)
         else:
             subreg = super().__getitem__(key)
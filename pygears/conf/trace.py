@@ -4,12 +4,14 @@ import sys
 import textwrap
 import inspect
 from functools import partial
-from traceback import TracebackException
+from traceback import FrameSummary, StackSummary, TracebackException
 
 from .log import CustomLogger, LogPlugin, register_custom_log
 from .registry import Inject, inject, reg
 
-from .trace_format import enum_traceback, TraceLevel, enum_stacktrace
+from .trace_format import enum_traceback, TraceLevel, enum_stacktrace, enum_formated_stack_frames
+
+TRACE_CAPTURE_MODES = ('full', 'compact', 'none')
 
 
 def gear_definition_location(func):
@@ -35,6 +37,85 @@ def gear_definition_location(func):
     return uwrp, fn, ln, lines
 
 
+class GearTrace:
+    """Call stack at the point where the gear was instantiated.
+
+    Only the ``(filename, lineno, function)`` tuple is kept for each stack
+    frame, innermost frame first. Source lines are read, and the trace is
+    formatted, only once it is reported. Traces captured in the ``full`` mode
+    additionally keep the frame objects themselves in ``frames``.
+    """
+
+    __slots__ = ('entries', 'frames')
+
+    def __init__(self, entries, frames=None):
+        self.entries = entries
+        self.frames = frames
+
+    def __iter__(self):
+        return iter(self.entries)
+
+    def __len__(self):
+        return len(self.entries)
+
+    def summary(self):
+        """Returns the trace as a StackSummary, outermost frame first."""
+        return StackSummary.from_list([
+            FrameSummary(fn, ln, name, lookup_line=False)
+            for fn, ln, name in reversed(self.entries)
+        ])
+
+    def format(self):
+        """Returns the formatted trace frames, with the PyGears internal
+        frames omitted according to the ``trace/level``."""
+        return list(enum_formated_stack_frames(self.summary()))
+
+
+def capture_trace(ignore, mode=None):
+    """Captures the :class:`GearTrace` of the caller's call stack, omitting
+    the frames whose files start with the ``ignore`` path prefix or prefixes.
+    Depending on the ``mode`` (``trace/capture`` if not supplied), the full
+    trace with the frame objects is returned, a compact one, or ``None``.
+
+    Compact traces with the same entries are shared between the gears, so
+    that the gears instantiated in a loop keep only a single trace.
+    """
+    if mode is None:
+        mode = reg['trace/capture']
+
+    if mode == 'none':
+        return None
+    elif mode not in TRACE_CAPTURE_MODES:
+        raise ValueError(f'Unknown trace capture mode "{mode}", '
+                         f'expected one of {TRACE_CAPTURE_MODES}')
+
+    entries = []
+    frames = [] if mode == 'full' else None
+
+    f = sys._getframe(1)
+    while f is not None:
+        code = f.f_code
+        fn = code.co_filename
+        if not fn.startswith(ignore) and 'decorator-gen' not in fn:
+            entries.append((fn, f.f_lineno, code.co_name))
+            if frames is not None:
+                frames.append(f)
+
+        f = f.f_back
+
+    entries = tuple(entries)
+
+    if frames is not None:
+        return GearTrace(entries, frames)
+
+    traces = reg['trace/gear_traces']
+    trace = traces.get(entries, None)
+    if trace is None:
+        trace = traces[entries] = GearTrace(entries)
+
+    return trace
+
+
 class MultiAlternativeError(Exception):
     def __init__(self, errors):
         self.errors = errors
@@ -92,6 +173,12 @@ def log_exception(exception):
         for s in enum_traceback(tr):
             logging.getLogger('trace').error(s[:-1])
 
+    gear_trace = getattr(exception, 'gear_trace', None)
+    if gear_trace is not None:
+        logging.getLogger('trace').error('Gear instantiated at:')
+        for s in gear_trace.format():
+            logging.getLogger('trace').error(s[:-1])
+
     logging.getLogger('trace').error(register_issue(exception_type, exception))
 
 
@@ -155,6 +242,13 @@ class TracePlugin(LogPlugin):
         register_custom_log('trace', cls=TraceLog)
         reg['logger/hooks'].append(log_error_to_file)
         reg['trace/issues'] = []
+        reg['trace/gear_traces'] = {}
+
+        reg.confdef('trace/capture',
+                    default='compact',
+                    docs='How the call stack is captured for each gear instance: "full" keeps '
+                    'the frame objects, "compact" keeps only their locations and "none" '
+                    'captures nothing')
 
 
 # -*- coding: utf-8 -*-
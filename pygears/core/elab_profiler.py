@@ -0,0 +1,213 @@
+import json
+from time import perf_counter_ns
+
+from pygears.conf import core_log, reg
+
+PHASES = ('signature', 'memo', 'infer', 'body')
+
+
+class ElabStats:
+    __slots__ = ('count', 'signature', 'memo', 'infer', 'body', 'alt_fail', 'self_time',
+                 'memo_hits', 'alt_fails', 'traced')
+
+    def __init__(self):
+        self.count = 0
+        self.signature = 0
+        self.memo = 0
+        self.infer = 0
+        self.body = 0
+        self.alt_fail = 0
+        self.self_time = 0
+        self.memo_hits = 0
+        self.alt_fails = 0
+        self.traced = 0
+
+    @property
+    def total(self):
+        return self.signature + self.memo + self.infer + self.body + self.alt_fail
+
+    def todict(self):
+        return {
+            'count': self.count,
+            'signature_ns': self.signature,
+            'memo_ns': self.memo,
+            'infer_ns': self.infer,
+            'body_ns': self.body,
+            'alt_fail_ns': self.alt_fail,
+            'self_ns': self.self_time,
+            'total_ns': self.total,
+            'memo_hits': self.memo_hits,
+            'alt_fails': self.alt_fails,
+            'traced': self.traced
+        }
+
+
+class ElabFrame:
+    """Timing of a single gear instantiation in progress."""
+
+    __slots__ = ('profiler', 'func', 'phase', 'times', 'start', 'last', 'nested', 'memo_hit')
+
+    def __init__(self, profiler, func):
+        self.profiler = profiler
+        self.func = func
+        self.phase = 'signature'
+        self.times = dict.fromkeys(PHASES, 0)
+        self.nested = 0
+        self.memo_hit = False
+        self.start = self.last = perf_counter_ns()
+
+    def mark(self, phase):
+        """Ends the current phase of the instantiation and starts the next
+        one."""
+        now = perf_counter_ns()
+        self.times[self.phase] += now - self.last
+        self.phase = phase
+        self.last = now
+
+    def __enter__(self):
+        self.profiler.stack.append(self)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.mark(None)
+        total = perf_counter_ns() - self.start
+
+        profiler = self.profiler
+        profiler.stack.pop()
+        if profiler.stack:
+            profiler.stack[-1].nested += total
+
+        stats = profiler.stats_for(self.func)
+        stats.self_time += total - self.nested
+
+        if exc_type is not None:
+            # Time spent on the alternatives that failed to instantiate is
+            # accounted separately from the successful instantiations
+            stats.alt_fails += 1
+            stats.alt_fail += total
+            return
+
+        stats.count += 1
+        if self.memo_hit:
+            stats.memo_hits += 1
+
+        for phase, t in self.times.items():
+            setattr(stats, phase, getattr(stats, phase) + t)
+
+
+class NullFrame:
+    """Frame used when the elaboration profiler is disabled."""
+
+    memo_hit = False
+
+    def mark(self, phase):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        pass
+
+
+null_frame = NullFrame()
+
+
+def elab_frame(func):
+    """Returns the frame for timing the instantiation of the gear function
+    ``func`` with the active elaboration profiler."""
+    profiler = reg['gear/elab_profiler']
+    if profiler is None:
+        return null_frame
+
+    return ElabFrame(profiler, func)
+
+
+def definition_name(func):
+    return f'{func.__module__}.{func.__qualname__}'
+
+
+class ElabProfiler:
+    """Measures the time spent on building the design, per gear definition.
+
+    While the profiler is active (used as a context manager), each
+    instantiation of a gear is timed and its time split into the phases:
+
+    - ``signature``: matching the arguments to the gear function signature,
+    - ``memo``: lookup and copying of the memoized gears (see
+      ``gear/memoize``),
+    - ``infer``: inference of the gear parameters and types,
+    - ``body``: instantiation of the gear, including the execution of the
+      gear function with all the child gear instantiations,
+    - ``alt_fail``: total time of the instantiations that failed, usually
+      while trying the gear alternatives.
+
+    Since the body time includes the child instantiations, the time that was
+    spent in the definition itself is reported as ``self``. Results can be
+    printed via :meth:`report` or exported to JSON via :meth:`save_json`::
+
+        with ElabProfiler() as prof:
+            top()
+
+        print(prof.report())
+    """
+
+    def __init__(self):
+        self.stats = {}
+        self.stack = []
+        self.time = 0
+        self._prev = None
+
+    def stats_for(self, func):
+        name = definition_name(func)
+        stats = self.stats.get(name)
+        if stats is None:
+            stats = self.stats[name] = ElabStats()
+
+        return stats
+
+    def __enter__(self):
+        self._prev = reg['gear/elab_profiler']
+        reg['gear/elab_profiler'] = self
+        self._start = perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.time += perf_counter_ns() - self._start
+        reg['gear/elab_profiler'] = self._prev
+
+    def todict(self):
+        return {
+            'time_ns': self.time,
+            'definitions': {name: stats.todict()
+                            for name, stats in self.stats.items()}
+        }
+
+    def save_json(self, fn):
+        with open(fn, 'w') as f:
+            json.dump(self.todict(), f, indent=4)
+
+        core_log().info(f'Elaboration profile dumped to "{fn}"')
+
+    def report(self, limit=None):
+        """Returns the table of the gear definitions sorted by their self
+        time, with times in milliseconds."""
+        header = ('definition', 'count', 'self', 'total', 'signature', 'memo', 'infer', 'body',
+                  'alt_fail', 'memo_hits', 'alt_fails', 'traced')
+
+        rows = []
+        for name, s in sorted(self.stats.items(), key=lambda x: x[1].self_time,
+                              reverse=True)[:limit]:
+            times = (s.self_time, s.total, s.signature, s.memo, s.infer, s.body, s.alt_fail)
+            counts = (s.memo_hits, s.alt_fails, s.traced)
+            rows.append((name, str(s.count), *(f'{t / 1e6:.2f}' for t in times),
+                         *(str(c) for c in counts)))
+
+        widths = [max(len(r[i]) for r in [header] + rows) for i in range(len(header))]
+
+        lines = [f'Elaboration time: {self.time / 1e6:.2f} ms']
+        for r in [header] + rows:
+            lines.append('  '.join(
+                [r[0].ljust(widths[0])] + [c.rjust(w) for c, w in zip(r[1:], widths[1:])]))
+
+        return '\n'.join(lines)
@@ -5,8 +5,8 @@ import inspect
 from typing import List
 from dataclasses import dataclass
 from pygears.conf import PluginBase, reg
+from pygears.conf.trace import capture_trace
 from pygears.core.graph import has_async_producer
-from traceback import walk_stack
 from .intf import Intf
 from .port import InPort, OutPort, HDLConsumer, HDLProducer
 from .hier_node import NamedHierNode
@@ -29,14 +29,7 @@ def module():
     return reg['gear/current_module']
 
 
-def filter_internals(t):
-    is_internal = t[0].f_code.co_filename.startswith(os.path.dirname(__file__))
-    is_boltons = 'decorator-gen' in t[0].f_code.co_filename
-    return not is_internal and not is_boltons
-
-
-def enum_stacktrace():
-    return filter(filter_internals, walk_stack(f=None))
+CORE_DIR = os.path.dirname(__file__)
 
 
 class GearHierRoot(NamedHierNode):
@@ -91,7 +84,7 @@ class Gear(NamedHierNode):
         super().__init__(params['name'], reg['gear/current_module'] if func else None)
         self.meta_kwds = getattr(func, 'meta_kwds', {}).copy()
 
-        self.trace = list(enum_stacktrace())
+        self.trace = capture_trace(CORE_DIR)
         self.args = {}
         # self.params = struct_copy(params)
 
@@ -114,6 +107,7 @@ class Gear(NamedHierNode):
         self.const_args = {}
         self.in_ports: List[InPort] = []
         self.out_ports: List[OutPort] = []
+        self.out_intfs = []
 
     def __repr__(self):
         if self.parent is None:
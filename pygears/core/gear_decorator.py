@@ -173,12 +173,12 @@ def create_unpacked_tuple_alternative(g):
         return __{base_func.__name__}({find_invocation(base_func)}, __no_unpack_alt__=True)
     except Exception as e:
         gear_inst = module().child[-1]
-        gear_inst.parent.child.remove(gear_inst)
+        gear_inst.parent.remove_child(gear_inst)
         for port in gear_inst.in_ports:
             if port.basename not in gear_inst.const_args:
                 port.producer.consumers.remove(port)
             else:
-                gear_inst.parent.child.remove(get_producer_port(port).gear)
+                gear_inst.parent.remove_child(get_producer_port(port).gear)
         raise e
     '''
 
@@ -6,17 +6,18 @@ from copy import copy
 from pygears.core.graph import get_producer_port
 from pygears.conf import MultiAlternativeError, core_log, reg
 from pygears.typing import Any, cast, get_match_conds
-from pygears.core.util import is_standard_func, get_function_context_dict
+from pygears.core.util import is_standard_func
 
 from .partial import Partial
 from .intf import Intf
-from .infer_ftypes import TypeMatchError, infer_ftypes, type_is_specified
+from .infer_ftypes import InferStats, TypeMatchError, infer_func_params, type_is_specified
 from .gear import TooManyArguments, GearTypeNotSpecified, GearArgsNotSpecified
 from .gear import Gear, create_hier
 from .gear_decorator import GearDecoratorPlugin
 from .gear_memoize import get_memoized_gear, memoize_gear, make_gear_call_hash
 from .port import HDLConsumer, HDLProducer
 from .channel import channel_interfaces
+from .elab_profiler import elab_frame
 
 
 def is_traced(name):
@@ -207,10 +208,10 @@ def gear_signature(func, args, kwds):
     return args, templates
 
 
-def infer_params(args, params, context):
+def infer_params(args, params, func):
     arg_types = {name: arg.dtype for name, arg in args.items()}
 
-    return infer_ftypes(params, arg_types, namespace=context)
+    return infer_func_params(func, params, arg_types)
 
 
 class intf_name_tracer:
@@ -222,6 +223,11 @@ class intf_name_tracer:
         if not self.enabled:
             return
 
+        # Tracing of the gear function calls slows down the instantiation
+        profiler = reg['gear/elab_profiler']
+        if profiler is not None:
+            profiler.stats_for(gear.func).traced += 1
+
         self.code_map = reg['gear/code_map']
         self.gear = gear
 
@@ -366,6 +372,10 @@ def resolve_gear(gear_inst, out_intfs, out_dtype, fix_intfs):
     for intf, port in zip(intfs, gear_inst.out_ports):
         intf.source(port)
 
+    # Output ports reference their interfaces weakly, so the gear keeps them
+    # alive in case they are left unconnected by the caller
+    gear_inst.out_intfs = intfs
+
     if any(not type_is_specified(i.dtype) for i in out_intfs):
         raise GearTypeNotSpecified(f'Output type of the gear "{gear_inst.name}"'
                                    f' could not be resolved, and resulted in "{repr(out_dtype)}"')
@@ -431,7 +441,12 @@ def terminate_internal_intfs(gear_inst):
             i.source(HDLProducer())
 
 
-def gear_base_resolver(func, *args, name=None, intfs=None, **kwds):
+def gear_base_resolver(func, *args, **kwds):
+    with elab_frame(func) as frame:
+        return resolve_gear_inst(frame, func, *args, **kwds)
+
+
+def resolve_gear_inst(frame, func, *args, name=None, intfs=None, **kwds):
     meta_kwds = func.meta_kwds
     name = name or resolve_gear_name(func, meta_kwds['__base__'])
 
@@ -458,23 +473,28 @@ def gear_base_resolver(func, *args, name=None, intfs=None, **kwds):
         fix_intfs = list(intfs)
 
     if reg['gear/memoize']:
+        frame.mark('memo')
         gear_inst, outputs, memo_key = get_memoized_gear(func, args, const_args, kwds, fix_intfs,
                                                          name)
 
         if gear_inst is not None:
+            frame.memo_hit = True
             if len(outputs) == 1:
                 return outputs[0]
             else:
                 return outputs
 
+    frame.mark('infer')
     try:
-        params = infer_params(args, param_templates, context=get_function_context_dict(func))
+        params = infer_params(args, param_templates, func)
     except TypeMatchError as e:
         err = type(e)(f'{str(e)}\n - when instantiating "{name}"')
 
     if err:
         raise err
 
+    frame.mark('body')
+
     if not err:
         if not params.pop('_enablement'):
             err = TypeMatchError(f'Enablement condition failed for "{name}" alternative'
@@ -512,12 +532,12 @@ def gear_base_resolver(func, *args, name=None, intfs=None, **kwds):
 
     if err:
         if hasattr(func, 'alternatives') or hasattr(func, 'alternative_to'):
-            gear_inst.parent.child.remove(gear_inst)
+            gear_inst.parent.remove_child(gear_inst)
             for port in gear_inst.in_ports:
                 if port.basename not in gear_inst.const_args:
                     port.producer.consumers.remove(port)
                 else:
-                    gear_inst.parent.child.remove(get_producer_port(port).gear)
+                    gear_inst.parent.remove_child(get_producer_port(port).gear)
 
         raise err
 
@@ -534,9 +554,18 @@ class GearInstPlugin(GearDecoratorPlugin):
         reg['gear/code_map'] = []
         reg['gear/gear_dflt_resolver'] = gear_base_resolver
         reg.confdef('gear/memoize', False)
+        reg.confdef('gear/infer_memoize',
+                    default=True,
+                    docs='Memoize the parameters inferred for the gear instantiations with the '
+                    'same function, argument types and parameters')
+        reg['gear/infer_memo'] = {}
+        reg['gear/infer_stats'] = InferStats()
+        reg['gear/elab_profiler'] = None
         reg.confdef('gear/infer_signal_names', 'debug')
         reg.confdef('debug/trace', default=[])
 
     @classmethod
     def reset(cls):
         reg['gear/code_map'] = []
+        reg['gear/infer_memo'] = {}
+        reg['gear/infer_stats'] = InferStats()
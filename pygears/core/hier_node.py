@@ -1,14 +1,66 @@
+import inspect
 import string
 from collections import Counter
 
+# Dispatch tables of the hierarchy visitors, keyed by the (visitor class, node
+# class) pairs
+_dispatch_tables = {}
+
+
+def dispatch_table(visitor_cls, node_cls, descend):
+    """Returns the tuple of the visitor methods to be called for the node, in
+    the order of the node class MRO, i.e. the methods named after the classes
+    in the node class MRO. If the last method is ``descend`` (the default
+    visitor ``HierNode`` method), it is replaced by ``None``, signaling that
+    the children should be visited.
+
+    Tables are built on the first visit of the node class by the visitor
+    class, and are cached afterwards.
+    """
+    key = (visitor_cls, node_cls)
+    table = _dispatch_tables.get(key, None)
+    if table is not None:
+        return table
+
+    table = []
+    for base_class in inspect.getmro(node_cls):
+        name = base_class.__name__
+        method = inspect.getattr_static(visitor_cls, name, None)
+        if method is None:
+            continue
+
+        if not inspect.isfunction(method):
+            method = (lambda name: lambda visitor, node: getattr(visitor, name)(node))(name)
+
+        table.append(method)
+
+    if table and table[-1] is descend:
+        table[-1] = None
+
+    table = tuple(table)
+    _dispatch_tables[key] = table
+    return table
+
 
 class HierYielderBase:
     def visit(self, node):
-        import inspect
-        for base_class in inspect.getmro(node.__class__):
-            if hasattr(self, base_class.__name__):
-                if (yield from getattr(self, base_class.__name__)(node)):
-                    return
+        # Children reached via the default HierNode method are visited from
+        # the explicit stack instead of recursively, which keeps the depth of
+        # the generator chain constant for deep hierarchies
+        tables = _dispatch_tables
+        visitor_cls = type(self)
+        stack = [node]
+        while stack:
+            node = stack.pop()
+            table = tables.get((visitor_cls, type(node)), None)
+            if table is None:
+                table = dispatch_table(visitor_cls, type(node), HierYielderBase.HierNode)
+
+            for method in table:
+                if method is None:
+                    stack.extend(reversed(getattr(node, 'child', None) or ()))
+                elif (yield from method(self, node)):
+                    break
 
     def HierNode(self, node):
         if hasattr(node, "child"):
@@ -20,11 +72,23 @@ class HierYielderBase:
 
 class HierVisitorBase:
     def visit(self, node):
-        import inspect
-        for base_class in inspect.getmro(node.__class__):
-            if hasattr(self, base_class.__name__):
-                if getattr(self, base_class.__name__)(node):
-                    return
+        # Children reached via the default HierNode method are visited from
+        # the explicit stack instead of recursively, so that the deep
+        # hierarchies do not hit the recursion limit
+        tables = _dispatch_tables
+        visitor_cls = type(self)
+        stack = [node]
+        while stack:
+            node = stack.pop()
+            table = tables.get((visitor_cls, type(node)), None)
+            if table is None:
+                table = dispatch_table(visitor_cls, type(node), HierVisitorBase.HierNode)
+
+            for method in table:
+                if method is None:
+                    stack.extend(reversed(getattr(node, 'child', None) or ()))
+                elif method(self, node):
+                    break
 
     def HierNode(self, node):
         if hasattr(node, "child"):
@@ -45,6 +109,9 @@ class HierNode:
         self.child.append(module)
         module.parent = self
 
+    def remove_child(self, module):
+        self.child.remove(module)
+
     def clear(self):
         for c in self.child.copy():
             if hasattr(c, 'remove'):
@@ -54,7 +121,7 @@ class HierNode:
 
     def remove(self):
         if self.parent:
-            self.parent.child.remove(self)
+            self.parent.remove_child(self)
 
     def root(self):
         node = self
@@ -64,10 +131,11 @@ class HierNode:
         return node
 
 
-def find_unique_names(names):
-    def get_stem(s):
-        return s.rstrip(string.digits)
+def get_stem(s):
+    return s.rstrip(string.digits)
+
 
+def find_unique_names(names):
     stems = list(map(get_stem, names))
 
     names_cnt = Counter(names)
@@ -99,18 +167,167 @@ def find_unique_names(names):
 
 
 class NamedHierNode(HierNode):
+    """Node of the hierarchy with a name unique among its siblings.
+
+    Full names of the nodes are cached, and each node keeps an index of its
+    children by their names, used both for the path lookups and to uniquely
+    rename the newly added children in time independent of the number of
+    their siblings. Index is invalidated if the children list is changed
+    directly, or a child is renamed, in which case it is rebuilt on the next
+    access.
+    """
     def __init__(self, basename=None, parent=None):
+        self._basename = None
+        self._name = None
+        self._index = None
+        self._index_len = 0
+        self._stems = {}
+        self._stem_next = {}
+        # Names shared by more than one child, of which only the first child
+        # is indexed
+        self._shared = set()
+        self._fixed = False
+
         super().__init__(parent)
         if basename is not None:
-            self.basename = basename
+            self._basename = basename
             if parent:
-                parent.unique_rename()
+                parent._uniquify(self)
+
+    @property
+    def basename(self):
+        return self._basename
+
+    @basename.setter
+    def basename(self, val):
+        self._basename = val
+        self._invalidate_name()
+
+        if isinstance(self.parent, NamedHierNode):
+            self.parent._index = None
+
+    def _invalidate_name(self):
+        # Full names are cached parent first, so the subtree below a node
+        # without the cached name has no cached names either
+        if self._name is None:
+            return
+
+        self._name = None
+        for c in self.child:
+            if isinstance(c, NamedHierNode):
+                c._invalidate_name()
+
+    def add_child(self, module):
+        super().add_child(module)
+        if isinstance(module, NamedHierNode):
+            module._invalidate_name()
+
+    def remove_child(self, module):
+        super().remove_child(module)
+
+        if self._index is None or self._index_len != len(self.child) + 1:
+            self._index = None
+            return
+
+        basename = getattr(module, 'basename', None)
+        if self._index.get(basename, None) is not module or basename in self._shared:
+            self._index = None
+            return
+
+        del self._index[basename]
+        self._index_len -= 1
+
+        if self._fixed:
+            stem = get_stem(basename)
+            self._stems[stem].remove(module)
+            self._stem_next[stem] = 0
+
+    def _reindex(self, fixed):
+        self._index = {}
+        self._stems = {}
+        self._stem_next = {}
+        self._shared = set()
+        self._index_len = len(self.child)
+        self._fixed = fixed
+
+        for c in self.child:
+            basename = getattr(c, 'basename', None)
+            if basename is None:
+                continue
+
+            if basename in self._index:
+                self._shared.add(basename)
+            else:
+                self._index[basename] = c
+
+            if fixed:
+                self._stems.setdefault(get_stem(basename), []).append(c)
+
+    def child_index(self):
+        """Returns the dictionary mapping the names of the children to the
+        children."""
+        if self._index is None or self._index_len != len(self.child):
+            self._reindex(fixed=False)
+
+        return self._index
+
+    def get_child(self, basename, default=None):
+        return self.child_index().get(basename, default)
+
+    def _uniquify(self, node):
+        """Uniquely renames the node, which was just added as the last child.
+        Equivalent to :meth:`unique_rename`, but only considers the siblings
+        whose names have the same stem as the node's name."""
+        if not self._fixed or self._index is None or self._index_len != len(self.child) - 1:
+            self.unique_rename()
+            return
+
+        basename = node._basename
+        stem = get_stem(basename)
+        group = self._stems.setdefault(stem, [])
+
+        self._index_len += 1
+
+        if not group:
+            group.append(node)
+            self._index[basename] = node
+        elif len(group) > 1 and basename != stem and basename not in self._index:
+            # All the names in a group of more than one node are already
+            # unique and different from the stem
+            group.append(node)
+            self._index[basename] = node
+        elif len(group) > 1 and basename == stem:
+            i = self._stem_next.get(stem, 0)
+            while f'{stem}{i}' in self._index:
+                i += 1
+
+            node._basename = f'{stem}{i}'
+            self._stem_next[stem] = i + 1
+            group.append(node)
+            self._index[node._basename] = node
+        else:
+            for c in group:
+                self._index.pop(c._basename, None)
+
+            group.append(node)
+            for child, new_name in zip(group, find_unique_names([c._basename for c in group])):
+                if new_name:
+                    child._basename = new_name
+                    child._invalidate_name()
+
+            for c in group:
+                self._index[c._basename] = c
+
+            self._stem_next[stem] = 0
 
     def unique_rename(self):
         child_names = [c.basename for c in self.child]
         for child, new_name in zip(self.child, find_unique_names(child_names)):
             if new_name:
-                child.basename = new_name
+                child._basename = new_name
+                child._invalidate_name()
+
+        self._reindex(fixed=True)
 
     def __contains__(self, path):
         try:
@@ -128,10 +345,8 @@ class NamedHierNode(HierNode):
 
         part, multi, rest = path.partition("/")
 
-        for child in self.child:
-            if child.basename == part:
-                break
-        else:
+        child = self.child_index().get(part, None)
+        if child is None:
             raise KeyError()
 
         if not multi:
@@ -141,10 +356,16 @@ class NamedHierNode(HierNode):
 
     @property
     def name(self):
-        if self.parent:
-            return '/'.join([self.parent.name, self.basename])
-        else:
-            return self.basename
+        name = self._name
+        if name is None:
+            if self.parent:
+                name = '/'.join([self.parent.name, self.basename])
+            else:
+                name = self.basename
+
+            self._name = name
+
+        return name
 
     def has_descendent(self, node):
         if not self.name or node.name == self.name:
@@ -155,5 +376,5 @@ class NamedHierNode(HierNode):
 
         # make sure that the node is an actual descendent
         # not a different gear with the same prefix in its name
-        child_part = node.name.split(self.name, 1)[1]
+        child_part = node.name[len(self.name):]
         return child_part.startswith(('/', '.'))
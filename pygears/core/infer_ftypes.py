@@ -1,10 +1,15 @@
 import collections
+import functools
+import types
+from time import perf_counter_ns
 
 from pygears.conf import reg
-from pygears.typing.base import GenericMeta, param_subs, is_type
+from pygears.typing.base import GenericMeta, compile_param, param_subs, is_type
 
 from pygears.typing import TypeMatchError, get_match_conds
 
+from .util import get_function_context_dict
+
 
 def is_type_iterable(t):
     return (not isinstance(t, (str, bytes))) and isinstance(t, collections.abc.Iterable)
@@ -53,7 +58,7 @@ def resolve_param(val, match, namespace):
             return True, new_p
 
     elif isinstance(val, bytes):
-        return True, eval(val, namespace, match)
+        return True, eval(compile_param(val), namespace, match)
 
     return False, None
 
@@ -174,3 +179,182 @@ def infer_ftypes(params, args, namespace={}):
         raise err
 
     return match
+
+
+class InferStats:
+    """Statistics of the parameter inference, accumulated since the last
+    registry reset."""
+
+    __slots__ = ('hits', 'misses', 'uncached', 'time_ns')
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self.uncached = 0
+        self.time_ns = 0
+
+    @property
+    def calls(self):
+        return self.hits + self.misses + self.uncached
+
+    @property
+    def hit_rate(self):
+        return self.hits / self.calls if self.calls else 0.0
+
+    def todict(self):
+        return {
+            'calls': self.calls,
+            'hits': self.hits,
+            'misses': self.misses,
+            'uncached': self.uncached,
+            'hit_rate': self.hit_rate,
+            'time_ns': self.time_ns
+        }
+
+    def __str__(self):
+        return (f'Parameter inference: {self.calls} calls, {self.hit_rate:.1%} memo hits, '
+                f'{self.uncached} uncached, {self.time_ns / 1e9:.3f}s')
+
+
+def _memo_item(val):
+    if is_type(val):
+        # Equal types are not necessarily the same, i.e. Bool and Uint[1], so
+        # the types are compared by identity. Type classes are cached on
+        # creation, and the key holds the reference, so the id is not reused
+        return (id(val), val)
+
+    if type(val) in (tuple, list):
+        return (type(val), tuple(_memo_item(v) for v in val))
+
+    if type(val) is dict:
+        return (dict, tuple((k, _memo_item(v)) for k, v in val.items()))
+
+    # Raises TypeError for the unhashable values. Type is needed to
+    # differentiate between the equal values, i.e. 1, 1.0 and True, and it is
+    # compared by identity for the same reason as the types above, i.e. for
+    # Bool(1) and Uint[1](1)
+    hash(val)
+    return (id(type(val)), type(val), val)
+
+
+def _memo_cell(cell):
+    try:
+        return _memo_item(cell.cell_contents)
+    except ValueError:
+        # Cell is empty
+        return None
+
+
+@functools.lru_cache(maxsize=None)
+def template_names(expr):
+    """Returns the names referenced by the template parameter expression."""
+    if expr.isidentifier():
+        return (expr, )
+
+    try:
+        code = compile_param(expr)
+    except SyntaxError:
+        return ()
+
+    names = []
+
+    def collect(code):
+        names.extend(code.co_names)
+        for c in code.co_consts:
+            if isinstance(c, types.CodeType):
+                collect(c)
+
+    collect(code)
+    return tuple(names)
+
+
+def _template_names(val, names):
+    if isinstance(val, bytes):
+        names.update(template_names(val.decode()))
+    elif isinstance(val, str):
+        names.update(template_names(val))
+    elif isinstance(val, GenericMeta):
+        if not val.specified:
+            for a in val.args:
+                _template_names(a, names)
+    elif type(val) in (tuple, list):
+        for v in val:
+            _template_names(v, names)
+    elif type(val) is dict:
+        for v in val.values():
+            _template_names(v, names)
+
+
+def _memo_globals(func, params):
+    """Returns the key items for the module globals that the templates in
+    the ``params`` might be evaluated against."""
+    names = set()
+    for val in params.values():
+        _template_names(val, names)
+
+    res = []
+    for name in sorted(names):
+        if name not in func.__globals__:
+            continue
+
+        val = func.__globals__[name]
+        if isinstance(val, types.ModuleType):
+            # Templates might read any of the module attributes
+            raise TypeError(f'module "{name}" referenced from the template')
+
+        res.append((name, _memo_item(val)))
+
+    return tuple(res)
+
+
+def infer_memo_key(func, params, args):
+    """Returns the key under which the parameters inferred for the ``func``
+    are memoized, or ``None`` if some of the values are not hashable."""
+    try:
+        return (func, tuple(_memo_cell(c) for c in func.__closure__ or ()),
+                _memo_globals(func, params),
+                tuple((name, _memo_item(val)) for name, val in params.items()),
+                tuple((name, _memo_item(val)) for name, val in args.items()))
+    except TypeError:
+        return None
+
+
+def infer_func_params(func, params, args):
+    """Infers the parameters of the gear function ``func`` via
+    :func:`infer_ftypes`, in the context of the function.
+
+    The inferred parameters are memoized, so that the instantiations of the
+    same function with the same argument types and parameters skip the
+    inference. Failed inferences are not memoized.
+    """
+    stats = reg['gear/infer_stats']
+    memo = reg['gear/infer_memo']
+
+    start = perf_counter_ns()
+    try:
+        key = infer_memo_key(func, params, args) if reg['gear/infer_memoize'] else None
+
+        if key is None:
+            stats.uncached += 1
+        elif key in memo:
+            stats.hits += 1
+            res, passed = memo[key]
+            res = dict(res)
+            # Parameters that were not inferred are passed as they are, so
+            # that the instance gets its own (possibly mutable) objects
+            for name in passed:
+                res[name] = params[name]
+
+            return res
+        else:
+            stats.misses += 1
+
+        res = infer_ftypes(params, args, namespace=get_function_context_dict(func))
+
+        if key is not None:
+            passed = [name for name, val in params.items() if res.get(name) is val]
+            memo[key] = (dict(res), passed)
+
+        return res
+    finally:
+        stats.time_ns += perf_counter_ns() - start
@@ -1,5 +1,3 @@
-import asyncio
-
 from .graph import get_consumer_tree, get_producer_queue, get_end_producer
 from pygears import GearDone
 from pygears.conf import PluginBase, reg, MultiAlternativeError
@@ -11,10 +9,26 @@ from pygears.typing import typeof, Any
 from pygears.typing.base import TypingMeta
 from pygears.conf import inject, Inject
 from .graph import get_sim_map_gear
+from .sim_channel import HandshakeChannel, TLMChannel
 
 gear_reg = {}
 
 
+def is_python_sim_port(port):
+    """Checks whether the port belongs to a gear simulated by a pure Python
+    :class:`SimGear`, as opposed to a cosimulated module or its port."""
+    from pygears.sim.sim_gear import SimGear
+
+    if not isinstance(port, (InPort, OutPort)):
+        return False
+
+    sim_map = reg['sim/map']
+    if port in sim_map:
+        return False
+
+    return type(sim_map.get(port.gear, None)) is SimGear
+
+
 def operator_func_from_namespace(cls, name):
     def wrapper(self, *args, **kwargs):
         if name not in reg['gear/intf_oper']:
@@ -193,13 +207,23 @@ class Intf:
         if self._out_queues:
             return self._out_queues
 
-        self._out_queues = [
-            asyncio.Queue(maxsize=1, loop=reg['sim/simulator']) for _ in self.end_consumers
-        ]
+        loop = reg['sim/simulator']
+
+        # Data is put to the interface from the gear body, which is connected
+        # to the gear output port
+        prod_port = self.producer
+        if isinstance(prod_port, HDLProducer) and self.consumers:
+            prod_port = self.consumers[0]
+
+        tlm = reg['sim/tlm'] and is_python_sim_port(prod_port)
+
+        for i, c in enumerate(self.end_consumers):
+            if tlm and is_python_sim_port(c):
+                q = TLMChannel(self, i, loop, depth=reg['sim/tlm_depth'])
+            else:
+                q = HandshakeChannel(self, i, loop)
 
-        for i, q in enumerate(self._out_queues):
-            q.intf = self
-            q.index = i
+            self._out_queues.append(q)
 
         return self._out_queues
 
@@ -241,7 +265,7 @@ class Intf:
 
     def ready_nb(self):
         for q in self.out_queues:
-            if q._unfinished_tasks:
+            if not q.ready_nb():
                 return False
 
         return True
@@ -275,9 +299,7 @@ class Intf:
         self._done = True
 
         for q, c in zip(self.out_queues, self.end_consumers):
-            c.finish()
-            for task in q._getters:
-                task.cancel()
+            q.close(c.finish)
 
     @property
     def done(self):
@@ -328,7 +350,7 @@ class Intf:
             return self._data
 
     def ack(self):
-        if not self.in_queue._unfinished_tasks:
+        if not self.in_queue.pending():
             return
 
         e = self.events['ack']
@@ -0,0 +1,243 @@
+import asyncio
+from collections import deque
+
+
+class HandshakeChannel:
+    """Single slot channel which implements the handshake between the
+    interface producer and one of its end consumers.
+
+    Producer puts the data with :meth:`put_nowait` and awaits :meth:`join`
+    until the consumer acknowledges the data with :meth:`task_done`. Consumer
+    waits for the data with :meth:`get`. At most one future is allocated per
+    wait, and only if the wait is actually needed.
+    """
+
+    __slots__ = ('intf', 'index', '_loop', '_item', '_full', '_unfinished', '_getter', '_waiter')
+
+    def __init__(self, intf, index, loop):
+        self.intf = intf
+        self.index = index
+        self._loop = loop
+        self._item = None
+        self._full = False
+        self._unfinished = 0
+        self._getter = None
+        self._waiter = None
+
+    def qsize(self):
+        return int(self._full)
+
+    def empty(self):
+        return not self._full
+
+    def full(self):
+        return self._full
+
+    def ready_nb(self):
+        """Returns ``True`` if the producer is free to put new data."""
+        return not self._unfinished
+
+    def pending(self):
+        """Returns ``True`` if there is data that has not been acknowledged."""
+        return self._unfinished > 0
+
+    def put_nowait(self, item):
+        if self._full:
+            raise asyncio.QueueFull
+
+        self._item = item
+        self._full = True
+        self._unfinished += 1
+
+        getter = self._getter
+        if getter is not None:
+            self._getter = None
+            if not getter.done():
+                getter.set_result(None)
+
+    def get_nowait(self):
+        if not self._full:
+            raise asyncio.QueueEmpty
+
+        item = self._item
+        self._item = None
+        self._full = False
+        return item
+
+    async def get(self):
+        while not self._full:
+            if self._getter is None:
+                self._getter = self._loop.create_future()
+
+            getter = self._getter
+            try:
+                await getter
+            except BaseException:
+                getter.cancel()
+                if self._getter is getter:
+                    self._getter = None
+
+                raise
+
+        return self.get_nowait()
+
+    def task_done(self):
+        if self._unfinished <= 0:
+            raise ValueError('task_done() called too many times')
+
+        self._unfinished -= 1
+
+        if not self._unfinished:
+            waiter = self._waiter
+            if waiter is not None:
+                self._waiter = None
+                if not waiter.done():
+                    waiter.set_result(None)
+
+    async def join(self):
+        """Waits until the consumer acknowledges all the data."""
+        while self._unfinished:
+            if self._waiter is None:
+                self._waiter = self._loop.create_future()
+
+            waiter = self._waiter
+            try:
+                await waiter
+            except BaseException:
+                if self._waiter is waiter:
+                    self._waiter = None
+
+                raise
+
+    def cancel(self):
+        """Cancels the consumer waiting for the data."""
+        getter = self._getter
+        if getter is not None:
+            self._getter = None
+            getter.cancel()
+
+    def close(self, finish):
+        """Called when the producer is done. Finishes the consumer by calling
+        ``finish`` and cancels its wait for the data."""
+        finish()
+        self.cancel()
+
+
+class TLMChannel:
+    """Buffered channel for the untimed (TLM) simulation mode.
+
+    Unlike the :class:`HandshakeChannel`, producer is allowed to put up to
+    ``depth`` data items before it needs to wait for the consumer to
+    acknowledge them. This allows the pure Python gears to pass the data in
+    bursts within a single simulation timestep, without a handshake (and a
+    future allocation) per transferred item. Timing of the simulation is thus
+    not cycle accurate, but the order of the data is preserved.
+    """
+
+    __slots__ = ('intf', 'index', 'depth', '_loop', '_items', '_unfinished', '_getter', '_waiter',
+                 '_finish')
+
+    def __init__(self, intf, index, loop, depth):
+        self.intf = intf
+        self.index = index
+        self.depth = depth
+        self._loop = loop
+        self._items = deque()
+        self._unfinished = 0
+        self._getter = None
+        self._waiter = None
+        self._finish = None
+
+    def qsize(self):
+        return len(self._items)
+
+    def empty(self):
+        return not self._items
+
+    def full(self):
+        return self._unfinished >= self.depth
+
+    def ready_nb(self):
+        return self._unfinished < self.depth
+
+    def pending(self):
+        return self._unfinished > 0
+
+    @staticmethod
+    def _wakeup(fut):
+        if fut is not None and not fut.done():
+            fut.set_result(None)
+
+    def put_nowait(self, item):
+        if self._unfinished >= self.depth:
+            raise asyncio.QueueFull
+
+        self._items.append(item)
+        self._unfinished += 1
+
+        getter = self._getter
+        if getter is not None:
+            self._getter = None
+            self._wakeup(getter)
+
+    def get_nowait(self):
+        if not self._items:
+            raise asyncio.QueueEmpty
+
+        return self._items.popleft()
+
+    async def get(self):
+        while not self._items:
+            getter = self._getter = self._loop.create_future()
+            try:
+                await getter
+            except BaseException:
+                getter.cancel()
+                if self._getter is getter:
+                    self._getter = None
+
+                raise
+
+        return self._items.popleft()
+
+    def task_done(self):
+        if self._unfinished <= 0:
+            raise ValueError('task_done() called too many times')
+
+        self._unfinished -= 1
+
+        if self._finish is not None and not self._unfinished:
+            self.close(self._finish)
+
+        waiter = self._waiter
+        if waiter is not None:
+            self._waiter = None
+            self._wakeup(waiter)
+
+    async def join(self):
+        """Waits until the producer is free to put new data."""
+        while self._unfinished >= self.depth:
+            waiter = self._waiter = self._loop.create_future()
+            try:
+                await waiter
+            except BaseException:
+                if self._waiter is waiter:
+                    self._waiter = None
+
+                raise
+
+    def cancel(self):
+        getter = self._getter
+        if getter is not None:
+            self._getter = None
+            getter.cancel()
+
+    def close(self, finish):
+        """Called when the producer is done. Consumer is finished only after
+        it has acknowledged all the buffered data."""
+        if self._unfinished:
+            self._finish = finish
+        else:
+            self._finish = None
+            finish()
+            self.cancel()
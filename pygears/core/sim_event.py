@@ -27,7 +27,9 @@ class SimEvent(list):
 
         expired = []
 
-        for i, f in enumerate(self):
+        # Iterate over a copy, since callbacks may register or remove other
+        # callbacks (i.e. when a SimExtend is (de)activated)
+        for f in tuple(self):
             # If additional callback arguments are passed
             if isinstance(f, tuple):
                 func = f[0]
@@ -39,11 +41,14 @@ class SimEvent(list):
 
             # If callback should not be re-registered
             if not ret:
-                expired.append(i)
+                expired.append(f)
 
         # Delete from the list all callback that returned false
-        for e in reversed(expired):
-            del self[e]
+        for f in expired:
+            try:
+                self.remove(f)
+            except ValueError:
+                pass
 
     def __repr__(self):
         return "Event(%s)" % list.__repr__(self)
@@ -98,6 +98,10 @@ class HDLPlugin(GearPlugin):
         reg.confdef('hdl/lang', default='sv')
         reg.confdef('hdl/toplang', default=None)
         reg['hdl/top'] = None
+        reg.confdef('hdl/dedup',
+                    default=False,
+                    docs='Generate a single HDL module for all structurally identical gear '
+                    'instances')
 
         reg.confdef('debug/hide_interm_vals', default=True)
 
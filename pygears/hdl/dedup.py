@@ -0,0 +1,118 @@
+"""Deduplication of the structurally identical gear instances for the HDL
+generation.
+
+By default, each gear instance gets its own HDL module named after its path in
+the hierarchy. Designs with many replicated lanes thus end up with many
+identical modules, which only differ in their names. When ``hdl/dedup`` is
+enabled (or ``dedup=True`` is passed to :func:`hdlgen`), a structural hash is
+computed for each gear subtree, and only the first instance of each structure
+gets its module generated, while all other instances instantiate that same
+module.
+
+Structural hash of a compiled or templated gear covers its definition,
+parameters, port names, types and connectedness, signals and HDL
+configuration. Structural hash of a hierarchical gear covers its ports,
+signals and HDL configuration, together with the instances of its children
+and the interfaces connecting them, so two hierarchical gears are the same
+only if their children are. Gears that reference objects without a stable
+textual representation are never deduplicated.
+"""
+
+from pygears import reg
+from pygears.core.hier_node import HierVisitorBase
+from pygears.hdl import hdl_log, mod_lang
+from pygears.hls.cache import Fingerprint, Uncacheable
+
+# Parameters that are specific to the instance, and do not influence the
+# contents of its module
+INSTANCE_PARAMS = ('name', 'intfs', 'sigmap', 'memoized')
+
+
+def structural_key(hmod, template_env):
+    """Returns the structural hash of the gear instance, or ``None`` if the
+    instance cannot be deduplicated."""
+    from .sv.resolvers import HLSResolver, HDLTemplateResolver, HierarchicalResolver
+    from .sv.svmod import SVModuleInst
+
+    node = hmod.node
+    resolver = hmod.resolver
+
+    # Custom module generators may generate additional per instance modules
+    if type(hmod) is not SVModuleInst:
+        return None
+
+    if not isinstance(resolver, (HLSResolver, HDLTemplateResolver, HierarchicalResolver)):
+        return None
+
+    fp = Fingerprint()
+    fp.text(type(resolver).__name__)
+    fp.text(hmod.lang)
+    fp.text(mod_lang(node.parent))
+
+    try:
+        fp.obj(hmod.traced)
+        fp.obj(resolver.cfg)
+        fp.obj(node.meta_kwds['signals'])
+
+        for p in node.in_ports + node.out_ports:
+            fp.obj((p.basename, p.dtype, p.consumer is not None))
+
+        if isinstance(resolver, HierarchicalResolver):
+            fp.obj(resolver.module_insts(template_env))
+        else:
+            fp.obj(node.func)
+            fp.obj({k: v for k, v in node.params.items() if k not in INSTANCE_PARAMS})
+    except Uncacheable:
+        return None
+
+    return fp.hexdigest()
+
+
+class HDLDedupVisitor(HierVisitorBase):
+    def __init__(self, top):
+        self.top = top
+        self.modules = {}
+        self.hdlgen_map = reg['hdlgen/map']
+
+    def Gear(self, node):
+        # Children are deduplicated first, so that the hierarchical modules
+        # are compared with the module names their children will actually
+        # instantiate
+        for c in list(node.child):
+            self.visit(c)
+
+        if node is self.top or 'memoized' in node.params:
+            return True
+
+        hmod = self.hdlgen_map.get(node, None)
+        if hmod is None:
+            return True
+
+        key = structural_key(hmod, reg[f'{hmod.lang}gen/templenv'])
+        if key is None:
+            return True
+
+        if key in self.modules:
+            hmod.reuse(self.modules[key])
+        else:
+            self.modules[key] = hmod
+
+        return True
+
+
+def hdl_dedup(top):
+    """Makes the structurally identical gear instances inside the ``top``
+    share a single HDL module."""
+    from .sv.svmod import SVModuleInst
+
+    # Both SystemVerilog and Verilog generation use the SVModuleInst, but
+    # other module generators are not supported
+    hmod = reg['hdlgen/map'].get(top, None)
+    if hmod is not None and not isinstance(hmod, SVModuleInst):
+        hdl_log().warning(
+            f'HDL deduplication is not supported for the "{hmod.lang}" modules, '
+            f'generating all modules of "{top.name}"')
+        return
+
+    v = HDLDedupVisitor(top)
+    v.visit(top)
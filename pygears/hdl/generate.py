@@ -1,5 +1,8 @@
+import multiprocessing
 import os
+import types
 from pygears.core.hier_node import HierVisitorBase
+from pygears.core.partial import Partial
 from pygears.util.fileio import save_file
 from pygears import reg
 from pygears.hdl import mod_lang
@@ -20,7 +23,134 @@ class HDLGenGenerateVisitor(HierVisitorBase):
             hdlgen.generate(self.templenv[lang], self.outdir)
 
 
+def calls_gears(gear):
+    """Checks whether the gear function might call other gears, which are
+    instantiated as submodules during its compilation. Functions the gear
+    function references are checked as well, since their calls are inlined."""
+    seen = {}
+
+    def check_code(code, namespace):
+        for c in code.co_consts:
+            if isinstance(c, types.CodeType) and check_code(c, namespace):
+                return True
+
+        for name in code.co_names:
+            if name in namespace and check_obj(namespace[name], code.co_names):
+                return True
+
+        return False
+
+    def check_obj(obj, names=()):
+        if isinstance(obj, Partial):
+            return True
+
+        # Modules are checked once for each set of the attribute names
+        key = (id(obj), names) if isinstance(obj, types.ModuleType) else id(obj)
+        if key in seen:
+            return False
+
+        # Objects are kept so that their ids are not reused while checking
+        seen[key] = obj
+
+        if isinstance(obj, types.FunctionType):
+            cells = []
+            for cell in obj.__closure__ or ():
+                try:
+                    cells.append(cell.cell_contents)
+                except ValueError:
+                    pass
+
+            return (check_code(obj.__code__, obj.__globals__)
+                    or check_obj((obj.__defaults__, obj.__kwdefaults__, cells)))
+        elif isinstance(obj, types.ModuleType):
+            # Only the attributes named in the code can be accessed
+            attrs = vars(obj)
+            return any(check_obj(attrs[n], names) for n in names if n in attrs)
+        elif isinstance(obj, (list, tuple)):
+            return any(check_obj(o) for o in obj)
+        elif isinstance(obj, dict):
+            return any(check_obj(o) for o in obj.values())
+
+        return False
+
+    return check_obj(gear.func) or check_obj(gear.params)
+
+
+class HDLGenCompiledVisitor(HDLGenGenerateVisitor):
+    """Collects the gears that will be compiled by the HLS during the
+    generation, in the order of the generation. Gears that call other gears
+    are left out, since their compilation instantiates submodules, which
+    needs to happen in the main process."""
+    def __init__(self, outdir):
+        super().__init__(outdir)
+        self.compiled = []
+
+    def Gear(self, node):
+        from .sv.resolvers.hls import HLSResolver
+
+        hdlgen = self.hdlgen_map.get(node, None)
+        if (hdlgen is not None and 'memoized' not in node.params and not hdlgen.reused
+                and isinstance(hdlgen.resolver, HLSResolver) and not calls_gears(node)):
+            self.compiled.append((node, self.templenv[mod_lang(node)]))
+
+
+# Gears compiled by the worker processes. Workers are forked, so they inherit
+# the list together with the whole design
+_precompile_jobs = []
+
+
+def _precompile(index):
+    from .sv.svcompile import compile_gear_body
+
+    node, templenv, outdir = _precompile_jobs[index]
+    try:
+        contents, subsvmods = compile_gear_body(node, outdir, templenv)
+    except Exception:
+        # Errors are reported once the gear is compiled again in the main
+        # process
+        return None
+
+    # Submodules are instantiated during the compilation, which needs to
+    # happen in the main process
+    return None if subsvmods else contents
+
+
+def precompile(top, outdir, jobs):
+    """Compiles the HLS gears of the design in ``jobs`` worker processes. Code
+    is stored in the ``hdlgen/precompiled`` registry, from where it is picked
+    up when the gears are generated."""
+    global _precompile_jobs
+
+    v = HDLGenCompiledVisitor(outdir)
+    v.visit(top)
+
+    if len(v.compiled) < 2:
+        return
+
+    _precompile_jobs = [(node, templenv, outdir) for node, templenv in v.compiled]
+
+    try:
+        ctx = multiprocessing.get_context('fork')
+        with ctx.Pool(min(jobs, len(v.compiled))) as pool:
+            res = pool.map(_precompile, range(len(_precompile_jobs)))
+    finally:
+        _precompile_jobs = []
+
+    precompiled = reg['hdlgen/precompiled']
+    for (node, _), contents in zip(v.compiled, res):
+        if contents is not None:
+            precompiled[node] = contents
+
+
 def generate(top, conf):
+    jobs = conf.get('jobs', 1)
+    if jobs is None:
+        jobs = os.cpu_count()
+
+    # Worker processes need to be forked in order to inherit the design
+    if jobs > 1 and 'fork' in multiprocessing.get_all_start_methods():
+        precompile(top, conf['outdir'], jobs)
+
     v = HDLGenGenerateVisitor(conf['outdir'])
     v.visit(top)
     return top
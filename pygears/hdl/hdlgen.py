@@ -12,6 +12,7 @@ def hdlgen(top=None,
            copy_files=False,
            generate=True,
            outdir=None,
+           jobs=1,
            **conf):
 
     if lang is None:
@@ -25,6 +26,10 @@ def hdlgen(top=None,
 
     conf['outdir'] = expand(outdir)
 
+    # Number of processes in which the HLS gears are compiled, or None for
+    # the number of CPUs
+    conf['jobs'] = jobs
+
     if isinstance(top, tuple):
         top = top[0]
 
@@ -35,6 +35,10 @@ class HDLModuleInst:
 
         self.lang = lang
 
+        # Set if the module generated for another, structurally identical,
+        # instance is reused for this one
+        self.reused = False
+
         self._impl_parse = None
         if 'memoized' in self.node.params:
             memnode = self.node.params['memoized']
@@ -72,6 +76,12 @@ class HDLModuleInst:
                 f'"{resolver.module_name}" found on the path. Module connected as a black-box.')
             return resolver
 
+    def reuse(self, hdlmod):
+        """Makes this instance use the HDL module generated for the ``hdlmod``
+        instead of generating its own."""
+        self.resolver = hdlmod.resolver
+        self.reused = True
+
     @property
     def _basename(self):
         return self.basename
@@ -152,7 +162,7 @@ class HDLModuleInst:
         return self.resolver.params
 
     def generate(self, template_env, outdir):
-        if 'memoized' not in self.node.params:
+        if 'memoized' not in self.node.params and not self.reused:
             self.resolver.generate(template_env, outdir)
 
             if not self.node.parent:
@@ -9,6 +9,7 @@ from .intf import SVIntfGen
 from pygears.definitions import LIB_SVLIB_DIR, USER_SVLIB_DIR, USER_VLIB_DIR, LIB_VLIB_DIR
 from pygears.conf import inject, Inject
 from pygears.hdl import hdlmod, list_hdl_files
+from pygears.hdl.dedup import hdl_dedup
 
 
 class SVGenInstVisitor(HierVisitorBase):
@@ -27,6 +28,9 @@ def svgen_inst(top, conf):
     v = SVGenInstVisitor()
     v.visit(top)
 
+    if conf.get('dedup', reg['hdl/dedup']):
+        hdl_dedup(top)
+
     list_hdl_files(top.name,
                    outdir=conf['outdir'],
                    rtl_only=True,
@@ -56,6 +60,7 @@ class SVGenInstPlugin(PluginBase):
         reg['hdlgen/map'] = {}
         reg['hdlgen/hdlmods'] = {}
         reg['hdlgen/disambig'] = {}
+        reg['hdlgen/precompiled'] = {}
         register_custom_log('svgen', logging.WARNING)
         reg.confdef('svgen/include', getter=svgen_include_get)
         reg.confdef('vhdgen/include', [])
@@ -69,3 +74,4 @@ class SVGenInstPlugin(PluginBase):
         reg['vgen/map'] = {}
         reg['hdlgen/hdlmods'] = {}
         reg['hdlgen/disambig'] = {}
+        reg['hdlgen/precompiled'] = {}
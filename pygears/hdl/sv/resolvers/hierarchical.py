@@ -71,30 +71,38 @@ class HierarchicalResolver(ResolverBase):
     def params(self):
         return {}
 
-    def get_hier_module(self, template_env):
-        context = self.module_context(template_env)
+    def module_insts(self, template_env):
+        """Returns the declarations and the instances of the local interfaces
+        and the child modules, that form the body of the module."""
+        insts = []
 
         for child in self.node.local_intfs:
             hmod = hdlmod(child)
             contents = hmod.get_inst(template_env)
             if contents:
-                context['inst'].append(contents)
+                insts.append(contents)
 
         for child in self.node.child:
             for s in child.meta_kwds['signals']:
                 if isinstance(s, OutSig):
                     name = child.params['sigmap'][s.name]
-                    context['inst'].append(f'logic [{s.width-1}:0] {name};')
+                    insts.append(f'logic [{s.width-1}:0] {name};')
 
             hmod = hdlmod(child)
             if hasattr(hmod, 'get_inst'):
                 contents = hmod.get_inst(template_env)
                 if contents:
                     if hmod.traced:
-                        context['inst'].append('/*verilator tracing_on*/')
-                    context['inst'].append(contents)
+                        insts.append('/*verilator tracing_on*/')
+                    insts.append(contents)
                     if hmod.traced:
-                        context['inst'].append('/*verilator tracing_off*/')
+                        insts.append('/*verilator tracing_off*/')
+
+        return insts
+
+    def get_hier_module(self, template_env):
+        context = self.module_context(template_env)
+        context['inst'] = self.module_insts(template_env)
 
         return template_env.render_local(__file__, "hier_module.j2", context)
 
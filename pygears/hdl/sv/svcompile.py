@@ -667,6 +667,18 @@ def vrewrite(ctx, body):
 
 
 def compile_gear_body(gear, outdir, template_env):
+    contents = reg['hdlgen/precompiled'].pop(gear, None)
+    if contents is not None:
+        return contents, []
+
+    from pygears.hls.cache import cache_key, cache_fetch, cache_store
+
+    key = cache_key(gear, template_env.lang)
+    if key is not None:
+        contents = cache_fetch(key)
+        if contents is not None:
+            return contents, []
+
     # ctx, hdl_ast = parse_gear_body(gear)
     from pygears.hls.translate import translate_gear
     ctx, hdl_ast = translate_gear(gear)
@@ -698,7 +710,14 @@ def compile_gear_body(gear, outdir, template_env):
                  template_env,
                  config=gear.meta_kwds.get('hdl', {}))
 
-    return '\n'.join(writer.lines), subsvmods
+    contents = '\n'.join(writer.lines)
+
+    # Submodules are instantiated during the translation, so the gears that
+    # have them need to be translated each time
+    if key is not None and not subsvmods:
+        cache_store(key, contents)
+
+    return contents, subsvmods
 
 
 def compile_gear(gear, template_env, module_name, outdir, comment=None, attrib=None):
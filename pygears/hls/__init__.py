@@ -3,5 +3,6 @@ from .ast.visitor import Context, GearContext, FuncContext, HLSSyntaxError
 from .ir_utils import Scope, HDLVisitor, is_intf_id
 
 from . import ir_builtins
+from . import cache
 
 __all__ = ['Context', 'GearContext', 'FuncContext', 'Scope', 'HDLVisitor', 'ir', 'SyntaxError']
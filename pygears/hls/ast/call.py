@@ -15,7 +15,7 @@ from pygears.typing import is_type, typeof, Tuple, Array
 from pygears.typing import cast, floor
 from pygears.typing.queue import QueueMeta
 
-from pygears.core.gear_inst import gear_signature, infer_params, get_function_context_dict, TypeMatchError, TooManyArguments, GearArgsNotSpecified
+from pygears.core.gear_inst import gear_signature, infer_params, TypeMatchError, TooManyArguments, GearArgsNotSpecified
 
 
 def parse_func_args(args, kwds, ctx):
@@ -76,7 +76,7 @@ def resolve_gear_alternative(func, args, kwds):
     errors = []
     for f, args, templates in get_gear_signatures(func, args, kwds):
         try:
-            params = infer_params(args, templates, get_function_context_dict(f))
+            params = infer_params(args, templates, f)
         except TypeMatchError:
             errors.append((f, *sys.exc_info()))
         else:
@@ -0,0 +1,256 @@
+"""Persistent on-disk cache of the HDL code compiled from the gear functions.
+
+Translating a gear function to HDL runs the whole HLS pipeline, which is by
+far the slowest part of the HDL generation. When the ``hls/cache_dir``
+directory is configured (the cache is disabled by default), compiled code is
+stored there, under the key computed from everything the compilation depends
+on:
+
+- code of the gear function, together with the code and values of the
+  globals and closure variables it references (recursively, while the code
+  of the PyGears functions is covered by the digest of the PyGears sources),
+- objects the code reaches through the attributes of the modules it
+  references,
+- gear parameters, port names, types and connectedness,
+- HDL configuration of the gear and the target HDL language,
+- PyGears version and the sources of the PyGears package itself.
+
+Gears whose compilation instantiates submodules are not cached, since the
+submodules are created as a side effect of the compilation. Neither are the
+gears that reference objects other than the functions, types, plain values
+and containers of these, since the textual representation of other objects
+need not reflect their state.
+"""
+
+import dataclasses
+import enum
+import functools
+import hashlib
+import os
+import sys
+import types
+
+from pygears import reg
+from pygears.conf import PluginBase
+from pygears.core.partial import Partial
+from pygears.definitions import ROOT_DIR
+from pygears.typing import is_type
+
+# Types of the values whose repr() fully reflects their state
+STABLE_REPR_TYPES = (type(None), bool, int, float, complex, str, bytes)
+
+
+class Uncacheable(Exception):
+    pass
+
+
+def is_pygears_module(name):
+    return bool(name) and name.split('.')[0] == 'pygears'
+
+
+@functools.lru_cache(maxsize=None)
+def pygears_digest():
+    """Returns the digest of the PyGears sources, so that the cache is
+    invalidated whenever PyGears changes."""
+    import pygears
+
+    h = hashlib.sha256(str(pygears.__version__).encode())
+    for root, dirs, files in os.walk(ROOT_DIR):
+        dirs.sort()
+        for fn in sorted(files):
+            if os.path.splitext(fn)[1] in ('.py', '.j2'):
+                with open(os.path.join(root, fn), 'rb') as f:
+                    h.update(hashlib.sha256(f.read()).digest())
+
+    return h.hexdigest()
+
+
+class Fingerprint:
+    def __init__(self):
+        self.h = hashlib.sha256()
+        self.seen = set()
+
+    def text(self, s):
+        self.h.update(s.encode())
+        self.h.update(b'\0')
+
+    def code(self, code, namespace):
+        self.text(code.co_name)
+        self.h.update(code.co_code)
+        for c in code.co_consts:
+            if isinstance(c, types.CodeType):
+                self.code(c, namespace)
+            else:
+                self.text(repr(c))
+
+        for name in code.co_names:
+            self.text(name)
+            if name in namespace:
+                obj = namespace[name]
+            else:
+                # Modules imported inside the function
+                obj = sys.modules.get(name, None)
+                if obj is None:
+                    continue
+
+            if isinstance(obj, types.ModuleType):
+                self.module(obj, code.co_names)
+            else:
+                self.obj(obj)
+
+    def module(self, mod, names):
+        """Fingerprints the attributes of the module that the code might
+        access, i.e. the ones named in the code."""
+        self.text(mod.__name__)
+
+        # Code of the PyGears modules is covered by the digest of the PyGears
+        # sources
+        if is_pygears_module(mod.__name__):
+            return
+
+        key = (id(mod), names)
+        if key in self.seen:
+            return
+
+        self.seen.add(key)
+
+        attrs = vars(mod)
+        for name in names:
+            if name not in attrs:
+                continue
+
+            self.text(name)
+            if isinstance(attrs[name], types.ModuleType):
+                self.module(attrs[name], names)
+            else:
+                self.obj(attrs[name])
+
+    def func(self, f):
+        self.text(f'{f.__module__}.{f.__qualname__}')
+
+        if id(f) in self.seen:
+            return
+
+        self.seen.add(id(f))
+
+        # Code of the PyGears functions is covered by the digest of the
+        # PyGears sources, but their closures still need to be considered
+        if not is_pygears_module(f.__module__):
+            self.code(f.__code__, f.__globals__)
+
+        self.obj(f.__defaults__)
+        self.obj(f.__kwdefaults__)
+        for cell in f.__closure__ or ():
+            try:
+                self.obj(cell.cell_contents)
+            except ValueError:
+                self.text('<empty>')
+
+        if hasattr(f, '__wrapped__'):
+            self.obj(f.__wrapped__)
+
+    def obj(self, obj):
+        if isinstance(obj, types.FunctionType):
+            self.func(obj)
+        elif isinstance(obj, types.MethodType):
+            self.func(obj.__func__)
+            self.obj(obj.__self__)
+        elif isinstance(obj, (Partial, functools.partial)):
+            self.obj(obj.func)
+            self.obj(obj.args)
+            self.obj(getattr(obj, 'kwds', getattr(obj, 'keywords', None)))
+        elif isinstance(obj, types.ModuleType):
+            # Without the code that accesses the module, there is no telling
+            # which of its attributes matter
+            if not is_pygears_module(obj.__name__):
+                raise Uncacheable(repr(obj))
+
+            self.text(obj.__name__)
+        elif type(obj) in (list, tuple) or (isinstance(obj, tuple) and hasattr(obj, '_fields')):
+            self.text(f'{type(obj).__qualname__}{len(obj)}')
+            for o in obj:
+                self.obj(o)
+        elif isinstance(obj, dict):
+            self.text(f'dict{len(obj)}')
+            for k, v in obj.items():
+                self.obj(k)
+                self.obj(v)
+        elif dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+            self.text(type(obj).__qualname__)
+            for f in dataclasses.fields(obj):
+                self.text(f.name)
+                self.obj(getattr(obj, f.name))
+        elif isinstance(obj, (set, frozenset)):
+            self.text(f'{type(obj).__name__}{len(obj)}')
+            for o in sorted(obj, key=repr):
+                self.obj(o)
+        elif (type(obj) in STABLE_REPR_TYPES or is_type(obj) or is_type(type(obj))
+              or isinstance(obj, enum.Enum)):
+            self.text(repr(obj))
+        elif isinstance(obj, type) and (obj.__module__ == 'builtins'
+                                        or is_pygears_module(obj.__module__)):
+            self.text(f'{obj.__module__}.{obj.__qualname__}')
+        else:
+            # repr() of other objects need not reflect their state
+            raise Uncacheable(repr(obj))
+
+    def hexdigest(self):
+        return self.h.hexdigest()
+
+
+def cache_key(gear, lang):
+    """Returns the cache key for the code compiled from the ``gear``, or
+    ``None`` if the cache is disabled or the gear cannot be cached."""
+    if reg['hls/cache_dir'] is None:
+        return None
+
+    fp = Fingerprint()
+    fp.text(pygears_digest())
+    fp.text(lang)
+
+    try:
+        fp.obj(gear.func)
+        fp.obj(gear.params)
+        fp.obj(gear.meta_kwds.get('hdl', {}))
+        fp.obj(gear.meta_kwds['signals'])
+        for p in gear.in_ports + gear.out_ports:
+            fp.obj((p.basename, p.dtype, p.consumer is not None))
+    except Uncacheable:
+        return None
+
+    return fp.hexdigest()
+
+
+def cache_path(key):
+    return os.path.join(reg['hls/cache_dir'], key)
+
+
+def cache_fetch(key):
+    """Returns the compiled code stored under the ``key``, or ``None`` on a
+    cache miss."""
+    try:
+        with open(cache_path(key)) as f:
+            return f.read()
+    except OSError:
+        return None
+
+
+def cache_store(key, contents):
+    path = cache_path(key)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+
+    # Write first, so that concurrent runs never see a partial entry
+    tmp_path = f'{path}.{os.getpid()}.tmp'
+    with open(tmp_path, 'w') as f:
+        f.write(contents)
+
+    os.replace(tmp_path, path)
+
+
+class HLSCachePlugin(PluginBase):
+    @classmethod
+    def bind(cls):
+        reg.confdef('hls/cache_dir',
+                    default=None,
+                    docs='Directory of the persistent cache of the HDL code compiled from the '
+                    'gear functions. Cache is disabled when set to None')
@@ -2,19 +2,21 @@ from pygears import gear, module, find
 from pygears.lib import dreg
 from pygears.typing import Tuple, Uint
 from pygears.sim import clk
+from pygears.sim.memory import make_memory
 
 TWrDin = Tuple[{'addr': Uint['w_addr'], 'data': 'w_data'}]
 TRdDin = Uint['w_addr']
 
 
 def sdp_wr_port_setup(module):
-    module.ram = {}
+    module.ram = make_memory(module.in_ports[0].dtype['data'], module.params['depth'],
+                             module.params['mem'])
 
 
 @gear(sim_setup=sdp_wr_port_setup)
-async def sdp_wr_port(din, *, depth) -> None:
+async def sdp_wr_port(din, *, depth, mem=None) -> None:
     async with din as (addr, data):
-        module().ram[int(addr)] = data
+        module().ram[addr] = data
 
 
 def sdp_rd_port_setup(module):
@@ -27,7 +29,7 @@ async def sdp_rd_port(addr, *, t, depth) -> b't':
 
     while True:
         a = await addr.get()
-        dout = ram[int(a)]
+        dout = ram[a]
         await clk()
         yield dout
 
@@ -38,7 +40,8 @@ def sdp(wr_addr_data: TWrDin,
         *,
         depth=b'2**w_addr',
         w_data=b'w_data',
-        w_addr=b'w_addr') -> b'w_data':
+        w_addr=b'w_addr',
+        mem=None) -> b'w_data':
     """Short for Simple Dual-Port RAM. Supports simultaneous read and write
     operations i.e. ``rd_addr`` interface reads from the RAM while the
     ``wr_addr_data`` interface writes to it. It has a sigle output interface
@@ -63,11 +66,15 @@ def sdp(wr_addr_data: TWrDin,
         w_data: Width of the data bus
         w_addr: Width of the address bus
         depth: Depth of the memory
+        mem: Memory model used in simulation. Either a
+          :class:`~pygears.sim.memory.Memory`, which can be used to preload the
+          memory and to inspect it after the simulation, or the name of a
+          binary or hex file to preload the memory from
 
     Returns:
         Data read from the memory. Same type as the ``data`` field of the
           ``TWrDin`` :class:`Tuple` i.e. the data beeing writen to memory.
     """
 
-    wr_addr_data | sdp_wr_port(depth=depth)
+    wr_addr_data | sdp_wr_port(depth=depth, mem=mem)
     return rd_addr | sdp_rd_port(t=wr_addr_data.dtype['data'], depth=depth)
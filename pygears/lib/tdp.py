@@ -1,5 +1,6 @@
 from pygears import gear, module, find, alternative
 from pygears.sim import clk
+from pygears.sim.memory import make_memory
 from pygears.typing import Tuple, Uint, Union, Maybe
 from .dreg import dreg
 
@@ -11,11 +12,12 @@ TUniReq = Union[Uint['w_addr'], TWrReq]
 
 
 def tdp_port0_setup(module):
-    module.ram = {}
+    module.ram = make_memory(module.out_ports[0].dtype, module.params['depth'],
+                             module.params['mem'])
 
 
 @gear(sim_setup=tdp_port0_setup)
-async def tdp_port0(req, *, depth) -> b'req["data"].data':
+async def tdp_port0(req, *, depth, mem=None) -> b'req["data"].data':
     ram = module().ram
 
     async with req as (addr, (data, ctrl)):
@@ -47,9 +49,10 @@ def tdp(
         *,
         depth=b'2**w_addr',
         w_data=b'data.width',
-        w_addr=b'w_addr') -> b'(req0["data"].data, req1["data"].data)':
+        w_addr=b'w_addr',
+        mem=None) -> b'(req0["data"].data, req1["data"].data)':
 
-    dout0 = req0 | tdp_port0(depth=depth)
+    dout0 = req0 | tdp_port0(depth=depth, mem=mem)
     dout1 = req1 | tdp_port1(depth=depth)
 
     return dout0, dout1
@@ -57,7 +60,7 @@ def tdp(
 
 @alternative(tdp)
 @gear
-def tdp_union(req0: TUniReq, req1: TUniReq, *, depth=b'2**w_addr'):
+def tdp_union(req0: TUniReq, req1: TUniReq, *, depth=b'2**w_addr', mem=None):
     wr_req_t = req0.dtype.types[1]
     req_t = TReq[wr_req_t['addr'].width, wr_req_t['data']]
-    return tdp(req0 >> req_t, req1 >> req_t)
+    return tdp(req0 >> req_t, req1 >> req_t, mem=mem)
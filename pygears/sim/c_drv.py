@@ -1,7 +1,9 @@
 import ctypes
+from collections import deque
 from math import ceil
 from pygears.sim.modules.cosim_base import CosimNoData
 from pygears.sim import log
+from pygears.typing.codec import encoder, decoder
 
 
 class IdleIteration(Exception):
@@ -62,28 +64,30 @@ class CInputDrv(CDrv):
     def __init__(self, verilib, port, name=None):
         super().__init__(verilib, port, name)
         self.c_set_api.argtypes = (self.c_dtype, ctypes.c_uint)
+        self.encode = encoder(self.port.dtype)
+
+        if self.width > 64:
+            # Wide data is passed via the preallocated array, which shares
+            # its memory with the buffer the data bytes are written to
+            self.buf = bytearray(ctypes.sizeof(self.c_dtype))
+            self.c_data = self.c_dtype.from_buffer(self.buf)
 
     def close(self):
         pass
 
     def to_c_data(self, data):
         if self.width > 64:
-
-            def dgen(data):
-                for i in range(ceil(self.width / 32)):
-                    yield data & 0xffffffff
-                    data >>= 32
-
-            return self.c_dtype(*list(dgen(data)))
+            self.buf[:] = data.to_bytes(len(self.buf), byteorder='little')
+            return self.c_data
         else:
-            return self.c_dtype(data)
+            return data
 
     def empty(self):
         return self.seq.empty()
 
     def send(self, data):
         # self.c_set_api(self.to_c_data(code(self.port.dtype, data)), 1)
-        self.c_set_api(self.to_c_data(self.port.dtype(data).code()), 1)
+        self.c_set_api(self.to_c_data(self.encode(self.port.dtype(data))), 1)
 
     def ready(self):
         return self.c_get_api()
@@ -106,14 +110,13 @@ class COutputDrv(CDrv):
 
         self.active = False
         self.dout = self.c_dtype()
+        self.decode = decoder(self.port.dtype)
 
     def from_c_data(self, data):
-        dout = 0
-        for d in reversed(list(data)):
-            dout <<= self.c_width
-            dout |= d
+        if self.width > 64:
+            return int.from_bytes(data, byteorder='little')
 
-        return dout
+        return data[0]
 
     def reset(self):
         self.c_set_api(0)
@@ -128,9 +131,94 @@ class COutputDrv(CDrv):
         # )
         if self.active:
             try:
-                return self.port.dtype.decode(self.from_c_data(self.dout))
+                return self.decode(self.from_c_data(self.dout))
             except ValueError as e:
                 log.error(
                     str(e) + f'\n    - received at port "{self.port.name}"')
         else:
             raise CosimNoData
+
+
+class CFifoDrv(CDrv):
+    def __init__(self, main, port, name=None):
+        super().__init__(main.verilib, port, name)
+        self.main = main
+        self.words = max(ceil(self.width / 32), 1)
+
+
+class CInputFifoDrv(CFifoDrv):
+    """Input driver of the free-running mode. Data is pushed into the input
+    FIFO of the verilated model, tagged with the current cycle, and is
+    acknowledged as soon as there is room for it in the FIFO."""
+    def __init__(self, main, port, name=None):
+        super().__init__(main, port, name)
+        self.c_push_api = getattr(self.verilib, f'push_{self.name}')
+        self.c_push_api.argtypes = (ctypes.POINTER(ctypes.c_uint32), ctypes.c_uint64)
+        self.buf = bytearray(self.words * 4)
+        self.c_buf = (ctypes.c_uint32 * self.words).from_buffer(self.buf)
+        self.encode = encoder(self.port.dtype)
+        self.pushed = False
+
+    def push(self):
+        self.pushed = bool(self.c_push_api(self.c_buf, self.main.cycle_cnt))
+        if not self.pushed:
+            # FIFO is full, model needs to run in order to consume the data
+            self.main.sync_needed = True
+
+    def send(self, data):
+        self.buf[:] = self.encode(self.port.dtype(data)).to_bytes(len(self.buf), byteorder='little')
+        self.push()
+
+    def ready(self):
+        if not self.pushed:
+            self.push()
+
+        return self.pushed
+
+    def reset(self):
+        pass
+
+
+class COutputFifoDrv(CFifoDrv):
+    """Output driver of the free-running mode. Transactions collected in the
+    output FIFO of the verilated model are pulled in bulk into the
+    :attr:`queue`, from which they are forwarded to the consumers."""
+    def __init__(self, main, port, name=None, depth=64):
+        super().__init__(main, port, name)
+        self.c_pull_api = getattr(self.verilib, f'pull_{self.name}')
+        self.c_pull_api.argtypes = (ctypes.POINTER(ctypes.c_uint32), ctypes.c_int)
+        self.depth = depth
+        self.buf = bytearray(self.words * 4 * depth)
+        self.dout = (ctypes.c_uint32 * (self.words * depth)).from_buffer(self.buf)
+        self.queue = deque()
+        self.decode = decoder(self.port.dtype)
+
+    def pull(self):
+        """Moves the transactions from the model FIFO to the :attr:`queue`,
+        as many as fit. Returns the number of transactions moved."""
+        cnt = self.c_pull_api(self.dout, self.depth - len(self.queue))
+        if not cnt:
+            return 0
+
+        size = self.words * 4
+        raw = memoryview(self.buf)
+        for i in range(cnt):
+            code = int.from_bytes(raw[i * size:(i + 1) * size], byteorder='little')
+            try:
+                self.queue.append(self.decode(code))
+            except ValueError as e:
+                log.error(str(e) + f'\n    - received at port "{self.port.name}"')
+
+        return cnt
+
+    def reset(self):
+        pass
+
+    def ack(self):
+        self.queue.popleft()
+
+    def read(self):
+        if not self.queue:
+            raise CosimNoData
+
+        return self.queue[0]
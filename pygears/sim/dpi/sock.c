@@ -32,10 +32,12 @@ typedef int SOCKET;
 // Thanks: http://beej.us/guide/bgnet/
 //         https://github.com/jimloco/Csocket
 
-#define BUFFER_SIZE (1024 / 32 * sizeof(uint32_t))
+#define BUFFER_SIZE (4096)
 struct handle {
   SOCKET sock;
-  char wbuf[BUFFER_SIZE];
+  char *wbuf;  // Buffered reply, sent with sock_flush
+  size_t wlen; // Write end
+  size_t wcap; // Allocated size of wbuf
   char rbuf[BUFFER_SIZE + 1];
   size_t roff; // Read pointer
   size_t eoff; // Read end
@@ -63,6 +65,9 @@ struct handle *init_struct(SOCKET sock, int timeout) {
   struct handle *h = malloc(sizeof(struct handle));
   if (h) {
     h->sock = sock;
+    h->wbuf = NULL;
+    h->wlen = 0;
+    h->wcap = 0;
     h->roff = 0;
     h->eoff = 0;
     h->rbuf[BUFFER_SIZE] = '\0'; // Overflow protection for long strings
@@ -203,6 +208,7 @@ void sock_close(void *handle) {
 
   struct handle *h = handle;
   closesocket(h->sock);
+  free(h->wbuf);
   free(h);
 }
 
@@ -245,6 +251,50 @@ int sock_done(void *handle) {
 
 extern void pause_sim();
 
+// Copies len bytes received from the socket to dst. Socket is read in chunks
+// of up to BUFFER_SIZE bytes, so that the whole batch of commands sent by
+// PyGears at once is received with a single system call. Returns 0 on
+// success, 1 on error and 2 if no data is available on a non-blocking socket.
+static int sock_recv(struct handle *h, void *dst, size_t len) {
+  char *out = dst;
+
+  while (len > 0) {
+    if (h->roff == h->eoff) {
+      int ret = recv(h->sock, h->rbuf, BUFFER_SIZE, 0);
+
+      if (ret == 0) {
+        return 1; // Connection closed
+      } else if (ret < 0) {
+        if ((errno == EAGAIN) || (errno == EWOULDBLOCK)) {
+          if (h->timeout > 0) {
+            pause_sim();
+          } else if (h->timeout == 0) {
+            return 2;
+          }
+        } else if (errno != EINTR) {
+          return 1;
+        }
+
+        continue;
+      }
+
+      h->roff = 0;
+      h->eoff = ret;
+    }
+
+    size_t n = h->eoff - h->roff;
+    if (n > len)
+      n = len;
+
+    memcpy(out, h->rbuf + h->roff, n);
+    h->roff += n;
+    out += n;
+    len -= n;
+  }
+
+  return 0;
+}
+
 int sock_get_bv(void *handle, int width, svBitVecVal *signal) {
   // Validate input
   if (!handle) {
@@ -252,33 +302,12 @@ int sock_get_bv(void *handle, int width, svBitVecVal *signal) {
   }
 
   struct handle *h = handle;
-  int ret;
   int words = SV_PACKED_DATA_NELEMS(width);
+  int ret = sock_recv(h, signal, words * 4);
 
-  do {
-    /* ret = recv(h->sock, h->rbuf, BUFFER_SIZE, 0); */
-    /* ret = recv(h->sock, h->rbuf, words * 4, 0); */
-    ret = recv(h->sock, signal, words * 4, 0);
-
-    /* printf("Got: "); */
-    /* print_time(); */
-
-    /* printf("Ret value %d for width %d, errno value %d\n", ret, words*4, errno); */
-    if (ret <= 0) {
-      if ((errno == EAGAIN) || (errno == EWOULDBLOCK)) {
-        if (h->timeout > 0) {
-          /* printf("%p timeout\n", handle); */
-          /* printf("Ret value %d, errno value %d\n", ret, errno); */
-          pause_sim();
-        } else if (h->timeout == 0) {
-          return 2;
-        }
-      } else if (errno != EINTR) {
-        /* printf("Ret value %d, errno value %d\n", ret, errno); */
-        return 1;
-      }
-    }
-  } while (ret <= 0);
+  if (ret) {
+    return ret;
+  }
 
   /* uint32_t *rval = (uint32_t *)h->rbuf; */
 
@@ -328,6 +357,64 @@ int sock_put(void *handle, const svOpenArrayHandle signal) {
   return 0;
 }
 
+// Appends the signal to the reply buffer, which is sent at once by
+// sock_flush. Used to reply with a single frame to the batched commands.
+int sock_put_buf(void *handle, const svOpenArrayHandle signal) {
+  // Validate input
+  if (!handle) {
+    return 1;
+  }
+
+  struct handle *h = handle;
+  int width = svSize(signal, 0);
+  size_t len = SV_PACKED_DATA_NELEMS(width) * sizeof(svBitVecVal);
+
+  if (h->wlen + len > h->wcap) {
+    size_t cap = h->wcap ? h->wcap : BUFFER_SIZE;
+    while (cap < h->wlen + len)
+      cap *= 2;
+
+    char *wbuf = realloc(h->wbuf, cap);
+    if (!wbuf) {
+      return 1;
+    }
+
+    h->wbuf = wbuf;
+    h->wcap = cap;
+  }
+
+  memcpy(h->wbuf + h->wlen, svGetArrayPtr(signal), len);
+  h->wlen += len;
+
+  return 0;
+}
+
+int sock_flush(void *handle) {
+  // Validate input
+  if (!handle) {
+    return 1;
+  }
+
+  struct handle *h = handle;
+  size_t off = 0;
+
+  while (off < h->wlen) {
+    int ret = send(h->sock, h->wbuf + off, h->wlen - off, 0);
+    if (ret < 0) {
+      if (errno == EINTR)
+        continue;
+
+      h->wlen = 0;
+      return 1;
+    }
+
+    off += ret;
+  }
+
+  h->wlen = 0;
+  return 0;
+}
+
 /* int main() { */
 /* 	struct handle* handle; */
 
@@ -8,5 +8,7 @@ int sock_get(void* handle, const svOpenArrayHandle signal);
 void* sock_open(const char* uri, const char* channel);
 void sock_close(void* handle);
 int sock_put(void* handle, const svOpenArrayHandle signal);
+int sock_put_buf(void* handle, const svOpenArrayHandle signal);
+int sock_flush(void* handle);
 
 #endif
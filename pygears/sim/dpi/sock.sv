@@ -35,6 +35,14 @@ import "DPI-C" function int sock_done(input chandle handle);
 // Returns 1 on success, 0 on error
 import "DPI-C" function int sock_put(input chandle handle, input bit [] signal);
 
+// Appends the signal to the reply buffer, without sending it
+// Returns 0 on success, 1 on error
+import "DPI-C" function int sock_put_buf(input chandle handle, input bit [] signal);
+
+// Sends the reply buffer filled by sock_put_buf
+// Returns 0 on success, 1 on error
+import "DPI-C" function int sock_flush(input chandle handle);
+
    export "DPI-C" function pause_sim;
 
    function void pause_sim();
@@ -48,7 +48,7 @@ class ActivityChecker:
     def get_port_status(self, port):
         q = get_producer_queue(port)
 
-        if q._unfinished_tasks:
+        if q.pending():
             return "active"
 
         prod_port = get_source_producer(port, sim=True).consumers[0]
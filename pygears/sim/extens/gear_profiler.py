@@ -0,0 +1,230 @@
+import json
+import os
+from time import perf_counter_ns
+
+from pygears.conf import inject, Inject
+from pygears.core.gear import Gear
+from pygears.sim import log
+from pygears.sim.modules.cosim_port import InCosimPort, OutCosimPort
+from .sim_extend import SimExtend
+
+
+class GearStats:
+    __slots__ = ('forward', 'back', 'finish', 'activations')
+
+    def __init__(self):
+        self.forward = 0
+        self.back = 0
+        self.finish = 0
+        self.activations = 0
+
+    @property
+    def total(self):
+        return self.forward + self.back + self.finish
+
+    def add(self, other):
+        self.forward += other.forward
+        self.back += other.back
+        self.finish += other.finish
+        self.activations += other.activations
+
+    def todict(self):
+        return {
+            'forward_ns': self.forward,
+            'back_ns': self.back,
+            'finish_ns': self.finish,
+            'total_ns': self.total,
+            'activations': self.activations
+        }
+
+
+class IntfStats:
+    __slots__ = ('transfers', 'stalls')
+
+    def __init__(self):
+        self.transfers = 0
+        self.stalls = 0
+
+    def todict(self):
+        return {'transfers': self.transfers, 'stalls': self.stalls}
+
+
+class GearProfiler(SimExtend):
+    """Measures the time spent inside each simulation gear.
+
+    Time is measured separately for the forward phase, back phase and finish
+    of each gear, together with the number of its activations. Results are
+    aggregated over the module hierarchy and exported after the simulation to
+    a collapsed stack file (which can be fed to the flamegraph tools) and to a
+    JSON file. For each input port of the simulated gears, the number of data
+    transfers and the number of timesteps in which the data was stalled
+    waiting for the consumer are recorded as well.
+
+    Sim gears created during the simulation by the other gears (i.e. by
+    calling a gear inside ``async with``) are accounted to the gear that
+    created them.
+
+    Cosimulation port sim gears share the cosimulated gear with the main
+    cosimulation sim gear, so they are reported under the names of their
+    ports.
+
+    Setting ``collapsed_fn`` or ``json_fn`` to ``None`` disables the
+    corresponding output.
+    """
+
+    @inject
+    def __init__(self,
+                 collapsed_fn='profile.folded',
+                 json_fn='profile.json',
+                 outdir=Inject('results-dir')):
+        super().__init__()
+        self.outdir = outdir
+        self.collapsed_fn = collapsed_fn
+        self.json_fn = json_fn
+        self.gears = {}
+        # Statistics that each sim gear is accounted to, including the ones
+        # created during the simulation
+        self.stats = {}
+        self.intfs = {}
+        self.consumers = []
+        self.start_time = 0
+
+    def before_run(self, sim):
+        for sim_gear in sim.sim_gears:
+            self.gears[sim_gear] = self.stats[sim_gear] = GearStats()
+
+            module = sim_gear.gear
+            if not isinstance(module, Gear):
+                continue
+
+            for p in module.in_ports:
+                # Cosimulation sim gears share the module and its ports
+                if p in self.intfs:
+                    continue
+
+                stats = self.intfs[p] = IntfStats()
+                p.consumer.events['ack'].append(self.intf_ack(stats))
+                self.consumers.append((p.consumer, stats))
+
+    @staticmethod
+    def sim_gear_name(sim_gear):
+        if isinstance(sim_gear, (InCosimPort, OutCosimPort)):
+            return sim_gear.port.name
+
+        return sim_gear.gear.name
+
+    def gear_stats(self, sim_gear):
+        stats = self.stats.get(sim_gear)
+        if stats is not None:
+            return stats
+
+        if sim_gear.parent is not None:
+            stats = self.gear_stats(sim_gear.parent)
+        else:
+            stats = self.gears[sim_gear] = GearStats()
+
+        self.stats[sim_gear] = stats
+        return stats
+
+    @staticmethod
+    def intf_ack(stats):
+        def ack(intf):
+            stats.transfers += 1
+            return True
+
+        return ack
+
+    def after_timestep(self, sim, timestep):
+        for intf, stats in self.consumers:
+            q = intf.in_queue
+            if q is not None and q.pending():
+                stats.stalls += 1
+
+        return True
+
+    def before_call_forward(self, sim, sim_gear):
+        self.start_time = perf_counter_ns()
+        return True
+
+    def after_call_forward(self, sim, sim_gear):
+        stats = self.gear_stats(sim_gear)
+        stats.forward += perf_counter_ns() - self.start_time
+        stats.activations += 1
+        return True
+
+    def before_call_back(self, sim, sim_gear):
+        self.start_time = perf_counter_ns()
+        return True
+
+    def after_call_back(self, sim, sim_gear):
+        stats = self.gear_stats(sim_gear)
+        stats.back += perf_counter_ns() - self.start_time
+        stats.activations += 1
+        return True
+
+    def before_finish(self, sim, sim_gear):
+        self.start_time = perf_counter_ns()
+        return True
+
+    def after_finish(self, sim, sim_gear):
+        self.gear_stats(sim_gear).finish += perf_counter_ns() - self.start_time
+
+        return True
+
+    def hier_stats(self):
+        """Returns the statistics of each simulation gear summed up into all
+        of its parent modules, keyed by the module name. Root module is keyed
+        by ``'/'``."""
+        hier = {}
+        for sim_gear, stats in self.gears.items():
+            node = sim_gear.gear
+            while node is not None:
+                name = node.name or '/'
+                if name not in hier:
+                    hier[name] = GearStats()
+
+                hier[name].add(stats)
+                node = node.parent
+
+        return hier
+
+    def collapsed(self):
+        """Returns the profile in the collapsed stack format, one line per
+        simulation gear with its total time in microseconds."""
+        lines = []
+        for sim_gear, stats in self.gears.items():
+            name = self.sim_gear_name(sim_gear)
+            stack = ';'.join(name.strip('/').split('/')) or 'root'
+            lines.append(f'{stack} {stats.total // 1000}')
+
+        return '\n'.join(sorted(lines))
+
+    def todict(self):
+        return {
+            'gears': {
+                self.sim_gear_name(sim_gear): stats.todict()
+                for sim_gear, stats in self.gears.items()
+            },
+            'hierarchy': {name: stats.todict()
+                          for name, stats in self.hier_stats().items()},
+            'intfs': {p.name: stats.todict()
+                      for p, stats in self.intfs.items()}
+        }
+
+    def after_run(self, sim):
+        if self.collapsed_fn:
+            fn = os.path.abspath(os.path.join(self.outdir, self.collapsed_fn))
+            with open(fn, 'w') as f:
+                f.write(self.collapsed())
+                f.write('\n')
+
+            log.info(f'Gear profile (collapsed stacks) dumped to "{fn}"')
+
+        if self.json_fn:
+            fn = os.path.abspath(os.path.join(self.outdir, self.json_fn))
+            with open(fn, 'w') as f:
+                json.dump(self.todict(), f, indent=4)
+
+            log.info(f'Gear profile dumped to "{fn}"')
+
+        return True
@@ -4,7 +4,6 @@ import tempfile
 from math import ceil
 import jinja2
 import array
-import math
 import os
 import socket
 import logging
@@ -15,6 +14,7 @@ from pygears.sim.extens.sim_extend import SimExtend
 from pygears.sim import SimPlugin
 from pygears.util.fileio import save_file
 from pygears.sim import log
+from pygears.typing.codec import encoder, decoder
 
 from pygears.conf import inject, Inject
 
@@ -26,6 +26,14 @@ CMD_CYCLE = 0x08000000
 CMD_READ = 0x04000000
 CMD_ACK = 0x02000000
 CMD_FINISH = 0x01000000
+CMD_READ_ALL = 0x00800000
+
+# Commands after which the HDL simulator advances time, which invalidates the
+# status frame read with CMD_READ_ALL
+CMD_EVAL = CMD_SYS_RESET | CMD_FORWARD | CMD_CYCLE
+
+# Batched commands are flushed at the latest when this many bytes accumulate
+CMD_BUF_SIZE = 64 * 1024
 
 
 class CosimulatorStartError(Exception):
@@ -57,7 +65,7 @@ def u32_repr_gen(data, dtype):
 
 
 def u32_repr(data, dtype):
-    return array.array('I', u32_repr_gen(dtype(data).code(), dtype))
+    return array.array('I', u32_repr_gen(encoder(dtype)(dtype(data)), dtype))
 
 
 def u32_bytes_to_int(data):
@@ -72,18 +80,39 @@ def u32_bytes_to_int(data):
 
 
 def u32_bytes_decode(data, dtype):
-    return dtype.decode(u32_bytes_to_int(data) & ((1 << dtype.width) - 1))
+    return decoder(dtype)(u32_bytes_to_int(data))
+
+
+def u32_bytes_size(dtype):
+    return max(1, ceil(dtype.width / 32)) * 4
 
 
 class SVSock(SimExtend):
+    """Drives the HDL simulator over the socket, by sending it commands which
+    are interpreted by the generated SystemVerilog top module.
+
+    In batched mode (``sim/svsock/batch_cmds``), commands that do not require
+    a reply (set data, reset, ack, forward, cycle) are not sent immediately,
+    but are accumulated and sent together with the next command that needs a
+    reply. Statuses of all the interfaces are read at once via
+    ``CMD_READ_ALL``, to which the simulator replies with a single frame that
+    remains valid until the simulator advances time. This makes the number of
+    socket round trips per cycle independent of the number of interfaces.
+    """
     @inject
-    def __init__(self, run=Inject('sim/svsock/run'), **kwds):
+    def __init__(self, run=Inject('sim/svsock/run'), batch_cmds=Inject('sim/svsock/batch_cmds'),
+                 **kwds):
         reg['sim/svsock/server'] = self
         self.run_cosim = run
+        self.batch_cmds = batch_cmds
         self.kwds = kwds
         self.sock = None
         self.conn = None
         self.cosim_pid = None
+        self.cmd_buf = bytearray()
+        self.frame = None
+        self.frame_layout = {}
+        self.frame_size = 0
         super().__init__()
         atexit.register(self.finish)
 
@@ -106,7 +135,7 @@ class SVSock(SimExtend):
 
         context = {'port': self.port}
         for phase in [
-                'declaration', 'init', 'set_data', 'read', 'ack', 'reset',
+                'declaration', 'init', 'set_data', 'read', 'read_all', 'ack', 'reset',
                 'sys_reset'
         ]:
             context[phase] = {}
@@ -122,30 +151,86 @@ class SVSock(SimExtend):
         res = env.get_template('svsock_top.j2').render(context)
         save_file('_top.sv', self.outdir, res)
 
+        self.frame_layout = {}
+        self.frame_size = 0
+        for i, intf in enumerate(intfs):
+            if hasattr(intf, 'read_all_size'):
+                self.frame_layout[i] = self.frame_size
+                self.frame_size += intf.read_all_size()
+
     def sendall(self, pkt):
-        self.conn.sendall(pkt)
+        if self.batch_cmds:
+            self.cmd_buf += pkt
+            if len(self.cmd_buf) >= CMD_BUF_SIZE:
+                self.flush()
+        else:
+            self.conn.sendall(pkt)
+
+    def flush(self):
+        if self.cmd_buf:
+            self.conn.sendall(self.cmd_buf)
+            self.cmd_buf.clear()
 
     def send_cmd(self, req):
-        pkt = req.to_bytes(4, byteorder='little')
-        self.conn.sendall(pkt)
+        if req & CMD_EVAL:
+            self.frame = None
+
+        self.sendall(req.to_bytes(4, byteorder='little'))
+
+        if req & (CMD_SYS_RESET | CMD_FINISH):
+            self.flush()
 
     def recv(self, size):
-        return self.conn.recv(size)
+        self.flush()
+
+        buf = bytearray(size)
+        view = memoryview(buf)
+        while view:
+            nbytes = self.conn.recv_into(view)
+            if nbytes == 0:
+                raise BrokenPipeError
+
+            view = view[nbytes:]
+
+        return buf
 
     def dtype_send(self, data, dtype):
         pkt = u32_repr(data, dtype).tobytes()
         self.sendall(pkt)
 
     def dtype_recv(self, dtype):
-        buff_size = math.ceil(dtype.width / 8)
-        if buff_size < 4:
-            buff_size = 4
-        if buff_size % 4:
-            buff_size += 4 - (buff_size % 4)
-
-        data = self.recv(buff_size)
+        data = self.recv(u32_bytes_size(dtype))
         return u32_bytes_decode(data, dtype)
 
+    def read_frame(self):
+        self.send_cmd(CMD_READ_ALL)
+        self.frame = self.recv(self.frame_size)
+        return self.frame
+
+    def read_intf(self, index, dtype=None):
+        """Returns the status of the interface (ready for the input
+        interfaces, valid for the output interfaces) and, if the ``dtype`` is
+        supplied and the status is set, the data of the interface."""
+        if not self.batch_cmds:
+            self.send_cmd(CMD_READ | index)
+            status = int.from_bytes(self.recv(4), byteorder='little')
+            if status and dtype is not None:
+                return status, self.dtype_recv(dtype)
+
+            return status, None
+
+        frame = self.frame
+        if frame is None:
+            frame = self.read_frame()
+
+        offset = self.frame_layout[index]
+        status = int.from_bytes(frame[offset:offset + 4], byteorder='little')
+        if status and dtype is not None:
+            offset += 4
+            return status, u32_bytes_decode(frame[offset:offset + u32_bytes_size(dtype)], dtype)
+
+        return status, None
+
     @inject
     def invoke_cosim(self, intfs=Inject('sim/svsock/intfs')):
         dpi_path = os.path.abspath(os.path.join(ROOT_DIR, 'sim', 'dpi'))
@@ -270,5 +355,6 @@ class SVSockPlugin(SimPlugin):
     def bind(cls):
         reg.confdef('sim/svsock/backend', default={})
         reg.confdef('sim/svsock/run', default=True)
+        reg.confdef('sim/svsock/batch_cmds', default=False)
         reg['sim/svsock/intfs'] = []
         reg['sim/svsock/server'] = None
@@ -0,0 +1,153 @@
+import socket
+import threading
+
+from pygears import reg
+from .svsock import (CMD_ACK, CMD_CYCLE, CMD_FINISH, CMD_FORWARD, CMD_READ, CMD_READ_ALL,
+                     CMD_RESET, CMD_SET_DATA, CMD_SYS_RESET, u32_bytes_size)
+
+
+class SVSockLoopback(threading.Thread):
+    """Stand-in for the HDL simulator side of the :class:`SVSock` protocol,
+    used for testing the socket cosimulation without an HDL simulator.
+
+    It interprets the commands the same way the generated SystemVerilog top
+    module does, for a DUT in which the n-th input interface is wired directly
+    to the n-th output interface. As in the HDL simulator, assignments made by
+    the set data, reset and ack commands become visible only after the forward
+    or the cycle command.
+
+    Attributes:
+        replies: Number of replies sent back to PyGears, i.e. the number of
+          socket round trips
+    """
+    def __init__(self, port, intfs):
+        super().__init__(daemon=True)
+        self.port = port
+        self.intfs = {i: intf for i, intf in enumerate(intfs) if hasattr(intf, 'read_all_size')}
+        self.inputs = [i for i, intf in self.intfs.items() if intf.port.direction == 'in']
+        self.outputs = [i for i, intf in self.intfs.items() if intf.port.direction == 'out']
+
+        self.valid = dict.fromkeys(self.inputs, 0)
+        self.data = dict.fromkeys(self.inputs, 0)
+        self.ready = dict.fromkeys(self.outputs, 0)
+        self.nba = []
+        self.replies = 0
+        self.returncode = None
+        self.conn = None
+
+    def poll(self):
+        return self.returncode
+
+    def terminate(self):
+        if self.conn is not None:
+            self.conn.close()
+
+    def recv(self, size):
+        data = bytearray()
+        while len(data) < size:
+            chunk = self.conn.recv(size - len(data))
+            if not chunk:
+                raise ConnectionResetError
+
+            data += chunk
+
+        return data
+
+    def recv_word(self):
+        return int.from_bytes(self.recv(4), byteorder='little')
+
+    def intf_status(self, index):
+        """Returns the words the simulator replies with on read of the
+        interface status: valid and data for the output interfaces, ready for
+        the input interfaces."""
+        intf = self.intfs[index]
+        if intf.port.direction == 'in':
+            return [self.ready[self.outputs[self.inputs.index(index)]]]
+
+        src = self.inputs[self.outputs.index(index)]
+        return [self.valid[src], self.data[src]]
+
+    def put(self, words, sizes):
+        pkt = b''.join(w.to_bytes(s, byteorder='little') for w, s in zip(words, sizes))
+        self.conn.sendall(pkt)
+        self.replies += 1
+
+    def read(self, index, full):
+        intf = self.intfs[index]
+        words = self.intf_status(index)
+        sizes = [4] * len(words)
+        if len(words) > 1:
+            sizes[1] = u32_bytes_size(intf.dtype)
+            if not (full or words[0]):
+                words, sizes = words[:1], sizes[:1]
+
+        return words, sizes
+
+    def eval(self):
+        for signal, index, val in self.nba:
+            signal[index] = val
+
+        self.nba.clear()
+
+    def execute(self, cmd):
+        index = cmd & 0xffff
+        if cmd & CMD_SET_DATA:
+            intf = self.intfs[index]
+            data = int.from_bytes(self.recv(u32_bytes_size(intf.dtype)), byteorder='little')
+            self.nba.append((self.valid, index, 1))
+            self.nba.append((self.data, index, data))
+        elif cmd & CMD_READ:
+            self.put(*self.read(index, full=False))
+        elif cmd & CMD_READ_ALL:
+            words, sizes = [], []
+            for i in self.intfs:
+                w, s = self.read(i, full=True)
+                words.extend(w)
+                sizes.extend(s)
+
+            self.put(words, sizes)
+        elif cmd & CMD_ACK:
+            self.nba.append((self.ready, index, 1))
+        elif cmd & CMD_RESET:
+            if index in self.valid:
+                self.nba.append((self.valid, index, 0))
+            else:
+                self.nba.append((self.ready, index, 0))
+        elif cmd & (CMD_FORWARD | CMD_CYCLE):
+            self.eval()
+        elif cmd & CMD_SYS_RESET:
+            for i in self.valid:
+                self.nba.append((self.valid, i, 0))
+
+            for i in self.ready:
+                self.nba.append((self.ready, i, 0))
+
+            self.put([0], [4])
+        elif cmd & CMD_FINISH:
+            return False
+
+        return True
+
+    def run(self):
+        self.conn = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            self.conn.connect(self.port)
+            self.conn.sendall(b'_synchro')
+
+            while self.execute(self.recv_word()):
+                pass
+
+            self.returncode = 0
+        except OSError:
+            self.returncode = 1
+        finally:
+            self.conn.close()
+
+
+def loopback(outdir, files, includes, makefile):
+    """:class:`SVSock` backend which runs the :class:`SVSockLoopback` instead
+    of the HDL simulator."""
+    server = reg['sim/svsock/server']
+    proc = SVSockLoopback(server.port, reg['sim/svsock/intfs'])
+    proc.start()
+    return proc
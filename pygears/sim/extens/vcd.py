@@ -6,6 +6,7 @@ from pygears.sim import log, timestep, SimPlugin
 from pygears.sim.sim_gear import SimGear
 from pygears.typing import typeof, TLM, Float
 from pygears.typing.visitor import TypingVisitorBase
+from pygears.typing.codec import field_encoder, leaf_types
 from vcd import VCDWriter
 from pygears.core.hier_node import HierVisitorBase
 from .sim_extend import SimExtend
@@ -142,6 +143,12 @@ def register_traces_for_intf(dtype, scope, writer):
                                                      var_type='wire',
                                                      size=max(t.width, 1))
 
+        # Values of all the fields are obtained at once with the generated
+        # codec function, if it unpacks the fields in the same order
+        if list(v.fields.values()) == leaf_types(dtype):
+            vcd_vars['fields'] = [vcd_vars[name] for name in v.fields]
+            vcd_vars['encode'] = field_encoder(dtype)
+
     for sig in ('valid', 'ready'):
         vcd_vars[sig] = writer.register_var(scope, sig, 'wire', size=1, init=0)
 
@@ -317,6 +324,10 @@ class VCD(SimExtend):
     def var_put(self, v, val):
         if typeof(v['dtype'], TLM):
             self.writer.change(v['data'], timestep() * 10, str(val))
+        elif 'encode' in v:
+            t = timestep() * 10
+            for var, field_val in zip(v['fields'], v['encode'](v['dtype'](val))):
+                self.writer.change(var, t, field_val)
         else:
             visitor = VCDValVisitor(v, self.writer, timestep() * 10)
             visitor.visit(v['dtype'], 'data', val=val)
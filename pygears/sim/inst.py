@@ -8,6 +8,7 @@ from pygears.core.gear import GearPlugin
 from pygears.core.gear_inst import gear_base_resolver
 from pygears.core.hier_node import HierVisitorBase
 from pygears.core.port import HDLConsumer, HDLProducer
+from pygears.core.sim_channel import HandshakeChannel
 
 intfs = []
 
@@ -41,6 +42,7 @@ def sim_compile_resolver(func, *args, **kwds):
 
         gear_inst = outputs.producer.gear
         gear_inst.trace = None
+        gear_inst.out_intfs = []
 
         def is_async_gen(func):
             return bool(func.__code__.co_flags & inspect.CO_ASYNC_GENERATOR)
@@ -62,12 +64,11 @@ def sim_compile_resolver(func, *args, **kwds):
         simulator.tasks[sim_gear] = sim_gear.run()
         simulator.task_data[sim_gear] = None
 
-        import asyncio
         for intf, a in zip(local_in, args):
             if isinstance(a, Intf):
                 continue
 
-            intf._in_queue = asyncio.Queue(maxsize=1, loop=reg['sim/simulator'])
+            intf._in_queue = HandshakeChannel(intf, 0, reg['sim/simulator'])
             intf.put_nb(a)
 
         def callback(p):
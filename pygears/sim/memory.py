@@ -0,0 +1,275 @@
+"""Compact memory model used by the simulation models of the memory gears
+(:func:`~pygears.lib.sdp`, :func:`~pygears.lib.tdp` and
+:func:`~pygears.lib.rom`).
+
+Memory holds the raw integer codes of its words in a contiguous byte buffer,
+which takes only as many bytes per word as is needed to hold the word of the
+specified type, rounded up to the 1, 2, 4 or 8 bytes for the types up to 64
+bits wide. Words are decoded to the specified type only when read. Buffer is
+an anonymous memory map, which the OS allocates and zeroes lazily page by
+page, so that the memories spanning large address spaces of which only a few
+words are used stay small. Buffer can optionally be memory mapped from a
+binary file instead, so that the large memories can be preloaded and
+inspected without copying.
+
+Words are stored in the little-endian byte order, which is also the format of
+the binary files used by :meth:`Memory.load` and :meth:`Memory.dump`. Hex
+files contain one hexadecimal word per line, optionally preceded by the
+``@<addr>`` lines which set the address of the following words, same as the
+files read by the ``$readmemh`` Verilog system task.
+"""
+
+import mmap
+import os
+import sys
+
+# Formats for the memoryview.cast() for the words that fit the native integers
+NARROW_FORMATS = {1: 'B', 2: 'H', 4: 'I', 8: 'Q'}
+
+MEMORY_FORMATS = ('bin', 'hex')
+
+
+def word_size(dtype):
+    size = max((dtype.width + 7) // 8, 1)
+    if size > 8:
+        return size
+
+    return 1 << (size - 1).bit_length()
+
+
+def anonymous_buffer(nbytes):
+    if nbytes == 0:
+        return bytearray()
+
+    if not hasattr(mmap, 'MAP_ANONYMOUS'):
+        return mmap.mmap(-1, nbytes)
+
+    # Memory is not reserved upfront, since usually only a small part of it is
+    # ever touched
+    flags = mmap.MAP_PRIVATE | mmap.MAP_ANONYMOUS | getattr(mmap, 'MAP_NORESERVE', 0)
+    return mmap.mmap(-1, nbytes, flags=flags)
+
+
+def memory_format(fn, fmt):
+    if fmt is None:
+        fmt = 'hex' if os.path.splitext(fn)[1] in ('.hex', '.mem') else 'bin'
+
+    if fmt not in MEMORY_FORMATS:
+        raise ValueError(f'Unknown memory file format "{fmt}", expected one of {MEMORY_FORMATS}')
+
+    return fmt
+
+
+class Memory:
+    """Memory of ``depth`` words of the type ``dtype``.
+
+    Args:
+        dtype: Type of the memory words
+        depth: Number of the memory words
+        fn: If supplied, memory buffer is memory mapped from this binary file.
+          File is created if it doesn't exist, and it is extended to the size
+          of the memory if it is shorter.
+        readonly: Whether the file is mapped as read-only
+
+    Memory can be indexed by the address to read and write the words:
+
+    >>> mem = Memory(Uint[12], 1024)
+    >>> mem[2] = 0x123
+    >>> mem[2]
+    Uint[12](291)
+    """
+
+    def __init__(self, dtype, depth, fn=None, readonly=False):
+        self.dtype = dtype
+        self.depth = depth
+        self.size = word_size(dtype)
+        self.fn = fn
+        self._file = None
+        self._mmap = None
+
+        nbytes = depth * self.size
+
+        if fn is None:
+            self._buf = anonymous_buffer(nbytes)
+            if isinstance(self._buf, mmap.mmap):
+                self._mmap = self._buf
+        else:
+            if readonly:
+                self._file = open(fn, 'rb')
+                if os.fstat(self._file.fileno()).st_size < nbytes:
+                    raise ValueError(f'Memory file "{fn}" is shorter than {nbytes} bytes')
+            else:
+                self._file = open(fn, 'r+b' if os.path.exists(fn) else 'w+b')
+                if os.fstat(self._file.fileno()).st_size < nbytes:
+                    self._file.truncate(nbytes)
+
+            self._mmap = mmap.mmap(self._file.fileno(),
+                                   nbytes,
+                                   access=mmap.ACCESS_READ if readonly else mmap.ACCESS_WRITE)
+            self._buf = self._mmap
+
+        self._view = memoryview(self._buf)
+
+        # Native integers can be accessed directly only if their byte order
+        # matches the one of the buffer
+        if self.size in NARROW_FORMATS and sys.byteorder == 'little':
+            self._words = self._view.cast(NARROW_FORMATS[self.size])
+        else:
+            self._words = None
+
+    def __len__(self):
+        return self.depth
+
+    def __iter__(self):
+        for addr in range(self.depth):
+            yield self[addr]
+
+    def addr(self, addr):
+        addr = int(addr)
+        if addr < 0 or addr >= self.depth:
+            raise IndexError(f'Address {addr} out of range for the memory of depth {self.depth}')
+
+        return addr
+
+    def read_code(self, addr):
+        """Returns the integer code of the word at the address."""
+        addr = self.addr(addr)
+
+        if self._words is not None:
+            return self._words[addr]
+
+        return int.from_bytes(self._view[addr * self.size:(addr + 1) * self.size], 'little')
+
+    def write_code(self, addr, val):
+        """Sets the integer code of the word at the address."""
+        addr = self.addr(addr)
+
+        if self._words is not None:
+            self._words[addr] = val
+        else:
+            self._view[addr * self.size:(addr + 1) * self.size] = val.to_bytes(self.size, 'little')
+
+    def __getitem__(self, addr):
+        return self.dtype.decode(self.read_code(addr))
+
+    def __setitem__(self, addr, val):
+        if type(val) is not self.dtype:
+            val = self.dtype(val)
+
+        self.write_code(addr, val.code())
+
+    def codes(self):
+        """Returns the list of integer codes of all the memory words."""
+        if self._words is not None:
+            return self._words.tolist()
+
+        return [self.read_code(a) for a in range(self.depth)]
+
+    def preload(self, data, offset=0):
+        """Writes the values to the memory.
+
+        Args:
+            data: Sequence of values written to the consecutive addresses
+              starting from ``offset``, or a dict mapping the addresses to the
+              values
+            offset: Address of the first value in the sequence
+        """
+        if isinstance(data, dict):
+            for addr, val in data.items():
+                self[addr] = val
+        else:
+            for addr, val in enumerate(data, offset):
+                self[addr] = val
+
+    def load(self, fn, fmt=None, offset=0):
+        """Loads the raw word codes from a binary or a hex file to the memory,
+        starting from the address ``offset``. Format is guessed from the file
+        extension if ``fmt`` is not supplied: ``.hex`` and ``.mem`` files are
+        read as hex files, while all other files are read as binary."""
+        fmt = memory_format(fn, fmt)
+
+        if fmt == 'bin':
+            with open(fn, 'rb') as f:
+                data = f.read()
+
+            nbytes = min(len(data), (self.depth - offset) * self.size)
+            start = offset * self.size
+            self._view[start:start + nbytes] = data[:nbytes]
+            return
+
+        addr = offset
+        with open(fn) as f:
+            for line in f:
+                line = line.split('//')[0].strip()
+                if not line:
+                    continue
+
+                for word in line.split():
+                    if word[0] == '@':
+                        addr = int(word[1:], 16)
+                    else:
+                        self.write_code(addr, int(word.replace('_', ''), 16))
+                        addr += 1
+
+    def dump(self, fn, fmt=None):
+        """Dumps the raw word codes of the whole memory to a binary or a hex
+        file. Format is guessed from the file extension in the same manner as
+        for :meth:`load`."""
+        fmt = memory_format(fn, fmt)
+
+        if fmt == 'bin':
+            with open(fn, 'wb') as f:
+                f.write(self._view)
+
+            return
+
+        digits = max((self.dtype.width + 3) // 4, 1)
+        with open(fn, 'w') as f:
+            for c in self.codes():
+                f.write(f'{c:0{digits}x}\n')
+
+    def flush(self):
+        """Writes the changes of the memory mapped buffer to the file."""
+        if self._file is not None:
+            self._mmap.flush()
+
+    def close(self):
+        """Releases the memory map and the file it is mapped from."""
+        if self._mmap is None:
+            return
+
+        if self._words is not None:
+            self._words.release()
+
+        self._view.release()
+        self._mmap.close()
+        self._mmap = None
+
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exception_type, exception_value, traceback):
+        self.close()
+
+    def __repr__(self):
+        return f'Memory({repr(self.dtype)}, {self.depth})'
+
+
+def make_memory(dtype, depth, mem=None):
+    """Returns the memory model for a memory gear. ``mem`` can be a
+    :class:`Memory` or the name of a file to preload the memory from."""
+    if isinstance(mem, Memory):
+        if mem.depth < depth or mem.dtype != dtype:
+            raise ValueError(f'{repr(mem)} cannot hold {depth} words of the type {repr(dtype)}')
+
+        return mem
+
+    ram = Memory(dtype, depth)
+    if mem is not None:
+        ram.load(mem)
+
+    return ram
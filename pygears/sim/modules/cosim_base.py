@@ -8,6 +8,12 @@ from .cosim_port import CosimNoData, InCosimPort, OutCosimPort
 
 
 class CosimBase(SimGear):
+    # When False, the ready signals of the output interfaces are assumed not to
+    # influence their valid and data signals (as mandated by the DTI
+    # protocol), so the model is not re-evaluated between the reads of
+    # different outputs, but only before the ready of the inputs is read
+    eval_out_ready = True
+
     @inject
     def __init__(self, gear, timeout=-1, sim_map=Inject('sim/map')):
         super().__init__(gear)
@@ -15,6 +21,7 @@ class CosimBase(SimGear):
         self.in_cosim_ports = [InCosimPort(self, p) for p in gear.in_ports]
         self.out_cosim_ports = [OutCosimPort(self, p) for p in gear.out_ports]
         self.eval_needed = False
+        self.ready_changed = False
 
         for p in (self.in_cosim_ports + self.out_cosim_ports):
             sim_map[p.port] = p
@@ -35,7 +42,8 @@ class CosimBase(SimGear):
         if self.eval_needed:
             self.forward()
 
-        self.eval_needed = True
+        self.ready_changed = True
+        self.eval_needed = self.eval_out_ready
 
         hout = self.handlers[port]
         hout.reset()
@@ -45,7 +53,8 @@ class CosimBase(SimGear):
         if not port in self.handlers:
             raise ConnectionResetError
 
-        self.eval_needed = True
+        self.ready_changed = True
+        self.eval_needed |= self.eval_out_ready
         hout = self.handlers[port]
         hout.ack()
         self.activity_monitor = 0
@@ -72,9 +81,10 @@ class CosimBase(SimGear):
         if not port in self.handlers:
             raise ConnectionResetError
 
-        if self.eval_needed:
+        if self.eval_needed or self.ready_changed:
             self.back()
             self.eval_needed = False
+            self.ready_changed = False
 
         hin = self.handlers[port]
         if hin.ready():
@@ -86,6 +96,7 @@ class CosimBase(SimGear):
     async def func(self, *args, **kwds):
         self.activity_monitor = 0
         self.eval_needed = False
+        self.ready_changed = False
 
         try:
             while True:
@@ -94,9 +105,10 @@ class CosimBase(SimGear):
                 while phase != 'back':
                     phase = await delta()
 
-                if self.eval_needed:
+                if self.eval_needed or self.ready_changed:
                     self.forward()
                     self.eval_needed = False
+                    self.ready_changed = False
 
                 if self.activity_monitor == self.timeout:
                     raise GearDone
@@ -6,7 +6,7 @@ from pygears import GearDone, reg
 from pygears.conf import Inject, inject
 from pygears.sim import clk
 from pygears.sim.modules.cosim_base import CosimBase, CosimNoData
-from pygears.sim.extens.svsock import register_intf
+from pygears.sim.extens.svsock import register_intf, u32_bytes_size
 from pygears.hdl import hdlgen, list_hdl_files
 from pygears.hdl.sv.util import svgen_typedef
 from pygears.hdl.templenv import TemplateEnv
@@ -62,10 +62,8 @@ class SimSocketInputDrv(SimSocketDrv):
         self.main.send_cmd(CMD_RESET | self.index)
 
     def ready(self):
-        self.main.send_cmd(CMD_READ | self.index)
-
-        data = self.main.recv(4)
-        res = bool(int.from_bytes(data, byteorder='little'))
+        status, _ = self.main.read_intf(self.index)
+        res = bool(status)
 
         # print(f'{timestep()} [{self.port.name}] Ready={res}')
         return res
@@ -76,14 +74,13 @@ class SimSocketOutputDrv(SimSocketDrv):
         # print(
         #     f'{timestep()} [{self.port.name}] Send read command for {self.index}'
         # )
-        self.main.send_cmd(CMD_READ | self.index)
-        data = self.main.recv(4)
+        status, data = self.main.read_intf(self.index, self.port.dtype)
         # print(
-        #     f'{timestep()} [{self.port.name}] Received valid status for {self.index}: {data}'
+        #     f'{timestep()} [{self.port.name}] Received valid status for {self.index}: {status}'
         # )
 
-        if int.from_bytes(data, byteorder='little'):
-            return self.main.dtype_recv(self.port.dtype)
+        if status:
+            return data
         else:
             raise CosimNoData
 
@@ -158,6 +155,18 @@ class SVServerIntf:
     def read(self):
         return self.tenv.snippets.read(self.name, self.port.direction)
 
+    def read_all(self):
+        return self.tenv.snippets.read_all(self.name, self.port.direction)
+
+    def read_all_size(self):
+        """Number of bytes the interface contributes to the reply frame of
+        the read all command: the status word, followed by the data for the
+        output interfaces."""
+        if self.port.direction == 'in':
+            return 4
+
+        return 4 + u32_bytes_size(self.dtype)
+
     def ack(self):
         if self.port.direction == 'out':
             return self.tenv.snippets.ack(self.name)
@@ -179,6 +188,9 @@ class SimSocket(CosimBase):
 
         reg['sim/svsock/run'] = run
 
+        # In batched mode statuses of all the outputs are read at once
+        self.eval_out_ready = not reg['sim/svsock/batch_cmds']
+
         if not kwds.get('gui', False):
             kwds['batch'] = batch
 
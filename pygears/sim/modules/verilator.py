@@ -1,4 +1,6 @@
 import ctypes
+import functools
+import hashlib
 import shutil
 import atexit
 import os
@@ -10,7 +12,8 @@ import jinja2
 
 from pygears import reg, find
 from pygears.sim import log
-from pygears.sim.c_drv import CInputDrv, COutputDrv
+from pygears.sim.sim import SimPlugin
+from pygears.sim.c_drv import CInputDrv, COutputDrv, CInputFifoDrv, COutputFifoDrv
 from pygears.sim.modules.cosim_base import CosimBase
 from pygears.hdl import hdlgen, list_hdl_files
 from pygears.util.fileio import save_file
@@ -88,8 +91,12 @@ def get_file_struct(top, outdir):
     }
 
 
+def make_cmd(top_name):
+    return f'make -j -f V{top_name}.mk'
+
+
 def make(objdir, top_name):
-    ret = os.system(f'cd {objdir}; make -j -f V{top_name}.mk > make.log 2>&1')
+    ret = os.system(f'cd {objdir}; {make_cmd(top_name)} > make.log 2>&1')
     # TODO: Not much of a speedup f'cd {self.objdir}; make -j OPT_FAST="-Os -fno-stack-protector" -f V{self.top_name}.mk > make.log 2>&1')
 
     if ret != 0:
@@ -108,16 +115,8 @@ def create_project_script(outdir, top, lang):
     #         f.write(f'{fn}\n')
 
 
-def verilate(outdir, lang, top, top_name, tracing_enabled):
-    # include = ' '.join([f'-I{os.path.abspath(p)}' for p in reg[f'{lang}gen/include']])
-
-    # include += f' -I{outdir}'
-
-    # files = f'{wrap_name}.{lang}'
-    # create_project_script(outdir, top, lang)
-
-    verilate_cmd = [
-        f'cd {outdir};',
+def verilate_flags(top_name, tracing_enabled):
+    return [
         'verilator -cc -CFLAGS -fpic -LDFLAGS -shared --exe',
         '-Wno-fatal',
         # TODO: Not much of a speedup: '-O3 --x-assign fast --x-initial fast --noassert',
@@ -129,6 +128,17 @@ def verilate(outdir, lang, top, top_name, tracing_enabled):
         'sim_main.cpp',
     ]
 
+
+def verilate(outdir, lang, top, top_name, tracing_enabled):
+    # include = ' '.join([f'-I{os.path.abspath(p)}' for p in reg[f'{lang}gen/include']])
+
+    # include += f' -I{outdir}'
+
+    # files = f'{wrap_name}.{lang}'
+    # create_project_script(outdir, top, lang)
+
+    verilate_cmd = [f'cd {outdir};'] + verilate_flags(top_name, tracing_enabled)
+
     with open(os.path.join(outdir, 'verilate.log'), 'w') as f:
         f.write(" ".join(verilate_cmd))
         f.write("\n")
@@ -141,6 +151,97 @@ def verilate(outdir, lang, top, top_name, tracing_enabled):
                                     f'Please inspect "{outdir}/verilate.log"')
 
 
+@functools.lru_cache(maxsize=None)
+def verilator_version():
+    try:
+        return subprocess.check_output(['verilator', '--version'],
+                                       stderr=subprocess.STDOUT).decode().strip()
+    except (OSError, subprocess.CalledProcessError):
+        return ''
+
+
+def build_hash(outdir, top_name, tracing_enabled):
+    """Computes the key of the Verilator build cache from the contents of all
+    the files generated in the ``outdir`` (HDL sources and the rendered C++
+    wrapper), the Verilator and make command lines, and the Verilator
+    version."""
+    h = hashlib.sha256()
+    for cmd in verilate_flags(top_name, tracing_enabled) + [make_cmd(top_name)]:
+        h.update(cmd.encode())
+        h.update(b'\0')
+
+    h.update(verilator_version().encode())
+
+    for root, dirs, files in os.walk(outdir):
+        dirs.sort()
+        for fn in sorted(files):
+            path = os.path.join(root, fn)
+            h.update(os.path.relpath(path, outdir).encode())
+            h.update(b'\0')
+            with open(path, 'rb') as f:
+                h.update(hashlib.sha256(f.read()).digest())
+
+    return h.hexdigest()
+
+
+def cache_entry(cache_dir, key):
+    return os.path.join(cache_dir, key, 'pygearslib')
+
+
+def cache_fetch(cache_dir, key, dll_path):
+    """Copies the cached library to the ``dll_path``, if the cache holds the
+    build with the ``key``. Returns ``True`` on a cache hit."""
+    entry = cache_entry(cache_dir, key)
+    if not os.path.exists(entry):
+        return False
+
+    os.makedirs(os.path.dirname(dll_path), exist_ok=True)
+    shutil.copyfile(entry, dll_path)
+    shutil.copymode(entry, dll_path)
+
+    # Modification time of an entry is used as its last use time for eviction
+    os.utime(os.path.dirname(entry))
+    return True
+
+
+def cache_store(cache_dir, key, dll_path, max_size=None):
+    """Stores the built library in the cache under the ``key`` and evicts the
+    least recently used entries until the cache fits the ``max_size`` bytes."""
+    entry = cache_entry(cache_dir, key)
+    os.makedirs(os.path.dirname(entry), exist_ok=True)
+
+    # Copy first, so that concurrent builds never see a partial library
+    tmp_path = f'{entry}.{os.getpid()}.tmp'
+    shutil.copyfile(dll_path, tmp_path)
+    shutil.copymode(dll_path, tmp_path)
+    os.replace(tmp_path, entry)
+
+    if max_size is not None:
+        cache_evict(cache_dir, max_size)
+
+
+def cache_evict(cache_dir, max_size):
+    entries = []
+    total = 0
+    for key in os.listdir(cache_dir):
+        entry = cache_entry(cache_dir, key)
+        try:
+            size = os.path.getsize(entry)
+            mtime = os.path.getmtime(os.path.dirname(entry))
+        except OSError:
+            continue
+
+        entries.append((mtime, size, key))
+        total += size
+
+    for mtime, size, key in sorted(entries):
+        if total <= max_size:
+            break
+
+        shutil.rmtree(os.path.join(cache_dir, key), ignore_errors=True)
+        total -= size
+
+
 def build(top, outdir=None, postsynth=False, lang=None, rebuild=True):
     if isinstance(top, str):
         top_name = top
@@ -205,12 +306,44 @@ def build(top, outdir=None, postsynth=False, lang=None, rebuild=True):
     c = jenv.get_template('sim_veriwrap.j2').render(context)
     save_file('sim_main.cpp', outdir, c)
 
+    cache_dir = reg['sim/verilator/cache_dir']
+    if cache_dir is not None:
+        cache_dir = os.path.expanduser(cache_dir)
+        key = build_hash(outdir, hdlmod.wrap_module_name, tracing_enabled)
+        if cache_fetch(cache_dir, key, file_struct['dll_path']):
+            log.info(f'Reusing Verilator build "{key}" from "{cache_dir}"')
+            return
+
     verilate(outdir, lang, top, hdlmod.wrap_module_name, tracing_enabled)
 
     make(file_struct['objdir'], hdlmod.wrap_module_name)
 
+    if cache_dir is not None:
+        cache_store(cache_dir, key, file_struct['dll_path'], reg['sim/verilator/cache_size'])
+
 
 class SimVerilated(CosimBase):
+    """Cosimulates the gear by running its verilated model.
+
+    By default, the model is evaluated in lockstep with the PyGears
+    simulator, i.e. several calls into the model are made for each simulated
+    cycle. With ``free_run`` set to a positive number of cycles, the model is
+    run in the free-running mode instead:
+
+    - input data is preloaded into the FIFOs of the model (each ``fifo_depth``
+      deep) and is acknowledged immediately, as long as there is room in the
+      FIFO. Model receives the data in the same cycle in which it was sent.
+    - model is run natively for up to ``free_run`` cycles at once, and the
+      output transactions are collected in the FIFOs. Model output is always
+      ready as long as there is room in its FIFO.
+    - outputs are pulled in bulk, so they can reach the consumers 1 to
+      ``free_run`` cycles later than they were produced by the model. Output
+      transactions carry no cycle stamps, so the cycle in which the model
+      produced them is not recoverable.
+
+    The model is synchronized with the PyGears simulator sooner if an input
+    FIFO gets full or the timeout is about to expire.
+    """
     def __init__(self,
                  gear,
                  timeout=100,
@@ -219,7 +352,9 @@ class SimVerilated(CosimBase):
                  shmidcat=False,
                  postsynth=False,
                  outdir=None,
-                 lang=None):
+                 lang=None,
+                 free_run=0,
+                 fifo_depth=64):
 
         super().__init__(gear, timeout=timeout)
         self.name = gear.name[1:].replace('/', '_')
@@ -236,19 +371,54 @@ class SimVerilated(CosimBase):
         self.shmid_proc = None
         self.verilib = None
         self.finished = False
+        self.free_run = free_run
+        self.fifo_depth = fifo_depth
+        self.cycle_cnt = 0
+        self.model_cnt = 0
+        self.sync_needed = False
 
     def cycle(self):
-        self.verilib.cycle()
+        if not self.free_run:
+            self.verilib.cycle()
+            return
+
+        self.cycle_cnt += 1
+        if (self.sync_needed or self.cycle_cnt - self.model_cnt >= self.free_run
+                or (self.timeout > 0 and self.activity_monitor + 1 >= self.timeout)):
+            self.sync()
 
     def forward(self):
-        self.verilib.forward()
+        if not self.free_run:
+            self.verilib.forward()
 
     def back(self):
-        self.verilib.back()
+        if not self.free_run:
+            self.verilib.back()
+
+    def sync(self):
+        """Runs the model in the free-running mode up to the current cycle,
+        pulling the output transactions whenever the output FIFOs of the model
+        get full."""
+        self.sync_needed = False
+        progress = True
+        while progress:
+            cnt = self.verilib.run(self.cycle_cnt - self.model_cnt)
+            self.model_cnt += cnt
+
+            pulled = 0
+            for cp in self.out_cosim_ports:
+                pulled += self.handlers[cp.name].pull()
+
+            if pulled:
+                self.activity_monitor = 0
+
+            progress = cnt or pulled
 
     def setup(self):
-        # TODO: When reusing existing verilated build, add test to check
-        # whether verilated module is the same as the current one (Maybe hash check?)
+        # TODO: When reusing existing verilated build (rebuild=False), there
+        # is no check whether verilated module is the same as the current one.
+        # With rebuild=True, build cache (when enabled via
+        # sim/verilator/cache_dir) is used to skip unneeded recompilation
         if self.rebuild:
             log.info(f'Verilating...')
             build(self.top, self.outdir, postsynth=False, lang=self.lang)
@@ -304,20 +474,36 @@ class SimVerilated(CosimBase):
                 f'Verilator VCD dump to shared memory at 0x{self.shmid}')
 
         self.handlers = {}
-        for cp in self.in_cosim_ports:
-            self.handlers[cp.name] = CInputDrv(self.verilib, cp.port, cp.name)
+        if self.free_run:
+            self.verilib.run.argtypes = [ctypes.c_uint64]
+            self.verilib.run.restype = ctypes.c_uint64
+            self.verilib.set_fifo_depth.argtypes = [ctypes.c_uint]
+            self.verilib.set_fifo_depth(self.fifo_depth)
+            self.cycle_cnt = 0
+            self.model_cnt = 0
+            self.sync_needed = False
+
+            for cp in self.in_cosim_ports:
+                self.handlers[cp.name] = CInputFifoDrv(self, cp.port, cp.name)
+
+            for cp in self.out_cosim_ports:
+                self.handlers[cp.name] = COutputFifoDrv(self, cp.port, cp.name, self.fifo_depth)
+        else:
+            for cp in self.in_cosim_ports:
+                self.handlers[cp.name] = CInputDrv(self.verilib, cp.port, cp.name)
 
-        for cp in self.out_cosim_ports:
-            self.handlers[cp.name] = COutputDrv(self.verilib, cp.port, cp.name)
+            for cp in self.out_cosim_ports:
+                self.handlers[cp.name] = COutputDrv(self.verilib, cp.port, cp.name)
 
         super().setup()
 
     def _finish(self):
         if not self.finished:
 
-            if self.eval_needed:
-                self.verilib.forward()
-            self.verilib.cycle()
+            if not self.free_run:
+                if self.eval_needed:
+                    self.verilib.forward()
+                self.verilib.cycle()
 
             self.finished = True
             self.handlers.clear()
@@ -329,3 +515,16 @@ class SimVerilated(CosimBase):
                 self.verilib.final()
 
             self.verilib = None
+
+
+class VerilatorPlugin(SimPlugin):
+    @classmethod
+    def bind(cls):
+        reg.confdef('sim/verilator/cache_dir',
+                    default=None,
+                    docs='Directory of the Verilator build cache shared between the runs, '
+                    'e.g. "~/.cache/pygears/verilator". Cache is disabled when set to None')
+        reg.confdef('sim/verilator/cache_size',
+                    default=2 * 1024**3,
+                    docs='Maximum size of the Verilator build cache in bytes, after which '
+                    'least recently used builds are evicted. Set to None for unlimited size')
@@ -1,4 +1,5 @@
 import asyncio
+import heapq
 import itertools
 import logging
 import os
@@ -72,48 +73,111 @@ class SimFuture(asyncio.Future):
     __await__ = __iter__
 
 
-# A recursive function used by topo_sort
-def topo_sort_util(v, g, dag, visited, stack, cycle):
+def topo_sort(dag):
+    """Returns the vertices of the ``dag`` in topological order.
+
+    Iterative depth-first search which orders the vertices in reverse
+    postorder, visiting the roots in the ``dag`` insertion order and the
+    consumers in the order they are listed. This yields the same order as a
+    recursive DFS, but runs in O(V + E) and is not limited by the Python
+    recursion depth.
+
+    Raises:
+        SimCyclic: If the ``dag`` contains a cycle
+    """
 
-    # Mark the current node as visited.
-    visited[v] = True
-    cycle.append(g)
+    index = {g: i for i, g in enumerate(dag)}
+    nodes = list(dag)
+    succs = [[index[c] for c in dag[g]] for g in nodes]
 
-    # Recur for all the vertices adjacent to this vertex
-    for consumer in dag[g]:
-        i = list(dag.keys()).index(consumer)
-        if consumer in cycle:
-            index = cycle.index(consumer)
-            cycle.append(consumer)
-            raise SimCyclic('Simulation not possible, gear cycle found:'
-                            f' {" -> ".join([c.name for c in cycle[index:]])}')
+    # 0 - not visited, 1 - on the current DFS path, 2 - finished
+    state = [0] * len(nodes)
+    order = []
 
-        if not visited[i]:
-            topo_sort_util(i, consumer, dag, visited, stack, cycle)
+    for root in range(len(nodes)):
+        if state[root]:
+            continue
 
-    cycle.pop()
+        state[root] = 1
+        path = [root]
+        edge_pos = [0]
+
+        while path:
+            v = path[-1]
+            pos = edge_pos[-1]
+            v_succs = succs[v]
+
+            if pos < len(v_succs):
+                edge_pos[-1] = pos + 1
+                c = v_succs[pos]
+
+                if state[c] == 0:
+                    state[c] = 1
+                    path.append(c)
+                    edge_pos.append(0)
+                elif state[c] == 1:
+                    cycle = [nodes[i] for i in path[path.index(c):]]
+                    cycle.append(nodes[c])
+                    raise SimCyclic('Simulation not possible, gear cycle found:'
+                                    f' {" -> ".join([g.name for g in cycle])}')
+            else:
+                state[v] = 2
+                order.append(nodes[v])
+                path.pop()
+                edge_pos.pop()
 
-    # Push current vertex to stack which stores result
-    stack.insert(0, g)
+    order.reverse()
 
+    return order
 
-def topo_sort(dag):
-    # Mark all the vertices as not visited
-    visited = [False] * len(dag)
-    stack = []
 
-    # for i, g in enumerate(dag):
-    #     if not g.in_ports:
-    #         stack.append(g)
-    #         visited[i] = True
+class ReadyQueue:
+    """Set of ready sim gears, indexed by their position in the execution order.
+
+    Besides acting as a set, it maintains a heap of execution order keys of
+    the top level sim gears it contains (a gear can occupy several positions in
+    the execution order), which allows the
+    ``activity`` scheduler to visit only the gears that are actually ready.
+    Keys are negated for the back phase queue, so that the heap is always
+    popped in the order in which the gears should be visited.
+    """
+
+    __slots__ = ('_set', 'heap', 'order', 'sign')
+
+    def __init__(self, order, sign=1, gears=()):
+        self._set = set()
+        self.heap = []
+        self.order = order
+        self.sign = sign
+        for g in gears:
+            self.add(g)
+
+    def add(self, sim_gear):
+        if sim_gear in self._set:
+            return
+
+        self._set.add(sim_gear)
+        for index in self.order.get(sim_gear, ()):
+            heapq.heappush(self.heap, index * self.sign)
+
+    def discard(self, sim_gear):
+        # Heap entries are removed lazily, when they are popped
+        self._set.discard(sim_gear)
+
+    def remove(self, sim_gear):
+        self._set.remove(sim_gear)
+
+    def copy(self):
+        return set(self._set)
+
+    def __contains__(self, sim_gear):
+        return sim_gear in self._set
 
-    # Call the recursive helper function to store Topological
-    # Sort starting from all vertices one by one
-    for i, g in enumerate(dag):
-        if not visited[i]:
-            topo_sort_util(i, g, dag, visited, stack, [])
+    def __iter__(self):
+        return iter(self._set)
 
-    return stack
+    def __len__(self):
+        return len(self._set)
 
 
 def _get_consumer_tree_rec(root_intf, cur_intf, consumers):
@@ -171,7 +235,11 @@ def cosim(top, sim, *args, **kwds):
             kwds['rebuild'] = kwds.get('rebuild', True)
             timeout = kwds.pop('timeout', 100)
             sim_cls = SimVerilated
-            build(top, **kwds)
+            build(top,
+                  **{
+                      k: v
+                      for k, v in kwds.items() if k in ('outdir', 'postsynth', 'lang', 'rebuild')
+                  })
             kwds['rebuild'] = False
             kwds['timeout'] = timeout
         else:
@@ -266,10 +334,16 @@ class EventLoop(asyncio.events.AbstractEventLoop):
             'before_timestep': SimEvent(),
             'after_timestep': SimEvent(),
             'after_cleanup': SimEvent(),
+            'before_finish': SimEvent(),
             'after_finish': SimEvent(),
             'at_exit': SimEvent()
         }
 
+        # Registry paths written in the simulation loop
+        self.timestep_reg = reg.handle('sim/timestep')
+        self.current_module_reg = reg.handle('gear/current_module')
+        self.current_sim_reg = reg.handle('gear/current_sim')
+
     def get_debug(self):
         return False
 
@@ -343,10 +417,12 @@ class EventLoop(asyncio.events.AbstractEventLoop):
         if sim_gear.done:
             return
 
+        self.events['before_finish'](self, sim_gear)
+
         try:
             self.cur_gear = sim_gear.gear
-            reg['gear/current_module'] = self.cur_gear
-            reg['gear/current_sim'] = sim_gear
+            self.current_module_reg.set(self.cur_gear)
+            self.current_sim_reg.set(sim_gear)
             self.tasks[sim_gear].throw(GearDone)
         except (StopIteration, GearDone):
             pass
@@ -359,8 +435,8 @@ class EventLoop(asyncio.events.AbstractEventLoop):
         finally:
             self.events['after_finish'](self, sim_gear)
             self.cur_gear = reg['gear/root']
-            reg['gear/current_module'] = self.cur_gear
-            reg['gear/current_sim'] = sim_gear
+            self.current_module_reg.set(self.cur_gear)
+            self.current_sim_reg.set(sim_gear)
             self.remove(sim_gear)
 
     def run_gear(self, sim_gear, ready):
@@ -414,6 +490,21 @@ class EventLoop(asyncio.events.AbstractEventLoop):
         gear_reg['current_module'] = self.cur_gear
         gear_reg['current_sim'] = sim_gear
 
+    def sim_gear_tree(self, sim_gear, ready_dict):
+        if sim_gear in ready_dict:
+            self.maybe_run_gear(sim_gear, ready_dict)
+
+        if sim_gear.child:
+            unprocessed_children = True
+            while (unprocessed_children):
+                self.sim_list(sim_gear.child)
+
+                cur_child_num = len(sim_gear.child)
+                if sim_gear in ready_dict:
+                    self.maybe_run_gear(sim_gear, ready_dict)
+
+                unprocessed_children = cur_child_num < len(sim_gear.child)
+
     def sim_list(self, sim_gears):
         if self.phase == 'forward':
             ready_dict = self.forward_ready
@@ -422,19 +513,69 @@ class EventLoop(asyncio.events.AbstractEventLoop):
             ready_dict = self.back_ready
 
         for sim_gear in sim_gears:
-            if sim_gear in ready_dict:
-                self.maybe_run_gear(sim_gear, ready_dict)
+            self.sim_gear_tree(sim_gear, ready_dict)
 
-            if sim_gear.child:
-                unprocessed_children = True
-                while (unprocessed_children):
-                    self.sim_list(sim_gear.child)
+    def sim_queue(self):
+        """Visits ready top level sim gears in the execution order.
 
-                    cur_child_num = len(sim_gear.child)
-                    if sim_gear in ready_dict:
-                        self.maybe_run_gear(sim_gear, ready_dict)
+        Equivalent to the :meth:`sim_list` pass over the top level
+        ``sim_gears``, but touches only the gears that are ready and the gears
+        that have child sim gears. A gear which becomes ready after its turn
+        in the current pass has already passed stays in the queue for the next
+        pass.
+        """
 
-                    unprocessed_children = cur_child_num < len(sim_gear.child)
+        if self.phase == 'forward':
+            ready = self.forward_ready
+        else:
+            ready = self.back_ready
+
+        heap = ready.heap
+        sign = ready.sign
+        gears = self.exec_gears
+        parents = sorted(i * sign for i in self.exec_parents)
+        parent_pos = 0
+        deferred = set()
+        cursor = float('-inf')
+
+        while True:
+            while heap:
+                key = heap[0]
+                if key <= cursor:
+                    deferred.add(heapq.heappop(heap))
+                elif gears[key * sign] not in ready:
+                    heapq.heappop(heap)
+                else:
+                    break
+
+            while parent_pos < len(parents) and parents[parent_pos] <= cursor:
+                parent_pos += 1
+
+            if heap:
+                key = heap[0]
+                if parent_pos < len(parents) and parents[parent_pos] < key:
+                    key = parents[parent_pos]
+                else:
+                    heapq.heappop(heap)
+            elif parent_pos < len(parents):
+                key = parents[parent_pos]
+            else:
+                break
+
+            cursor = key
+            index = key * sign
+            sim_gear = gears[index]
+
+            self.sim_gear_tree(sim_gear, ready)
+
+            if sim_gear.child:
+                self.exec_parents.add(index)
+            else:
+                self.exec_parents.discard(index)
+
+        for key in deferred:
+            if gears[key * sign] in ready:
+                heapq.heappush(heap, key)
 
     def sim_loop(self, timeout):
         clk = reg['sim/clk_event']
@@ -444,7 +585,7 @@ class EventLoop(asyncio.events.AbstractEventLoop):
         gear_reg = reg['gear']
         sim_reg = reg['sim']
 
-        reg['sim/timestep'] = 0
+        self.timestep_reg.set(0)
 
         timestep = -1
         start_time = time.time()
@@ -455,7 +596,7 @@ class EventLoop(asyncio.events.AbstractEventLoop):
             finished = not bool(self.forward_ready or self.back_ready or self._schedule_to_finish)
 
             timestep += 1
-            reg['sim/timestep'] = timestep
+            self.timestep_reg.set(timestep)
             if (timeout is not None) and (timestep == timeout):
                 break
 
@@ -466,7 +607,7 @@ class EventLoop(asyncio.events.AbstractEventLoop):
             # print(f'Tasks: {len(self.tasks)}')
 
             self.phase = 'forward'
-            self.sim_list(self.sim_gears)
+            self.run_phase()
 
             self.phase = 'delta'
             delta.set()
@@ -478,7 +619,7 @@ class EventLoop(asyncio.events.AbstractEventLoop):
                     self._finish(sim_gear)
                     self._schedule_to_finish.remove(sim_gear)
 
-            self.sim_list(self.sim_gears)
+            self.run_phase()
 
             self.phase = 'cycle'
             self.events['before_timestep'](self, timestep)
@@ -522,8 +663,25 @@ class EventLoop(asyncio.events.AbstractEventLoop):
         self.insert_gears(simgear_exec_order(v.gears))
 
         self.wait_list = {}
-        self.forward_ready = set(self.sim_gears)
-        self.back_ready = set()
+
+        scheduler = reg['sim/scheduler']
+        if scheduler == 'hier':
+            self.run_phase = partial(self.sim_list, self.sim_gears)
+            self.forward_ready = set(self.sim_gears)
+            self.back_ready = set()
+        elif scheduler == 'activity':
+            self.exec_gears = self.sim_gears.copy()
+            self.exec_parents = set()
+            order = {}
+            for i, g in enumerate(self.exec_gears):
+                order.setdefault(g, []).append(i)
+
+            self.run_phase = self.sim_queue
+            self.forward_ready = ReadyQueue(order, gears=self.sim_gears)
+            self.back_ready = ReadyQueue(order, sign=-1)
+        else:
+            raise Exception(f"Unsupported simulation scheduler: {scheduler}")
+
         self._schedule_to_finish = set()
         self.done = set()
 
@@ -652,6 +810,9 @@ class SimPlugin(GearPlugin):
         reg['sim/dryrun'] = False
         reg.confdef('sim/rand_seed', None)
         reg.confdef('sim/clk_freq', 1000)
+        reg.confdef('sim/scheduler', 'hier')
+        reg.confdef('sim/tlm', False)
+        reg.confdef('sim/tlm_depth', 64)
         reg.confdef('results-dir', default=tempfile.mkdtemp())
         reg.confdef('sim/extens', default=[])
 
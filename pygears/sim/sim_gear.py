@@ -92,6 +92,7 @@ class SimGear:
                                             f"inside '{self.gear.name}': {repr(e)}",
                                             self.async_gen.ag_frame.f_lineno,
                                             filename=fn)
+                                        err.gear_trace = self.gear.trace
 
                                         traceback = make_traceback((SimulationError, err, sys.exc_info()[2]))
                                         exc_type, exc_value, tb = traceback.standard_exc_info
@@ -36,7 +36,7 @@ class ArrayType(EnumerableGenericMeta):
 
     @property
     def width(self):
-        return sum(f.width for f in self)
+        return self.layout.width
 
     # TODO: Remove this
     @property
@@ -166,12 +166,11 @@ class Array(list, metaclass=ArrayType):
         return super().__hash__()
 
     def code(self):
-        w_dtype = type(self).data.width
+        layout = type(self).layout
         ret = 0
-        for d in reversed(self):
-            ret <<= w_dtype
+        for d, offset, mask in zip(self, layout.offsets, layout.masks):
             if d is not None:
-                ret |= d.code()
+                ret |= (d.code() & mask) << offset
 
         return ret
 
@@ -181,14 +180,13 @@ class Array(list, metaclass=ArrayType):
 
     @classmethod
     def decode(cls, val):
-        ret = []
+        layout = cls.layout
         val = int(val)
-        mask = int(cls.data.width * '1', 2)
-        for t in cls:
-            ret.append(t.decode(val & mask))
-            val >>= t.width
 
-        return cls(ret)
+        return cls([
+            t.decode((val >> offset) & mask)
+            for t, offset, mask in zip(layout.types, layout.offsets, layout.masks)
+        ])
 
     @class_and_instance_method
     def copy(self):
@@ -185,6 +185,42 @@ class class_and_instance_method:
         return self.func.__get__(instance, cls)
 
 
+class TypeLayout:
+    """Flat bit layout of a specified type, computed once per type and cached
+    in its ``layout`` attribute.
+
+    Attributes:
+        width: Total bit width of the type
+        mask: Bit mask of the total width
+        types: Types of the fields, in the order they are packed starting from
+          the least significant bit
+        offsets: Bit offset of each field within the packed representation
+        widths: Bit width of each field
+        masks: Bit mask of each field, not shifted by its offset
+    """
+
+    __slots__ = ('width', 'mask', 'types', 'offsets', 'widths', 'masks')
+
+    def __init__(self, width, types=()):
+        self.width = width
+        self.mask = (1 << width) - 1
+        self.types = tuple(types)
+        self.widths = tuple(t.width for t in self.types)
+        self.masks = tuple((1 << w) - 1 for w in self.widths)
+
+        offsets = []
+        offset = 0
+        for w in self.widths:
+            offsets.append(offset)
+            offset += w
+
+        self.offsets = tuple(offsets)
+
+    def __repr__(self):
+        return (f'TypeLayout(width={self.width}, offsets={self.offsets}, '
+                f'widths={self.widths})')
+
+
 class GenericMeta(TypingMeta):
     """Base class for all types that have a generic parameter.
     """
@@ -192,6 +228,7 @@ class GenericMeta(TypingMeta):
     _hash = None
     _base = None
     _specified = None
+    _layout = None
 
     @classmethod
     @functools.lru_cache(maxsize=None)
@@ -223,7 +260,8 @@ class GenericMeta(TypingMeta):
                 '_hash': None,
                 '_base': base,
                 '_specified': None,
-                '_args': None
+                '_args': None,
+                '_layout': None
             })
 
         res = super().__new__(cls, name, bases, namespace)
@@ -499,6 +537,13 @@ searched recursively. Each template is reported only once.
     #     return all(s == o for s, o in zip(self.args, other.args))
 
 
+@functools.lru_cache(maxsize=None)
+def compile_param(expr):
+    """Returns the compiled code of the template parameter expression, so
+    that each expression is parsed only once."""
+    return compile(expr, '<string>', 'eval')
+
+
 def param_subs(t, matches, namespace):
     t_orig = t
 
@@ -512,7 +557,7 @@ def param_subs(t, matches, namespace):
 
         err = None
         try:
-            return eval(t, namespace, matches)
+            return eval(compile_param(t), namespace, matches)
         except Exception as e:
             err = e
 
@@ -545,12 +590,40 @@ class EnumerableGenericMeta(GenericMeta):
         3
         """
         if self.specified:
-            return sum(map(int, self))
+            return self.layout.width
         else:
             raise Exception(
                 f"Cannot evaluate width of unspecified generic type"
                 f" {type_repr(self)}")
 
+    @property
+    def layout(self):
+        """Returns the :class:`TypeLayout` of the type, which is calculated
+        on the first access and cached afterwards.
+
+        >>> Tuple[Uint[1], Uint[2]].layout.offsets
+        (0, 1)
+        """
+        if self._layout is None:
+            types = tuple(self)
+            self._layout = TypeLayout(sum(t.width for t in types), types)
+
+        return self._layout
+
+    def encode_array(self, arr, overflow='error'):
+        """Packs a NumPy array of values of the type into an array of their
+        integer representations. See :func:`pygears.typing.bulk.encode_array`.
+        """
+        from .bulk import encode_array
+        return encode_array(self, arr, overflow)
+
+    def decode_array(self, codes):
+        """Unpacks a NumPy array of integer representations into an array of
+        values of the type. See :func:`pygears.typing.bulk.decode_array`.
+        """
+        from .bulk import decode_array
+        return decode_array(self, codes)
+
     def __len__(self):
         """The number of elements type generates when iterated.
 
@@ -613,3 +686,70 @@ def typeof(obj, t):
 
 def is_type(obj):
     return isinstance(obj, TypingMeta)
+
+
+class IdentityCache(dict):
+    """Cache keyed by the identities of the PyGears types.
+
+    Types compare equal whenever their hashes match (i.e. :class:`Bool` and
+    ``Uint[1]``), and the composite types built from the equal types may even
+    be the same object, so a regular dictionary would return the result
+    computed for a different type. The entries are therefore keyed by the ids
+    of the key objects, and keep the references to these objects so that their
+    ids cannot be reused while the entry exists.
+
+    Lookups are made on the hot paths, so they are left to the callers: the
+    key is the tuple of the ids of the key objects, and the value is found at
+    the index 0 of the entry, i.e. ``cache.get((id(a), id(b)))[0]``.
+    """
+    def store(self, value, *objs):
+        """Stores the value for the key objects and returns it."""
+        self[tuple(map(id, objs))] = (value, objs)
+        return value
+
+
+# Results of the type operators. See cached_type_op()
+_type_op_results = IdentityCache()
+
+# Shift amounts used as the keys of _type_op_results, interned so that the
+# equal amounts share the identity
+_shift_amounts = {}
+
+
+def cached_type_op(op):
+    """Decorator for the unary and binary operators of the type classes, which
+    caches the result type of the operator per operand types.
+
+    Binary operators are cached only if the second operand is a type or a
+    plain ``int`` (i.e. a shift amount), and the exceptions raised by the
+    operator are not cached.
+    """
+    if op.__code__.co_argcount == 1:
+
+        @functools.wraps(op)
+        def unary_op(self):
+            entry = _type_op_results.get((id(op), id(self)))
+            if entry is not None:
+                return entry[0]
+
+            return _type_op_results.store(op(self), op, self)
+
+        return unary_op
+
+    @functools.wraps(op)
+    def binary_op(self, other):
+        entry = _type_op_results.get((id(op), id(self), id(other)))
+        if entry is not None:
+            return entry[0]
+
+        if type(other) is int:
+            other = _shift_amounts.setdefault(other, other)
+            entry = _type_op_results.get((id(op), id(self), id(other)))
+            if entry is not None:
+                return entry[0]
+        elif not isinstance(other, TypingMeta):
+            return op(self, other)
+
+        return _type_op_results.store(op(self, other), op, self, other)
+
+    return binary_op
@@ -0,0 +1,222 @@
+"""Packs and unpacks whole NumPy arrays of values of the specified PyGears
+type at once, without constructing the PyGears object for each of the values.
+
+Packed representation of the types up to 64 bits wide is held in the
+``numpy.uint64`` arrays, while the arrays of Python integers (``object``
+arrays) are used for the wider types.
+
+Unpacked values are held in the arrays of the following NumPy types:
+
+- :class:`Uint` and :class:`Int`: smallest unsigned or signed integer type
+  that fits the width, or ``object`` for types wider than 64 bits
+- :class:`Fixp` and :class:`Ufixp`: ``float64``
+- :class:`Tuple`, :class:`Queue` and :class:`Union`: structured type with the
+  same field names
+- :class:`Array`: subarray of the element type
+
+Module requires NumPy, which is not a dependency of the PyGears itself.
+"""
+
+import numpy as np
+
+from .array import Array
+from .base import typeof
+from .fixp import Fixpnumber
+from .queue import Queue
+from .tuple import Tuple
+from .uint import Integer
+from .union import Union
+from .unit import Unit
+
+OVERFLOW_MODES = ('error', 'saturate', 'wrap')
+
+
+def is_wide(dtype):
+    return dtype.width > 64
+
+
+def np_dtype(dtype):
+    """Returns the NumPy type used to hold the unpacked values of the
+    ``dtype``.
+
+    >>> np_dtype(Tuple[{'x': Int[8], 'y': Ufixp[4, 8]}])
+    dtype([('x', 'i1'), ('y', '<f8')])
+    """
+    if typeof(dtype, Fixpnumber):
+        return np.dtype(np.float64)
+    elif typeof(dtype, Integer):
+        if is_wide(dtype):
+            return np.dtype(object)
+
+        size = max(8, 1 << (max(dtype.width, 1) - 1).bit_length())
+        return np.dtype(f'{"i" if dtype.signed else "u"}{size // 8}')
+    elif typeof(dtype, Unit):
+        return np.dtype(np.uint8)
+    elif typeof(dtype, Array):
+        return np.dtype((np_dtype(dtype.data), (len(dtype), )))
+    elif typeof(dtype, (Tuple, Queue, Union)):
+        return np.dtype([(f, np_dtype(t)) for f, t in zip(dtype.fields, dtype)])
+
+    raise TypeError(f'Bulk encoding not supported for the type "{repr(dtype)}"')
+
+
+def code_array(dtype, arr):
+    if is_wide(dtype):
+        return np.array(arr, dtype=object)
+
+    return np.asarray(arr).astype(np.uint64)
+
+
+def shift_left(dtype, codes, offset):
+    if is_wide(dtype):
+        return codes << offset
+
+    return codes << np.uint64(offset)
+
+
+def fields(dtype):
+    if typeof(dtype, Array):
+        # Array elements are held in the last dimension
+        return [None] * len(dtype)
+
+    return dtype.fields
+
+
+def field(arr, i, name):
+    if name is not None and arr.dtype.names is not None:
+        return arr[name]
+
+    return arr[..., i]
+
+
+def mask_array(dtype, codes, mask):
+    if is_wide(dtype):
+        return codes & mask
+
+    return codes & np.uint64(mask)
+
+
+def encode_int(dtype, arr, overflow):
+    if dtype.signed:
+        vmin, vmax = -(1 << (dtype.width - 1)), (1 << (dtype.width - 1)) - 1
+    else:
+        vmin, vmax = 0, (1 << dtype.width) - 1
+
+    if typeof(dtype, Fixpnumber):
+        arr = np.asarray(arr, dtype=np.float64) * (2.0**dtype.fract)
+        if dtype.width > 52:
+            arr = np.array([round(v) for v in arr.flat], dtype=object).reshape(arr.shape)
+        else:
+            arr = np.round(arr).astype(np.int64)
+    else:
+        arr = np.asarray(arr)
+        # Python integers too wide for the NumPy types are held in the object
+        # arrays
+        wide_ints = dtype.width >= 63 and arr.dtype.kind == 'O' and all(
+            isinstance(v, (int, np.integer)) for v in arr.flat)
+
+        if arr.dtype.kind not in 'iub' and not wide_ints:
+            raise TypeError(f'Cannot encode values of the NumPy type "{arr.dtype}"'
+                            f' as "{repr(dtype)}"')
+
+        arr = arr.astype(object if dtype.width >= 63 else np.int64)
+
+    if overflow == 'error':
+        over = (arr < vmin) | (arr > vmax)
+        if over.any():
+            raise ValueError(f"{repr(dtype)} cannot represent value '{arr[over].flat[0]}'")
+    elif overflow == 'saturate':
+        arr = np.clip(arr, vmin, vmax)
+
+    return code_array(dtype, arr & dtype.layout.mask)
+
+
+def encode_rec(dtype, arr, overflow):
+    if typeof(dtype, (Integer, Fixpnumber)):
+        return encode_int(dtype, arr, overflow)
+    elif typeof(dtype, Unit):
+        return code_array(dtype, np.zeros(np.shape(arr), dtype=np.uint64))
+    elif typeof(dtype, (Tuple, Queue, Union, Array)):
+        arr = np.asarray(arr)
+        layout = dtype.layout
+        codes = None
+        for i, (f, t, offset) in enumerate(zip(fields(dtype), layout.types, layout.offsets)):
+            fcodes = encode_rec(t, field(arr, i, f), overflow)
+            if is_wide(dtype):
+                fcodes = fcodes.astype(object)
+
+            fcodes = shift_left(dtype, fcodes, offset)
+            codes = fcodes if codes is None else codes | fcodes
+
+        return codes
+
+    raise TypeError(f'Bulk encoding not supported for the type "{repr(dtype)}"')
+
+
+def encode_array(dtype, arr, overflow='error'):
+    """Packs an array of values into an array of their integer
+    representations. Equivalent to calling ``dtype(v).code()`` for each value
+    ``v`` in the array.
+
+    Args:
+        dtype: Specified PyGears type of the values
+        arr: Array of values. Arrays with the structured NumPy type (see
+          :func:`np_dtype`) or the arrays with the fields in the last
+          dimension are accepted for the composite types.
+        overflow: What to do when a value cannot be represented by its type:
+          ``error`` raises ValueError, ``saturate`` clips the value to the
+          type range and ``wrap`` keeps only the lower bits of the value
+
+    >>> encode_array(Int[4], np.array([-1, 2, 9]), overflow='wrap')
+    array([15,  2,  9], dtype=uint64)
+    """
+    if overflow not in OVERFLOW_MODES:
+        raise ValueError(f'Unknown overflow mode "{overflow}", expected one of {OVERFLOW_MODES}')
+
+    return encode_rec(dtype, arr, overflow)
+
+
+def decode_rec(dtype, codes, out):
+    if typeof(dtype, (Integer, Fixpnumber)):
+        vals = mask_array(dtype, codes, dtype.layout.mask)
+        if dtype.signed:
+            if not is_wide(dtype):
+                # Conversion already sign extends the 64 bit values
+                vals = vals.astype(np.int64)
+
+            if dtype.width < 64 or is_wide(dtype):
+                vals = vals - ((vals & (1 << (dtype.width - 1))) << 1)
+
+        if typeof(dtype, Fixpnumber):
+            vals = vals.astype(np.float64) / (2.0**dtype.fract)
+
+        out[...] = vals
+    elif typeof(dtype, Unit):
+        out[...] = 0
+    elif typeof(dtype, (Tuple, Queue, Union, Array)):
+        layout = dtype.layout
+        for i, (f, t, offset) in enumerate(zip(fields(dtype), layout.types, layout.offsets)):
+            if is_wide(dtype):
+                fcodes = (codes >> offset) & layout.masks[i]
+                if not is_wide(t):
+                    fcodes = fcodes.astype(np.uint64)
+            else:
+                fcodes = mask_array(t, codes >> np.uint64(offset), layout.masks[i])
+
+            decode_rec(t, fcodes, field(out, i, f))
+    else:
+        raise TypeError(f'Bulk encoding not supported for the type "{repr(dtype)}"')
+
+
+def decode_array(dtype, codes):
+    """Unpacks an array of the integer representations into an array of
+    values, held in the NumPy type given by :func:`np_dtype`. Equivalent to
+    calling ``dtype.decode(c)`` for each code ``c`` in the array.
+
+    >>> decode_array(Tuple[Int[4], Uint[4]], np.array([0x2f, 0x12]))
+    array([(-1, 2), ( 2, 1)], dtype=[('f0', 'i1'), ('f1', 'u1')])
+    """
+    codes = code_array(dtype, codes)
+    out = np.empty(codes.shape, dtype=np_dtype(dtype))
+    decode_rec(dtype, codes, out)
+    return out
@@ -1,5 +1,5 @@
 # from pygears.conf import safe_bind
-from pygears.typing.base import typeof, is_type
+from pygears.typing.base import IdentityCache, typeof, is_type
 from . import Array, Int, Integer, Queue, Tuple, Uint, Union, Maybe, Any
 from . import Fixpnumber, Float, Number, Ufixp, Fixp, Unit, Integral
 # from pygears.conf.log import gear_log
@@ -405,8 +405,11 @@ type_cast_resolvers = {
 }
 
 
-def type_cast(dtype, cast_type):
+# Resolved type casts, keyed by the source and the cast types
+type_cast_cache = IdentityCache()
+
 
+def resolve_type_cast(dtype, cast_type):
     if dtype == cast_type:
         return dtype
 
@@ -420,144 +423,186 @@ def type_cast(dtype, cast_type):
     raise TypeError(f"Cannot cast '{repr(dtype)}' to '{repr(cast_type)}'")
 
 
-def integer_value_cast_resolver(val, cast_type):
-    if isinstance(val, int):
-        return cast_type(val)
+def type_cast(dtype, cast_type):
+    entry = type_cast_cache.get((id(dtype), id(cast_type)))
+    if entry is not None:
+        return entry[0]
 
-    if typeof(type(val), Integer):
-        if not cast_type.specified:
-            cast_type = cast_type[val.width]
+    res = resolve_type_cast(dtype, cast_type)
 
-        tout_range = (1 << int(cast_type))
-        val = int(val) & (tout_range - 1)
+    if isinstance(dtype, type) and isinstance(cast_type, type):
+        type_cast_cache.store(res, dtype, cast_type)
 
-        if typeof(cast_type, Int):
-            max_uint = tout_range / 2 - 1
-            if val > max_uint:
-                val -= tout_range
+    return res
 
-        return cast_type(val)
 
-    raise get_value_error(val, cast_type)
+def identity(val):
+    return val
 
 
-def uint_value_cast_resolver(val, cast_type):
-    val_type = type(val)
-    if not is_type(val_type) and isinstance(val, (int, float)):
-        return cast_type(int(val))
+def value_error_converter(cast_type):
+    def convert(val):
+        raise get_value_error(val, cast_type)
+
+    return convert
+
+
+def elementwise_converter(cast_type):
+    """Returns the converter that casts each element of the value to the
+    corresponding element type of the ``cast_type``."""
+    elem_types = tuple(cast_type)
+
+    def convert(val):
+        return cast_type(tuple([value_cast(v, t) for v, t in zip(val, elem_types)]))
+
+    return convert
+
+
+def integer_value_converter(val_type, cast_type):
+    if issubclass(val_type, int):
+        return cast_type
+
+    return value_error_converter(cast_type)
+
+
+def fixp_to_integer_converter(val_type, cast_type):
+    fract = val_type.fract
+
+    if fract >= 0:
+        return lambda val: cast_type.decode(val.code() >> fract)
+    else:
+        return lambda val: cast_type.decode(val.code() << (-fract))
+
+
+def uint_value_converter(val_type, cast_type):
+    if not is_type(val_type) and issubclass(val_type, (int, float)):
+        return lambda val: cast_type(int(val))
 
     cast_type = uint_type_cast_resolver(val_type, cast_type)
 
     if typeof(val_type, Ufixp):
-        if val_type.fract >= 0:
-            return cast_type.decode(val.code() >> val_type.fract)
-        else:
-            return cast_type.decode(val.code() << (-val_type.fract))
+        return fixp_to_integer_converter(val_type, cast_type)
 
     if typeof(val_type, Uint):
-        return cast_type(val)
+        # Resolved type can hold all the values of the source type, so
+        # the plain int can take the fast path of the type constructor
+        return lambda val: cast_type(int(val))
 
-    raise get_value_error(val, cast_type)
+    return value_error_converter(cast_type)
 
 
-def int_value_cast_resolver(val, cast_type):
-    val_type = type(val)
-    if not is_type(val_type) and isinstance(val, (int, float)):
-        return cast_type(int(val))
+def int_value_converter(val_type, cast_type):
+    if not is_type(val_type) and issubclass(val_type, (int, float)):
+        return lambda val: cast_type(int(val))
 
     cast_type = int_type_cast_resolver(val_type, cast_type)
 
     if typeof(val_type, Fixpnumber):
-        if val_type.fract >= 0:
-            return cast_type.decode(val.code() >> val_type.fract)
-        else:
-            return cast_type.decode(val.code() << (-val_type.fract))
+        return fixp_to_integer_converter(val_type, cast_type)
 
     if typeof(val_type, Integer):
-        return cast_type(val)
+        # Resolved type can hold all the values of the source type, so
+        # the plain int can take the fast path of the type constructor
+        return lambda val: cast_type(int(val))
 
-    raise get_value_error(val, cast_type)
+    return value_error_converter(cast_type)
 
 
-def plain_int_value_cast_resolver(val, cast_type):
-    return int(val)
+def plain_int_value_converter(val_type, cast_type):
+    return int
 
 
-def tuple_value_cast_resolver(val, cast_type):
-    if (isinstance(val, (list, tuple, dict)) and not is_type(type(val))
+def tuple_value_converter(val_type, cast_type):
+    if (issubclass(val_type, (list, tuple, dict)) and not is_type(val_type)
             and not cast_type.specified):
-        return cast_type(val)
+        return cast_type
 
-    val_type = type(val)
-    cast_type = tuple_type_cast_resolver(val_type, cast_type)
+    return elementwise_converter(tuple_type_cast_resolver(val_type, cast_type))
 
-    return cast_type(tuple(cast(v, ct) for v, ct in zip(val, cast_type)))
 
+def array_value_converter(val_type, cast_type):
+    return elementwise_converter(array_type_cast_resolver(val_type, cast_type))
 
-def array_value_cast_resolver(val, cast_type):
-    val_type = type(val)
-    cast_type = array_type_cast_resolver(val_type, cast_type)
 
-    return cast_type(tuple(cast(v, t) for v, t in zip(val, cast_type)))
+def union_value_converter(val_type, cast_type):
+    cast_type = union_type_cast_resolver(val_type, cast_type)
+    data_type = cast_type.data
+    ctrl_type = cast_type.ctrl
 
+    def convert(val):
+        return cast_type((data_type(val[0].code()), ctrl_type(val[1])))
 
-def union_value_cast_resolver(val, cast_type):
-    val_type = type(val)
-    cast_type = union_type_cast_resolver(val_type, cast_type)
+    return convert
 
-    data = cast_type.data(val[0].code())
-    ctrl = cast_type.ctrl(val[1])
-    return cast_type((data, ctrl))
 
+def queue_value_converter(val_type, cast_type):
+    return elementwise_converter(queue_type_cast_resolver(val_type, cast_type))
 
-def queue_value_cast_resolver(val, cast_type):
-    val_type = type(val)
-    cast_type = queue_type_cast_resolver(val_type, cast_type)
 
-    return cast_type(tuple(cast(v, t) for v, t in zip(val, cast_type)))
+def fixpnumber_value_converter(val_type, cast_type):
+    return fixpnumber_type_cast_resolver(val_type, cast_type)
 
 
-def fixpnumber_value_cast_resolver(val, cast_type):
-    val_type = type(val)
-    cast_type = fixpnumber_type_cast_resolver(val_type, cast_type)
+def float_value_converter(val_type, cast_type):
+    if typeof(val_type, (int, float, Number)):
+        return cast_type
 
-    return cast_type(val)
+    def convert(val):
+        raise Exception(f'Only numbers can be converted to Float, not {val} of the type'
+                        f' {repr(type(val))}')
+
+    return convert
+
+
+value_converters = {
+    Uint: uint_value_converter,
+    Int: int_value_converter,
+    Integer: integer_value_converter,
+    Tuple: tuple_value_converter,
+    Array: array_value_converter,
+    Union: union_value_converter,
+    Float: float_value_converter,
+    float: float_value_converter,
+    Fixpnumber: fixpnumber_value_converter,
+    Queue: queue_value_converter,
+    int: plain_int_value_converter,
+    Any: lambda val_type, cast_type: identity
+}
 
 
-def float_value_cast_resolver(val, cast_type):
-    if typeof(type(val), (int, float, Number)):
-        return cast_type(val)
+def value_converter(val_type, cast_type):
+    """Returns the function that casts the values of the type ``val_type`` to
+    the ``cast_type``. Type errors are raised here, while the errors that
+    report the offending value are raised by the returned function."""
+    if val_type == cast_type:
+        return identity
 
-    raise Exception(f'Only numbers can be converted to Float, not {val} of the type'
-                    f' {repr(type(val))}')
+    for templ in value_converters:
+        if typeof(cast_type, templ):
+            return value_converters[templ](val_type, cast_type)
 
+    def convert(val):
+        raise ValueError(f"Type '{repr(cast_type)}' unsupported, cannot cast value '{val}' "
+                         f"of type '{repr(type(val))}'")
 
-value_cast_resolvers = {
-    Uint: uint_value_cast_resolver,
-    Int: int_value_cast_resolver,
-    Integer: integer_value_cast_resolver,
-    Tuple: tuple_value_cast_resolver,
-    Array: array_value_cast_resolver,
-    Union: union_value_cast_resolver,
-    Float: float_value_cast_resolver,
-    float: float_value_cast_resolver,
-    Fixpnumber: fixpnumber_value_cast_resolver,
-    Queue: queue_value_cast_resolver,
-    int: plain_int_value_cast_resolver,
-    Any: lambda val, cast_type: val
-}
+    return convert
+
+
+# Value converters, keyed by the value type and the cast type
+value_converter_cache = IdentityCache()
 
 
 def value_cast(val, cast_type):
-    if type(val) == cast_type:
-        return val
+    val_type = type(val)
+    entry = value_converter_cache.get((id(val_type), id(cast_type)))
+    if entry is not None:
+        return entry[0](val)
 
-    for templ in value_cast_resolvers:
-        if typeof(cast_type, templ):
-            return value_cast_resolvers[templ](val, cast_type)
+    convert = value_converter(val_type, cast_type)
+    if isinstance(cast_type, type):
+        value_converter_cache.store(convert, val_type, cast_type)
 
-    raise ValueError(f"Type '{repr(cast_type)}' unsupported, cannot cast value '{val}' "
-                     f"of type '{repr(type(val))}'")
+    return convert(val)
 
 
 def cast(data, cast_type):
@@ -0,0 +1,253 @@
+"""Generates specialized functions for packing and unpacking the values of the
+specified PyGears types.
+
+Methods :meth:`code` and :meth:`decode` of the composite types process the
+values recursively, calling the methods of the subtypes and constructing the
+intermediate objects at each level. For the hot paths of the simulator (i.e.
+cosimulation drivers and VCD tracing) where the same type is packed and
+unpacked over and over, straight-line Python functions are generated and
+compiled once per type instead:
+
+>>> enc = encoder(Tuple[Uint[8], Int[4]])
+>>> print(enc.__source__)
+def encode(val):
+    v0, v1 = val
+    return (int(v0) & 0xff) | ((int(v1) & 0xf) << 8)
+"""
+
+import functools
+import itertools
+
+from .array import Array
+from .base import IdentityCache, typeof
+from .fixp import Fixp, Fixpnumber
+from .float import Float
+from .queue import Queue
+from .tuple import Tuple
+from .uint import Int, Integer, Uint
+from .union import Union
+from .unit import Unit
+
+
+def cached_per_type(func):
+    """Caches the codec function generated for each type."""
+    cache = IdentityCache()
+
+    @functools.wraps(func)
+    def wrapper(dtype):
+        entry = cache.get((id(dtype), ))
+        if entry is not None:
+            return entry[0]
+
+        return cache.store(func(dtype), dtype)
+
+    wrapper.cache_clear = cache.clear
+    return wrapper
+
+
+class CodecGen:
+    """Builds the source of a single codec function, keeping track of the
+    temporary variable names and of the objects the generated code needs to
+    reference."""
+    def __init__(self):
+        self.lines = []
+        self.namespace = {}
+        self.var_cnt = itertools.count()
+        self.obj_cnt = itertools.count()
+
+    def var(self):
+        return f'v{next(self.var_cnt)}'
+
+    def obj(self, val):
+        name = f'_o{next(self.obj_cnt)}'
+        self.namespace[name] = val
+        return name
+
+    def unpack(self, dtype, var):
+        """Unpacks the composite value into the list of its field variables."""
+        layout = dtype.layout
+        fields = [self.var() for _ in layout.types]
+        if len(fields) == 1:
+            self.lines.append(f'{fields[0]}, = {var}')
+        elif fields:
+            self.lines.append(f'{", ".join(fields)} = {var}')
+
+        if typeof(dtype, Array):
+            # Array elements are allowed to be None, which is packed as zero
+            for f, t in zip(fields, layout.types):
+                self.lines.append(f'if {f} is None: {f} = {self.obj(t.decode(0))}')
+
+        return fields
+
+    def compile(self, name, arg, ret):
+        body = [f'    {line}' for line in self.lines]
+        src = '\n'.join([f'def {name}({arg}):', *body, f'    return {ret}', ''])
+
+        exec(compile(src, f'<codec-{name}>', 'exec'), self.namespace)
+        func = self.namespace[name]
+        func.__source__ = src
+        return func
+
+
+def is_leaf(dtype):
+    return typeof(dtype, (Integer, Fixpnumber)) or not typeof(dtype,
+                                                              (Tuple, Queue, Array, Union))
+
+
+def encode_terms(gen, dtype, var, offset, terms):
+    if dtype.width == 0:
+        return
+
+    if not is_leaf(dtype):
+        layout = dtype.layout
+        fields = gen.unpack(dtype, var)
+        for f, t, o in zip(fields, layout.types, layout.offsets):
+            encode_terms(gen, t, f, offset + o, terms)
+
+        return
+
+    if typeof(dtype, (Integer, Fixpnumber)):
+        expr = f'int({var}) & {hex(dtype.layout.mask)}'
+    else:
+        expr = f'{var}.code() & {hex((1 << dtype.width) - 1)}'
+
+    if offset:
+        expr = f'({expr}) << {offset}'
+
+    terms.append(f'({expr})')
+
+
+def decode_expr(gen, dtype, var, offset):
+    if dtype.width == 0:
+        return gen.obj(dtype.decode(0))
+
+    if offset:
+        raw = f'(({var} >> {offset}) & {hex((1 << dtype.width) - 1)})'
+    else:
+        raw = f'({var} & {hex((1 << dtype.width) - 1)})'
+
+    if typeof(dtype, (Int, Fixp)):
+        v = gen.var()
+        gen.lines.append(f'{v} = {raw}')
+        sign = 1 << (dtype.width - 1)
+        return f'_int_new({gen.obj(dtype)}, {v} - (({v} & {hex(sign)}) << 1))'
+    elif typeof(dtype, (Uint, Fixpnumber)):
+        return f'_int_new({gen.obj(dtype)}, {raw})'
+    elif typeof(dtype, Union):
+        # Only the bits of the data field used by the active subtype are kept,
+        # so the mask is selected by the value of the ctrl field at run time
+        layout = dtype.layout
+        data, ctrl = gen.var(), gen.var()
+        gen.lines.append(f'{data} = {var} >> {offset}' if offset else f'{data} = {var}')
+        gen.lines.append(f'{ctrl} = ({data} >> {layout.offsets[1]}) & {hex(layout.masks[1])}')
+        if len(dtype.types) <= layout.masks[1]:
+            gen.lines.append(
+                f'if {ctrl} >= {len(dtype.types)}: _ctrl_error({gen.obj(dtype)}, {ctrl})')
+
+        masks = gen.obj(tuple((1 << t.width) - 1 for t in dtype.types))
+        data_t, ctrl_t = (gen.obj(t) for t in layout.types)
+        return (f'_tuple_new({gen.obj(dtype)}, (_int_new({data_t}, {data} & {masks}[{ctrl}]),'
+                f' _int_new({ctrl_t}, {ctrl})))')
+    elif typeof(dtype, (Tuple, Queue)):
+        layout = dtype.layout
+        fields = [
+            decode_expr(gen, t, var, offset + o) for t, o in zip(layout.types, layout.offsets)
+        ]
+        return f'_tuple_new({gen.obj(dtype)}, ({", ".join(fields)}, ))'
+    elif typeof(dtype, Array):
+        layout = dtype.layout
+        fields = [
+            decode_expr(gen, t, var, offset + o) for t, o in zip(layout.types, layout.offsets)
+        ]
+        return f'_array_new({gen.obj(dtype)}, [{", ".join(fields)}])'
+    else:
+        return f'{gen.obj(dtype)}.decode({raw})'
+
+
+def _ctrl_error(dtype, ctrl):
+    raise ValueError(f"{repr(dtype)} has no subtype for the ctrl value '{ctrl}'")
+
+
+def _array_new(cls, val):
+    ret = list.__new__(cls)
+    list.__init__(ret, val)
+    return ret
+
+
+@cached_per_type
+def encoder(dtype):
+    """Returns a function which packs an instance of the ``dtype`` into its
+    integer representation. The result is the same as with :meth:`code`
+    method, but the whole structure is packed in a single call.
+
+    >>> encoder(Queue[Uint[4]])(Queue[Uint[4]]((2, 1)))
+    18
+    """
+    gen = CodecGen()
+    terms = []
+    encode_terms(gen, dtype, 'val', 0, terms)
+    return gen.compile('encode', 'val', ' | '.join(terms) or '0')
+
+
+@cached_per_type
+def decoder(dtype):
+    """Returns a function which unpacks the integer representation into an
+    instance of the ``dtype``. The result is the same as with
+    :meth:`decode` method, but no intermediate objects are constructed. Bits
+    of the :class:`Union` data field that are not used by the active subtype
+    are ignored.
+
+    >>> decoder(Queue[Uint[4]])(18)
+    (Uint[4](2), Uint[1](1))
+    """
+    gen = CodecGen()
+    gen.namespace.update(_int_new=int.__new__,
+                         _tuple_new=tuple.__new__,
+                         _array_new=_array_new,
+                         _ctrl_error=_ctrl_error)
+    gen.lines.append('val = int(val)')
+    ret = decode_expr(gen, dtype, 'val', 0)
+    return gen.compile('decode', 'val', ret)
+
+
+def leaf_types(dtype):
+    """Returns the list of types of all leaf fields of the ``dtype``, in the
+    order in which they are packed.
+
+    >>> leaf_types(Tuple[Uint[2], Queue[Int[4]]])
+    [Uint[2], Int[4], Uint[1]]
+    """
+    if is_leaf(dtype):
+        return [dtype]
+
+    return [t for sub in dtype.layout.types for t in leaf_types(sub)]
+
+
+def field_terms(gen, dtype, var, terms):
+    if not is_leaf(dtype):
+        for f, t in zip(gen.unpack(dtype, var), dtype.layout.types):
+            field_terms(gen, t, f, terms)
+    elif typeof(dtype, Float):
+        terms.append(f'float({var})')
+    elif typeof(dtype, Unit):
+        terms.append('0')
+    elif typeof(dtype, (Integer, Fixpnumber)):
+        terms.append(f'int({var}) & {hex(dtype.layout.mask)}')
+    else:
+        terms.append(f'{var}.code()')
+
+
+@cached_per_type
+def field_encoder(dtype):
+    """Returns a function which unpacks an instance of the ``dtype`` into a
+    tuple of the packed values of all its leaf fields (see :func:`leaf_types`),
+    i.e. the values of all the signals that make up the type. Values of the
+    :class:`Float` fields are returned as floats.
+
+    >>> field_encoder(Queue[Int[4]])(Queue[Int[4]]((-2, 1)))
+    (14, 1)
+    """
+    gen = CodecGen()
+    terms = []
+    field_terms(gen, dtype, 'val', terms)
+    return gen.compile('encode_fields', 'val', f'({", ".join(terms)}, )')
@@ -1,17 +1,19 @@
 from math import floor, ceil
-from .base import class_and_instance_method, typeof, is_type
+from .base import cached_type_op, class_and_instance_method, typeof, is_type
 from .unit import Unit
 from .uint import IntegralType, Integral, Uint, Int, Integer, code, Bool
 from .math import bitw
 
 
 class FixpnumberType(IntegralType):
+    @cached_type_op
     def __abs__(self):
         if not self.signed:
             return self
 
         return Fixp[self.integer + 1, self.width + 1]
 
+    @cached_type_op
     def __add__(self, other):
         if not typeof(other, Integral):
             return NotImplemented
@@ -40,6 +42,7 @@ class FixpnumberType(IntegralType):
     def __and__(self, other):
         return NotImplemented
 
+    @cached_type_op
     def __ceil__(self):
         if self.fract > 0:
             return self.base[self.integer + 1, self.width + 1]
@@ -97,6 +100,7 @@ class FixpnumberType(IntegralType):
     def __isub__(self, other):
         return self
 
+    @cached_type_op
     def __lshift__(self, others):
         shamt = int(others)
         return self.base[self.integer + shamt, self.width]
@@ -110,6 +114,7 @@ class FixpnumberType(IntegralType):
     def __mod__(self, other):
         return NotImplemented
 
+    @cached_type_op
     def __mul__(self, other):
         if not typeof(other, Integral):
             return NotImplemented
@@ -136,6 +141,7 @@ class FixpnumberType(IntegralType):
         else:
             return Ufixp[integer_part, width]
 
+    @cached_type_op
     def __neg__(self):
         return Fixp[self.integer + 1, self.width + 1]
 
@@ -167,6 +173,7 @@ class FixpnumberType(IntegralType):
         else:
             return self
 
+    @cached_type_op
     def __rshift__(self, others):
         shamt = int(others)
         return self.base[self.integer - shamt, self.width]
@@ -186,6 +193,7 @@ class FixpnumberType(IntegralType):
         else:
             return super().__str__()
 
+    @cached_type_op
     def __sub__(self, other):
         if not typeof(other, Integral):
             return NotImplemented
@@ -265,6 +273,17 @@ class Fixpnumber(Integral, metaclass=FixpnumberType):
         if type(val) is cls:
             return val
 
+        if type(val) is float or type(val) is int:
+            # Fast path for the specified types: a single range check
+            layout = cls._layout
+            if layout is None and cls.specified:
+                layout = cls.layout
+
+            if layout is not None:
+                ival = round(float(val) * layout.scale)
+                if layout.min <= ival <= layout.max:
+                    return int.__new__(cls, ival)
+
         if cls.is_generic():
             if cls.is_abstract():
                 if isinstance(val, Integer):
@@ -1,5 +1,5 @@
 from pygears.conf import reg
-from pygears.typing.base import Any, GenericMeta, type_repr, typeof
+from pygears.typing.base import Any, GenericMeta, compile_param, type_repr, typeof
 
 
 class TypeMatchError(Exception):
@@ -28,7 +28,7 @@ def _get_match_conds_rec(t, pat, matches):
                     f"and {type_repr(matches[pat])}")
         else:
             try:
-                res = eval(pat, reg['gear/type_arith'], matches)
+                res = eval(compile_param(pat), reg['gear/type_arith'], matches)
                 if repr(t) != repr(res):
                     raise TypeMatchError(
                         f"{type_repr(t)} cannot be matched to {type_repr(res)}")
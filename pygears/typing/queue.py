@@ -14,7 +14,7 @@ class QueueMeta(EnumerableGenericMeta):
 
     @property
     def width(self):
-        return sum(f.width for f in self)
+        return self.layout.width
         # return self.__args__[0].width + self.__args__[1]
 
     def __new__(cls, name, bases, namespace, args=None):
@@ -151,9 +151,8 @@ class Queue(tuple, metaclass=QueueMeta):
     def code(self):
         """Returns a packed integer representation of the :class:`Queue` instance.
         """
-        data = super().__getitem__(0)
-        eot = super().__getitem__(1)
-        return data.code() | (int(eot) << type(data).width)
+        data, eot = tuple.__iter__(self)
+        return data.code() | (int(eot) << type(self).layout.offsets[1])
 
     @class_and_instance_method
     def sub(self, lvl=None):
@@ -194,10 +193,8 @@ class Queue(tuple, metaclass=QueueMeta):
 
     @classmethod
     def decode(cls, val):
-        data_t = cls.__args__[0]
-        data_t_width = data_t.width
-        data_t_mask = (1 << data_t_width) - 1
+        layout = cls.layout
         val = int(val)
 
-        return cls((data_t.decode(val & data_t_mask), val >> data_t_width))
+        return cls((layout.types[0].decode(val & layout.masks[0]), val >> layout.offsets[1]))
 
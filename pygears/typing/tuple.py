@@ -201,17 +201,17 @@ class TupleType(EnumerableGenericMeta):
 
     @property
     def width(self):
-        if not self.specified:
-            raise TemplatedTypeUnspecified(
-                f'Cannot callculate width of the unspecified type {repr(self)}')
-        w = 0
-        for f in self.__args__:
-            if not is_type(f):
-                raise TypeError(f'Argument "{repr(f)}" of type "{repr(self)}" is not PyGears type')
+        if self._layout is None:
+            if not self.specified:
+                raise TemplatedTypeUnspecified(
+                    f'Cannot callculate width of the unspecified type {repr(self)}')
 
-            w += f.width
+            for f in self.__args__:
+                if not is_type(f):
+                    raise TypeError(
+                        f'Argument "{repr(f)}" of type "{repr(self)}" is not PyGears type')
 
-        return w
+        return self.layout.width
 
 
 class Tuple(tuple, metaclass=TupleType):
@@ -398,12 +398,11 @@ class Tuple(tuple, metaclass=TupleType):
         >>> hex(48042)
         '0xbbaa'
         """
-        ret = 0
+        layout = type(self).layout
 
-        t = type(self).__args__
-        for i in range(len(t) - 1, -1, -1):
-            ret <<= t[i].width
-            ret |= super().__getitem__(i).code() & ((1 << t[i].width) - 1)
+        ret = 0
+        for v, offset, mask in zip(tuple.__iter__(self), layout.offsets, layout.masks):
+            ret |= (v.code() & mask) << offset
 
         return ret
 
@@ -420,12 +419,10 @@ class Tuple(tuple, metaclass=TupleType):
         >>> Point.decode(0xbbaa)
         (Uint[8](170), Uint[8](187))
         """
-        ret = []
+        layout = cls.layout
         val = int(val)
-        for t in cls:
-            t_width = t.width
-            t_mask = (1 << t_width) - 1
-            ret.append(t.decode(val & t_mask))
-            val >>= t_width
 
-        return cls(tuple(ret))
+        return cls(
+            tuple(
+                t.decode((val >> offset) & mask)
+                for t, offset, mask in zip(layout.types, layout.offsets, layout.masks)))
@@ -6,8 +6,8 @@ Objects of these classes can also be instantiated and they provide some integer
 arithmetic capabilities.
 """
 
-from .base import class_and_instance_method
-from .base import typeof, EnumerableGenericMeta, is_type
+from .base import cached_type_op, class_and_instance_method
+from .base import typeof, EnumerableGenericMeta, TypeLayout, is_type
 from .number import Number
 from .math import bitw
 from .unit import Unit
@@ -19,6 +19,34 @@ def concat(l):
     return reduce(matmul, l)
 
 
+class IntegralLayout(TypeLayout):
+    """Layout of the integral types, extended with the information needed to
+    construct their instances without going through all the type checks.
+
+    Attributes:
+        min: Smallest integer representation of the type value
+        max: Largest integer representation of the type value
+        scale: Factor by which the value is multiplied to obtain its integer
+          representation (``2**fract`` for the fixed point types)
+    """
+
+    __slots__ = ('min', 'max', 'scale')
+
+    def __init__(self, width, signed=None, fract=0):
+        super().__init__(width)
+        self.scale = 2**fract
+
+        if signed is None:
+            # Sign agnostic types have no range, which disables the fast path
+            self.min, self.max = 1, 0
+        elif signed and width > 0:
+            self.min, self.max = -(1 << (width - 1)), (1 << (width - 1)) - 1
+        elif signed:
+            self.min, self.max = 0, 0
+        else:
+            self.min, self.max = 0, self.mask
+
+
 class IntegralType(EnumerableGenericMeta):
     def __new__(cls, name, bases, namespace, args=None):
         if args is not None:
@@ -66,12 +94,20 @@ class IntegralType(EnumerableGenericMeta):
 
     @property
     def mask(self) -> int:
-        return (1 << self.width) - 1
+        return self.layout.mask
 
     @property
     def width(self) -> int:
         return self.__args__[-1]
 
+    @property
+    def layout(self):
+        if self._layout is None:
+            self._layout = IntegralLayout(self.width, getattr(self, 'signed', None),
+                                          getattr(self, 'fract', 0))
+
+        return self._layout
+
     def keys(self):
         """Returns a list of keys that can be used for indexing the type.
 
@@ -112,12 +148,14 @@ class IntegerType(IntegralType):
 
         return super().__new__(cls, name, bases, namespace, args=args)
 
+    @cached_type_op
     def __abs__(self):
         if not self.signed:
             return self
 
         return Int[self.width + 1]
 
+    @cached_type_op
     def __add__(self, other):
         if not typeof(other, Integer):
             return NotImplemented
@@ -130,6 +168,7 @@ class IntegerType(IntegralType):
 
         return res_type[max((w1, w2)) + 1]
 
+    @cached_type_op
     def __and__(self, other):
         return self.base[max(op.width for op in (self, other))]
 
@@ -139,6 +178,7 @@ class IntegerType(IntegralType):
     def __float__(self):
         return float
 
+    @cached_type_op
     def __floordiv__(self, other):
         return self.base[self.width - other.width + 1]
 
@@ -172,12 +212,14 @@ class IntegerType(IntegralType):
     def __lt__(self, other):
         return Bool
 
+    @cached_type_op
     def __lshift__(self, other):
         return self.base[self.width + int(other)]
 
     def __mod__(self, other):
         return other
 
+    @cached_type_op
     def __mul__(self, other):
         """Returns the same type, whose width is equal to the sum of operand widths
         if both operands are unsigned.
@@ -200,18 +242,22 @@ class IntegerType(IntegralType):
         else:
             return self.base[self.width + other.width]
 
+    @cached_type_op
     def __neg__(self):
         return Int[self.width + 1]
 
+    @cached_type_op
     def __or__(self, other):
         # return self.width | other.width
         return self.base[max(op.width for op in (self, other))]
 
     __radd__ = __add__
 
+    @cached_type_op
     def __rfloordiv__(self, other):
         return self.base[other.width - self.width + 1]
 
+    @cached_type_op
     def __rtruediv__(self, other):
         return self.base[other.width - self.width + 1]
 
@@ -220,6 +266,7 @@ class IntegerType(IntegralType):
 
     __rmul__ = __mul__
 
+    @cached_type_op
     def __rshift__(self, other):
         shamt = int(other)
         width = len(self)
@@ -241,6 +288,7 @@ class IntegerType(IntegralType):
         else:
             return super().__str__()
 
+    @cached_type_op
     def __sub__(self, other):
         if not typeof(other, Integer):
             return NotImplemented
@@ -252,9 +300,11 @@ class IntegerType(IntegralType):
 
         return Int[max((w1, w2)) + 1]
 
+    @cached_type_op
     def __truediv__(self, other):
         return self.base[self.width - other.width + 1]
 
+    @cached_type_op
     def __xor__(self, other):
         return self.base[max(op.width for op in (self, other))]
 
@@ -279,6 +329,15 @@ class Integer(Integral, metaclass=IntegerType):
         if val is None:
             val = 0
 
+        if type(val) is int:
+            # Fast path for the specified types: a single range check
+            layout = cls._layout
+            if layout is None and cls.specified:
+                layout = cls.layout
+
+            if layout is not None and layout.min <= val <= layout.max:
+                return int.__new__(cls, val)
+
         if type(val) == cls:
             return val
 
@@ -483,10 +542,11 @@ class Integer(Integral, metaclass=IntegerType):
     __rmul__ = __mul__
 
     def __rshift__(self, other):
-        if typeof((type(self) >> other), Unit):
+        res_type = type(self) >> other
+        if typeof(res_type, Unit):
             return Unit()
 
-        return (type(self) >> other)(super().__rshift__(other))
+        return res_type(super().__rshift__(other))
 
     def __rsub__(self, other):
         if is_type(type(other)) and not isinstance(other, Integer):
@@ -534,10 +594,10 @@ class Integer(Integral, metaclass=IntegerType):
     @class_and_instance_method
     @property
     def mask(self):
-        return (1 << self.width) - 1
+        return type(self).layout.mask
 
     def code(self):
-        return int(self) & self.mask
+        return int(self) & type(self).layout.mask
 
     @classmethod
     def decode(cls, val):
@@ -603,6 +663,14 @@ class Int(Integer, metaclass=IntType):
         return False
 
     def __new__(cls, val: int = 0):
+        if type(val) is int:
+            layout = cls._layout
+            if layout is None and cls.specified:
+                layout = cls.layout
+
+            if layout is not None and layout.min <= val <= layout.max:
+                return int.__new__(cls, val)
+
         if type(val) == cls:
             return val
 
@@ -623,9 +691,10 @@ class Int(Integer, metaclass=IntType):
 
     @classmethod
     def decode(cls, val):
-        val = int(val & ((1 << cls.width) - 1))
-        if val >= (1 << (cls.width - 1)):
-            val -= 1 << cls.width
+        layout = cls.layout
+        val = int(val) & layout.mask
+        if val > (layout.mask >> 1):
+            val -= 1 << layout.width
 
         return cls(val)
 
@@ -654,6 +723,7 @@ class UintType(IntegerType):
     def specified(self):
         return IntegralType.specified.fget(self)
 
+    @cached_type_op
     def __matmul__(self, other):
         if not typeof(other, (bool, Uint)):
             return NotImplemented
@@ -714,7 +784,7 @@ class Uint(Integer, metaclass=UintType):
         if not isinstance(other, Uint):
             other = Uint(other)
 
-        return Uint[self.width + other.width]((int(self) << other.width) | int(other))
+        return (type(self) @ type(other))((int(self) << other.width) | int(other))
 
     def __rmatmul__(self, other):
         if isinstance(other, bool):
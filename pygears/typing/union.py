@@ -145,7 +145,7 @@ class UnionType(EnumerableGenericMeta):
 
     @property
     def width(self):
-        return sum(f.width for f in self)
+        return self.layout.width
 
     def __str__(self):
         return '%s' % ' | '.join([type_str(a) for a in self.args])
@@ -210,13 +210,8 @@ class Union(tuple, metaclass=UnionType):
     def code(self):
         """Returns a packed integer representation of the :class:`Union` instance.
         """
-        ret = 0
-
-        for d, t in zip(reversed(self), reversed(type(self))):
-            ret <<= t.width
-            ret |= d.code()
-
-        return ret
+        data, ctrl = tuple.__iter__(self)
+        return data.code() | (ctrl.code() << type(self).layout.offsets[1])
 
     @class_and_instance_method
     @property
@@ -238,18 +233,14 @@ class Union(tuple, metaclass=UnionType):
         """Returns a :class:`Union` instance from its packed integer representation.
         """
 
-        ret = []
+        layout = cls.layout
         val = int(val)
-        for t in cls:
-            t_width = t.width
-            t_mask = (1 << t_width) - 1
-            ret.append(val & t_mask)
-            val >>= t_width
+        data = val & layout.masks[0]
+        ctrl = (val >> layout.offsets[1]) & layout.masks[1]
 
-        data, ctrl = ret
         subtype = cls.types[ctrl]
 
-        return cls(subtype.decode(data), cls[1].decode(ctrl))
+        return cls(subtype.decode(data), layout.types[1].decode(ctrl))
 
 
 class classproperty(object):
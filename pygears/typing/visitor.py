@@ -1,13 +1,34 @@
-class TypingVisitorBase:
-    def visit(self, type_, field=None, **kwds):
-        for c in type_.mro():
-            visit_func_name = f'visit_{c.__name__}'
+import inspect
 
-            if hasattr(self, visit_func_name):
-                return getattr(self, visit_func_name)(type_, field, **kwds)
+from .base import IdentityCache
 
-        else:
-            return self.visit_default(type_, field, **kwds)
+# Visit methods of the typing visitors, keyed by the visitor class and the type
+_dispatch_tables = IdentityCache()
+
+
+def dispatch_method(visitor_cls, type_):
+    """Returns the name of the visitor method for the type, which is the
+    ``visit_<name>`` method for the first class in the type MRO for which the
+    visitor has one, or ``visit_default``."""
+    entry = _dispatch_tables.get((id(visitor_cls), id(type_)))
+    if entry is not None:
+        return entry[0]
+
+    for c in type_.mro():
+        name = f'visit_{c.__name__}'
+        if inspect.getattr_static(visitor_cls, name, None) is not None:
+            break
+    else:
+        name = 'visit_default'
+
+    return _dispatch_tables.store(name, visitor_cls, type_)
+
+
+class TypingVisitorBase:
+    def visit(self, type_, field=None, **kwds):
+        entry = _dispatch_tables.get((id(type(self)), id(type_)))
+        name = dispatch_method(type(self), type_) if entry is None else entry[0]
+        return getattr(self, name)(type_, field, **kwds)
 
     def visit_Union(self, type_, field, **kwds):
         for t, f in zip(type_.types, type_.fields):
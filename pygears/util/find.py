@@ -8,11 +8,8 @@ def _find_rec(path, root):
     if parts[0] == '..':
         return _find_rec("/".join(parts[1:]), root.parent)
 
-    for c in root.child:
-        if hasattr(c, 'basename') and c.basename == parts[0]:
-            child = c
-            break
-    else:
+    child = root.get_child(parts[0])
+    if child is None:
         raise ModuleNotFoundError()
 
     if len(parts) == 1:
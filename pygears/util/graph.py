@@ -15,8 +15,11 @@ def _py_file_enum_raw(top):
 
         yield os.path.abspath(inspect.getfile(node.func))
 
-        for t in node.trace:
-            yield os.path.abspath(inspect.getframeinfo(t[0]).filename)
+        if node.trace is None:
+            continue
+
+        for fn, _, _ in node.trace:
+            yield os.path.abspath(fn)
 
 
 def py_files_enum(top):
@@ -1,4 +1,6 @@
 from pygears import reg
+from pygears.conf import Inject, inject_async
+from pygears.conf.registry import Registry
 from dataclasses import dataclass
 from typing import Any, Callable
 
@@ -59,3 +61,66 @@ def test_subreg():
 
     assert reg['a/b'] == 1
     assert reg['a/c/d'] == 2
+
+
+def test_handle():
+    reg.clear()
+
+    reg['a/b'] = 1
+    h = reg.handle('a/b')
+    assert h.get() == 1
+
+    h.set(2)
+    assert reg['a/b'] == 2
+
+    # Handle follows the registry that replaced the resolved one
+    reg['a'] = Registry()
+    reg['a/b'] = 3
+    assert h.get() == 3
+
+    reg.clear()
+    h.set(4)
+    assert reg['a/b'] == 4
+
+
+def test_handle_conf():
+    reg.clear()
+
+    values = []
+
+    def set_b(var, val):
+        values.append(val)
+
+    reg.confdef('a/b', default=1, setter=set_b)
+
+    h = reg.handle('a/b')
+    h.set(2)
+
+    assert values == [1, 2]
+
+    reg.confdef('a/c', default=1)
+    h = reg.handle('a/c')
+    h.set(2)
+
+    assert h.get() == 2
+    assert reg['a/c'] == 2
+
+
+def test_inject_async():
+    reg.clear()
+
+    calls = []
+
+    @inject_async
+    def func(a=Inject('x/a'), b=Inject('x/b')):
+        calls.append((a, b))
+
+    reg['x/a'] = 1
+    reg['y'] = 2
+    assert calls == []
+
+    reg.handle('x/b').set(3)
+    assert calls == [(1, 3)]
+
+    reg['x/b'] = 4
+    assert calls == [(1, 3)]
@@ -0,0 +1,71 @@
+import logging
+
+import pytest
+
+from pygears import Intf, find, gear, reg
+from pygears.conf.trace import log_exception
+from pygears.typing import Uint
+
+
+@gear
+def leaf(din) -> b'din':
+    pass
+
+
+@gear
+def chain(din):
+    for _ in range(3):
+        din = din | leaf
+
+    return din
+
+
+def test_compact():
+    chain(Intf(Uint[4]))
+
+    trace = find('/chain/leaf0').trace
+    assert trace.frames is None
+
+    assert any(fn == __file__ and name == 'chain' for fn, _, name in trace)
+
+    # Gears instantiated from the same place share the trace
+    assert find('/chain/leaf2').trace is trace
+
+    formatted = ''.join(trace.format())
+    assert 'din = din | leaf' in formatted
+
+
+def test_full():
+    reg['trace/capture'] = 'full'
+    chain(Intf(Uint[4]))
+
+    trace = find('/chain/leaf0').trace
+    assert [f.f_code.co_name for f in trace.frames] == [name for _, _, name in trace]
+    assert find('/chain/leaf2').trace is not trace
+
+
+def test_none():
+    reg['trace/capture'] = 'none'
+    chain(Intf(Uint[4]))
+
+    assert find('/chain/leaf0').trace is None
+
+
+def test_unknown():
+    reg['trace/capture'] = 'frames'
+
+    with pytest.raises(ValueError):
+        chain(Intf(Uint[4]))
+
+
+def test_report(caplog):
+    chain(Intf(Uint[4]))
+
+    err = Exception('error')
+    err.gear_trace = find('/chain/leaf1').trace
+
+    with caplog.at_level(logging.ERROR, logger='trace'):
+        log_exception(err)
+
+    assert 'Gear instantiated at:' in caplog.text
+    assert 'din = din | leaf' in caplog.text
@@ -0,0 +1,90 @@
+import json
+import os
+
+from pygears import Intf, alternative, gear, reg
+from pygears.core.elab_profiler import ElabProfiler
+from pygears.typing import Queue, Uint
+
+
+@gear
+def leaf(din: Uint['w']) -> Uint['w']:
+    pass
+
+
+@gear
+def fgear(din: Queue['T']) -> b'T':
+    pass
+
+
+@alternative(fgear)
+@gear
+def fgear_uint(din: Uint['w']) -> Uint['w']:
+    return din | leaf
+
+
+@gear
+def top(a, b):
+    a | leaf
+    b | leaf
+    return a | fgear
+
+
+def stats(prof, func):
+    return prof.stats[f'{__name__}.{func.__name__}']
+
+
+def test_phases():
+    with ElabProfiler() as prof:
+        top(Intf(Uint[2]), Intf(Uint[4]))
+
+    assert reg['gear/elab_profiler'] is None
+
+    assert stats(prof, top).count == 1
+    assert stats(prof, leaf).count == 3
+    assert stats(prof, fgear_uint).count == 1
+
+    # First alternative fails on the Uint input
+    assert stats(prof, fgear).count == 0
+    assert stats(prof, fgear).alt_fails == 1
+
+    top_stats = stats(prof, top)
+    assert top_stats.total == (top_stats.signature + top_stats.infer + top_stats.body)
+
+    # Time of the child instantiations is not included in the self time
+    nested = top_stats.total - top_stats.self_time
+    assert nested >= stats(prof, fgear).total + stats(prof, fgear_uint).total
+    assert top_stats.body >= nested
+
+
+def test_memo_hits():
+    reg['gear/memoize'] = True
+
+    with ElabProfiler() as prof:
+        Intf(Uint[2]) | leaf
+        Intf(Uint[2]) | leaf
+
+    assert stats(prof, leaf).count == 2
+    assert stats(prof, leaf).memo_hits == 1
+
+
+def test_export(tmpdir):
+    with ElabProfiler() as prof:
+        top(Intf(Uint[2]), Intf(Uint[4]))
+
+    fn = os.path.join(tmpdir, 'elab.json')
+    prof.save_json(fn)
+
+    with open(fn) as f:
+        res = json.load(f)
+
+    assert res['definitions'][f'{__name__}.leaf']['count'] == 3
+
+    report = prof.report(limit=2)
+    assert len(report.splitlines()) == 4
+    assert 'definition' in report
+    assert 'traced' in report.splitlines()[1]
+
+
+def test_disabled():
+    top(Intf(Uint[2]), Intf(Uint[4]))
+    assert reg['gear/elab_profiler'] is None
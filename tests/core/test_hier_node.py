@@ -1,4 +1,4 @@
-from pygears.core.hier_node import NamedHierNode
+from pygears.core.hier_node import HierVisitorBase, HierYielderBase, NamedHierNode
 
 
 def test_unique_renaming():
@@ -9,3 +9,107 @@ def test_unique_renaming():
 
     renames = [c.basename for c in root.child]
     assert renames == ['stem0', 'stem2', 'stem1', 'stem01', 'stem1_2']
+
+
+def test_incremental_renaming():
+    child_names = ['stem', 'stem', 'stem', 'stem0', 'stem', 'other', 'stem1']
+    root = NamedHierNode('')
+    for n in child_names:
+        NamedHierNode(n, root)
+
+    # Incremental renaming needs to give the same names as renaming all the
+    # children each time a child is added
+    ref = NamedHierNode('')
+    for n in child_names:
+        ref.child.append(NamedHierNode(n))
+        ref.unique_rename()
+
+    assert [c.basename for c in root.child] == [c.basename for c in ref.child]
+
+
+def test_remove():
+    root = NamedHierNode('')
+    stems = [NamedHierNode('stem', root) for _ in range(3)]
+
+    stems[0].remove()
+    NamedHierNode('stem', root)
+
+    assert [c.basename for c in root.child] == ['stem1', 'stem2', 'stem0']
+    assert root['stem0'] is root.child[-1]
+
+
+def test_remove_shared_name():
+    root = NamedHierNode('')
+    a, b = NamedHierNode('a0', root), NamedHierNode('b', root)
+
+    # Renaming makes two siblings share the name
+    b.basename = 'a0'
+    assert root.get_child('a0') is a
+
+    a.remove()
+    assert root.get_child('a0') is b
+    assert root['a0'] is b
+
+
+def test_name_cache():
+    root = NamedHierNode('')
+    top = NamedHierNode('top', root)
+    leaf = NamedHierNode('leaf', NamedHierNode('mid', top))
+
+    assert leaf.name == '/top/mid/leaf'
+    assert root['top/mid/leaf'] is leaf
+    assert top.has_descendent(leaf)
+
+    # Renaming a node needs to rename all its descendents
+    NamedHierNode('top', root)
+    assert leaf.name == '/top0/mid/leaf'
+    assert root['/top0/mid/leaf'] is leaf
+    assert 'top/mid/leaf' not in root
+
+    top.basename = 'renamed'
+    assert leaf.name == '/renamed/mid/leaf'
+    assert root['renamed/mid/leaf'] is leaf
+
+
+class OrderVisitor(HierVisitorBase):
+    def __init__(self):
+        self.names = []
+
+    def NamedHierNode(self, node):
+        self.names.append(node.basename)
+        # Descendents of the "skip" nodes are not visited
+        return node.basename == 'skip'
+
+
+class OrderYielder(HierYielderBase):
+    def NamedHierNode(self, node):
+        yield node.basename
+
+
+def build_tree():
+    root = NamedHierNode('root')
+    a = NamedHierNode('a', root)
+    NamedHierNode('a1', a)
+    NamedHierNode('b', NamedHierNode('skip', a))
+    NamedHierNode('c', root)
+    return root
+
+
+def test_visit_order():
+    v = OrderVisitor()
+    v.visit(build_tree())
+    assert v.names == ['root', 'a', 'a1', 'skip', 'c']
+
+    assert list(OrderYielder().visit(build_tree())) == ['root', 'a', 'a1', 'skip', 'b', 'c']
+
+
+def test_visit_deep():
+    root = node = NamedHierNode('root')
+    for _ in range(5000):
+        node = NamedHierNode('node', node)
+
+    v = OrderVisitor()
+    v.visit(root)
+    assert len(v.names) == 5001
+
+    assert len(list(OrderYielder().visit(root))) == 5001
@@ -1,5 +1,6 @@
 
-from pygears.typing import Int, Tuple, Uint, Queue, Any
+from pygears import Intf, gear, reg
+from pygears.typing import Bool, Int, Tuple, Uint, Queue, Any
 from pygears.core.infer_ftypes import infer_ftypes
 
 
@@ -89,3 +90,91 @@ def test_queue_of_queues():
 
     assert params['din'] == Queue[Uint[10]]
     assert params['return'] == Queue[Uint[10], 2]
+
+
+@gear
+def memo_dut(din, *, w=1, lst=None) -> Tuple['din', Uint['w']]:
+    pass
+
+
+def test_memo_hit():
+    memo_dut(Intf(Uint[2]), w=3)
+    memo_dut(Intf(Uint[2]), w=3)
+    memo_dut(Intf(Uint[2]), w=4)
+
+    stats = reg['gear/infer_stats']
+    assert (stats.hits, stats.misses, stats.uncached) == (1, 2, 0)
+
+    root = reg['gear/root']
+    assert root['memo_dut0'].tout == root['memo_dut1'].tout
+    assert root['memo_dut2'].tout == Tuple[Uint[2], Uint[4]]
+
+
+def test_memo_equal_types():
+    memo_dut(Intf(Uint[1]))
+    memo_dut(Intf(Bool))
+    memo_dut(Intf(Tuple[{'a': Uint[1]}]))
+    memo_dut(Intf(Tuple[{'b': Uint[1]}]))
+
+    root = reg['gear/root']
+    assert repr(root['memo_dut0'].params['din']) == 'Uint[1]'
+    assert repr(root['memo_dut1'].params['din']) == 'Bool'
+    assert root['memo_dut2'].params['din'].fields == ('a', )
+    assert root['memo_dut3'].params['din'].fields == ('b', )
+
+
+def test_memo_param_objects():
+    lst0 = [1, 2]
+    lst1 = [1, 2]
+    memo_dut(Intf(Uint[2]), lst=lst0)
+    memo_dut(Intf(Uint[2]), lst=lst1)
+
+    root = reg['gear/root']
+    assert reg['gear/infer_stats'].hits == 1
+    assert root['memo_dut0'].params['lst'] is lst0
+    assert root['memo_dut1'].params['lst'] is lst1
+
+
+W = 4
+
+
+@gear
+def memo_global(din) -> b'Uint[W]':
+    pass
+
+
+def test_memo_globals():
+    global W
+
+    memo_global(Intf(Uint[2]))
+    W = 8
+    try:
+        memo_global(Intf(Uint[2]))
+    finally:
+        W = 4
+
+    root = reg['gear/root']
+    assert root['memo_global0'].params['return'] == Uint[4]
+    assert root['memo_global1'].params['return'] == Uint[8]
+
+
+@gear
+def memo_val_type(din, *, init) -> b'type(init)':
+    pass
+
+
+def test_memo_value_types():
+    memo_val_type(Intf(Uint[2]), init=Uint[1](1))
+    memo_val_type(Intf(Uint[2]), init=Bool(1))
+
+    root = reg['gear/root']
+    assert repr(root['memo_val_type0'].params['return']) == 'Uint[1]'
+    assert repr(root['memo_val_type1'].params['return']) == 'Bool'
+
+
+def test_memo_disabled():
+    reg['gear/infer_memoize'] = False
+    memo_dut(Intf(Uint[2]))
+    memo_dut(Intf(Uint[2]))
+
+    assert reg['gear/infer_stats'].uncached == 2
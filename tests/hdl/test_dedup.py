@@ -0,0 +1,121 @@
+import functools
+import hashlib
+import os
+import re
+
+from pygears import Intf, clear, gear, reg
+from pygears.hdl import hdlgen
+from pygears.lib import ccat, dreg, qcnt, rom
+from pygears.sim.memory import Memory
+from pygears.typing import Queue, Uint, code
+
+
+@gear(hdl={'compile': True})
+async def accum(din: Queue[Uint[8]], *, init) -> Uint[8]:
+    acc = Uint[8](init)
+    async for d, _ in din:
+        acc = code(acc + d, Uint[8])
+        yield acc
+
+
+@gear
+def lane(din, *, init=0):
+    return ccat(din | accum(init=init), din | qcnt) | dreg
+
+
+@gear
+def design(din, *, inits):
+    return tuple(lane(din, init=i) for i in inits)
+
+
+def generate(outdir, inits, **kwds):
+    clear()
+    reg['hls/cache_dir'] = None
+    design(Intf(Queue[Uint[8]]), inits=inits)
+    hdlgen('/design', outdir=outdir, **kwds)
+
+    res = {}
+    for fn in os.listdir(outdir):
+        with open(os.path.join(outdir, fn)) as f:
+            res[os.path.splitext(fn)[0]] = f.read()
+
+    return res
+
+
+def expand(mods, top='design'):
+    """Returns the contents of the top module, with the names of the
+    instantiated modules replaced by the hashes of their expanded contents."""
+    pattern = re.compile(r'\b(' + '|'.join(sorted(mods, key=len, reverse=True)) + r')\b')
+
+    @functools.lru_cache(maxsize=None)
+    def expand_mod(name):
+        def repl(match):
+            if match.group(1) == name:
+                return 'self'
+
+            return hashlib.sha1(expand_mod(match.group(1)).encode()).hexdigest()
+
+        return pattern.sub(repl, mods[name])
+
+    return expand_mod(top)
+
+
+def test_lanes(tmpdir):
+    inits = [0, 1, 0, 1, 0]
+    ref = generate(os.path.join(tmpdir, 'ref'), inits)
+    res = generate(os.path.join(tmpdir, 'dedup'), inits, dedup=True)
+
+    assert len(ref) == 21
+    assert set(res) == {
+        'design', 'design_lane0', 'design_lane0_accum', 'design_lane0_ccat',
+        'design_lane0_qcnt', 'design_lane1', 'design_lane1_accum'
+    }
+
+    assert expand(res) == expand(ref)
+
+
+def test_all_different(tmpdir):
+    inits = [0, 1, 2]
+    ref = generate(os.path.join(tmpdir, 'ref'), inits)
+    res = generate(os.path.join(tmpdir, 'dedup'), inits, dedup=True)
+
+    assert len([m for m in res if m.endswith('_accum')]) == 3
+    assert len([m for m in res if m.endswith('_qcnt')]) == 1
+    assert expand(res) == expand(ref)
+
+
+def test_lang_v(tmpdir):
+    inits = [0, 1, 0, 1, 0]
+    ref = generate(os.path.join(tmpdir, 'ref'), inits, lang='v')
+    res = generate(os.path.join(tmpdir, 'dedup'), inits, lang='v', dedup=True)
+
+    assert len(ref) == 21
+    assert len(res) == 7
+    assert expand(res) == expand(ref)
+
+
+def test_config(tmpdir):
+    reg['hdl/dedup'] = True
+    inits = [0, 0]
+    design(Intf(Queue[Uint[8]]), inits=inits)
+    hdlgen('/design', outdir=tmpdir)
+
+    assert not os.path.exists(os.path.join(tmpdir, 'design_lane1.sv'))
+
+
+@gear
+def roms(addr, *, mems):
+    return tuple(addr | rom(data=m, dtype=Uint[8]) for m in mems)
+
+
+def test_unstable_repr(tmpdir):
+    mems = [Memory(Uint[8], 4), Memory(Uint[8], 4)]
+    mems[0].preload([1, 2, 3, 4])
+    mems[1].preload([5, 6, 7, 8])
+
+    reg['hls/cache_dir'] = None
+    roms(Intf(Uint[2]), mems=mems)
+    hdlgen('/roms', outdir=tmpdir, dedup=True)
+
+    assert os.path.exists(os.path.join(tmpdir, 'roms_rom0.sv'))
+    assert os.path.exists(os.path.join(tmpdir, 'roms_rom1.sv'))
@@ -0,0 +1,61 @@
+import os
+
+import pytest
+
+from pygears import Intf, clear, datagear, find, gear, reg
+from pygears.hdl import hdlgen
+from pygears.hdl.generate import calls_gears
+from pygears.lib import qcnt, qrange, serialize
+from pygears.typing import Array, Queue, Uint
+
+
+@datagear
+def double(a) -> b'a + a':
+    return a + a
+
+
+@gear(hdl={'compile': True})
+async def dbl(din: Uint[4]) -> Uint[5]:
+    # Submodules of the HLS gears are instantiated during the compilation,
+    # so such gears are never compiled in the worker processes
+    async with double(din) as d:
+        yield d
+
+
+@gear
+def design(din, cfg):
+    qrange(cfg)
+    din | qcnt
+    Intf(Array[Uint[4], 4]) | serialize
+    return din[0] | dbl
+
+
+def generate(outdir, jobs):
+    clear()
+    reg['hls/cache_dir'] = None
+    design(Intf(Queue[Uint[4]]), Intf(Uint[4]))
+    hdlgen('/design', outdir=outdir, jobs=jobs)
+
+    res = {}
+    for fn in sorted(os.listdir(outdir)):
+        with open(os.path.join(outdir, fn)) as f:
+            res[fn] = f.read()
+
+    return res
+
+
+@pytest.mark.parametrize('jobs', [2, None])
+def test_same_as_serial(tmpdir, jobs):
+    serial = generate(os.path.join(tmpdir, 'serial'), jobs=1)
+    parallel = generate(os.path.join(tmpdir, 'parallel'), jobs=jobs)
+
+    assert len(serial) > 4
+    assert parallel == serial
+
+
+def test_calls_gears():
+    clear()
+    design(Intf(Queue[Uint[4]]), Intf(Uint[4]))
+
+    assert calls_gears(find('/design/dbl'))
+    assert not any(calls_gears(find(f'/design/{name}')) for name in ['qrange', 'qcnt', 'serialize'])
@@ -0,0 +1,111 @@
+import os
+import types
+
+import pytest
+
+from pygears import Intf, clear, datagear, gear, reg
+from pygears.hdl import hdlgen
+from pygears.hls import translate
+from pygears.typing import Uint
+
+
+@pytest.fixture
+def translations(monkeypatch):
+    calls = []
+    translate_gear = translate.translate_gear
+
+    def counting(gear):
+        calls.append(gear.name)
+        return translate_gear(gear)
+
+    monkeypatch.setattr(translate, 'translate_gear', counting)
+    return calls
+
+
+def generate(dut, tmpdir, **kwds):
+    clear()
+    reg['hls/cache_dir'] = os.path.join(tmpdir, 'hls_cache')
+    dut(Intf(Uint[4]), **kwds)
+    hdlgen('/dut', outdir=tmpdir)
+    with open(os.path.join(tmpdir, 'dut.sv')) as f:
+        return f.read()
+
+
+@gear(hdl={'compile': True})
+async def dut(din: Uint[4], *, inc=1) -> Uint[5]:
+    async with din as d:
+        yield d + inc
+
+
+def test_hit(tmpdir, translations):
+    res = generate(dut, tmpdir)
+    assert translations == ['/dut']
+
+    assert generate(dut, tmpdir) == res
+    assert translations == ['/dut']
+
+
+def test_param_change(tmpdir, translations):
+    res = generate(dut, tmpdir)
+    assert generate(dut, tmpdir, inc=2) != res
+    assert translations == ['/dut', '/dut']
+
+
+def test_disabled(tmpdir, translations):
+    generate(dut, tmpdir)
+    clear()
+    reg['hls/cache_dir'] = None
+    dut(Intf(Uint[4]))
+    hdlgen('/dut', outdir=tmpdir)
+    assert translations == ['/dut', '/dut']
+
+
+def inc1(x):
+    return x + 1
+
+
+def inc2(x):
+    return x + 2
+
+
+mylib = types.ModuleType('mylib')
+
+
+@gear(hdl={'compile': True})
+async def dut_mod(din: Uint[4]) -> Uint[5]:
+    async with din as d:
+        yield mylib.inc(d)
+
+
+def test_module_attr_change(tmpdir, translations):
+    mylib.inc = inc1
+    res = generate(dut_mod, tmpdir, name='dut')
+
+    mylib.inc = inc2
+    assert generate(dut_mod, tmpdir, name='dut') != res
+    assert translations == ['/dut', '/dut']
+
+
+def test_default_disabled():
+    assert reg['hls/cache_dir'] is None
+
+
+@datagear
+def double(a) -> b'a + a':
+    return a + a
+
+
+@gear(hdl={'compile': True})
+async def dut_sub(din: Uint[4]) -> Uint[5]:
+    async with double(din) as d:
+        yield d
+
+
+def test_submodules_not_cached(tmpdir, translations):
+    for _ in range(2):
+        clear()
+        reg['hls/cache_dir'] = os.path.join(tmpdir, 'hls_cache')
+        dut_sub(Intf(Uint[4]), name='dut')
+        hdlgen('/dut', outdir=tmpdir)
+
+    assert translations.count('/dut') == 2
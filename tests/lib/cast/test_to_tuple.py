@@ -52,3 +52,13 @@ def test_array_value_cast():
     res_t = Tuple[Int[5], Int[6], Int[5]]
 
     assert cast(v, t) == res_t((-5, 3, 7))
+
+
+def test_tuple_value_cast():
+    v = Tuple[Uint[4], Int[4]]((1, -2))
+    t = Tuple[Int[8], Int[8]]
+
+    for _ in range(2):
+        res = cast(v, t)
+        assert type(res) == t
+        assert res == t((1, -2))
@@ -52,3 +52,19 @@ def test_unsupported_cast():
     for t in [Int[6], Tuple[Int[2], Uint[2]], Fixp[1, 14]]:
         with pytest.raises(TypeError):
             cast(t, Uint)
+
+
+def test_cached_value_cast():
+    # Second pass uses the cached converters
+    for _ in range(2):
+        res = cast(Uint[8](128), Uint[16])
+        assert type(res) is Uint[16]
+        assert res == 128
+
+        assert cast(Ufixp[8, 16](2.15), Uint) == Uint[8](2)
+
+        with pytest.raises(TypeError):
+            cast(Uint[16](128), Uint[4])
+
+        with pytest.raises(ValueError):
+            cast(27, Uint[4])
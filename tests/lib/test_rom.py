@@ -2,6 +2,7 @@ from pygears.sim.modules.verilator import SimVerilated
 from pygears.lib.rom import rom
 from pygears.lib.verif import directed
 from pygears.sim import sim
+from pygears.sim.memory import Memory
 from pygears.lib.verif import drv
 from pygears.typing import Uint
 from collections import defaultdict
@@ -53,3 +54,14 @@ def test_directed_dict_dflt(sim_cls):
              ref=res)
 
     sim()
+
+
+def test_memory():
+    data = Memory(Uint[8], 16)
+    data.preload(range(100, 110))
+
+    directed(drv(t=Uint[5], seq=list(range(20))),
+             f=rom(data=data, dtype=Uint[8], dflt=0),
+             ref=list(range(100, 110)) + [0] * 10)
+
+    sim()
@@ -1,7 +1,12 @@
+import os
+import resource
+
+from pygears import find
 from pygears.lib import sdp
 from pygears.lib.delay import delay_rng
 from pygears.lib.verif import directed
 from pygears.sim import sim
+from pygears.sim.memory import Memory
 from pygears.lib.verif import drv
 from pygears.typing import Tuple, Uint
 
@@ -17,3 +22,44 @@ def test_directed(sim_cls):
              ref=rd_data)
 
     sim()
+
+
+def test_mem(tmpdir):
+    mem = Memory(Uint[5], 8)
+    mem.preload([i * 3 for i in range(8)])
+
+    wr_addr_data = [(i, i * 2) for i in range(4)]
+    rd_addr = list(range(8))
+    rd_data = [i * 2 for i in range(4)] + [i * 3 for i in range(4, 8)]
+
+    directed(drv(t=Tuple[Uint[3], Uint[5]], seq=wr_addr_data),
+             drv(t=Uint[3], seq=rd_addr) | delay_rng(4, 4),
+             f=sdp(mem=mem),
+             ref=rd_data)
+
+    sim()
+
+    fn = os.path.join(tmpdir, 'mem.hex')
+    mem.dump(fn)
+
+    res = Memory(Uint[5], 8)
+    res.load(fn)
+
+    assert res.codes() == rd_data
+
+
+def test_wide_addr():
+    # Only the touched pages of the 1 GiB memory get allocated
+    addrs = [0, 2**27, 2**28 - 1]
+    wr_addr_data = [(a, i + 1) for i, a in enumerate(addrs)]
+
+    directed(drv(t=Tuple[Uint[28], Uint[32]], seq=wr_addr_data),
+             drv(t=Uint[28], seq=addrs) | delay_rng(4, 4),
+             f=sdp,
+             ref=[1, 2, 3])
+
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    sim()
+
+    assert find('/sdp/sdp_wr_port').ram.depth == 2**28
+    assert resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - rss < 64 * 1024
@@ -1,8 +1,9 @@
 import pytest
-from pygears.lib import tdp, priority_mux, verif, ccat
+from pygears.lib import tdp, priority_mux, verif, ccat, directed
 from pygears.lib.tdp import TWrReq
 from pygears.lib.delay import delay_rng, delay_gen
 from pygears.sim import sim
+from pygears.sim.memory import Memory
 from pygears.lib.verif import drv
 from pygears.typing import Bool, Uint, Union
 
@@ -65,3 +66,20 @@ def test_directed(
                   delay_rng(0, 0)])
 
     sim()
+
+
+def test_mem():
+    wr_req_t = TWrReq[3, Uint[8]]
+    req_t = Union[Uint[3], wr_req_t]
+
+    mem = Memory(Uint[8], 8)
+    mem.preload([7] * 8)
+
+    req0 = drv(t=req_t, seq=[(wr_req_t((1, 5)), 1), (Uint[3](1), 0), (Uint[3](2), 0)])
+    req1 = drv(t=req_t, seq=[(Uint[3](3), 0)])
+
+    directed(req0, req1, f=tdp(mem=mem), ref=[[5, 7], [7]])
+
+    sim()
+
+    assert mem.codes() == [7, 5, 7, 7, 7, 7, 7, 7]
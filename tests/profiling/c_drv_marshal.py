@@ -0,0 +1,56 @@
+import os
+import sys
+import timeit
+from math import ceil
+
+from pygears.sim.modules.verilator import CInputDrv, COutputDrv
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from sim.c_drv_stubs import Port, VeriLib  # noqa: E402
+
+
+def legacy_to_c_data(drv, data):
+    def dgen(data):
+        for i in range(ceil(drv.width / 32)):
+            yield data & 0xffffffff
+            data >>= 32
+
+    return drv.c_dtype(*list(dgen(data)))
+
+
+def legacy_from_c_data(drv, data):
+    dout = 0
+    for d in reversed(list(data)):
+        dout <<= drv.c_width
+        dout |= d
+
+    return dout
+
+
+def bench(width, num):
+    din = CInputDrv(VeriLib(), Port(width))
+    dout = COutputDrv(VeriLib(), Port(width))
+    val = (1 << width) - 3
+
+    cases = {
+        'send': lambda: din.send(val),
+        'read': dout.read,
+    }
+
+    if width > 64:
+        cases['legacy to_c'] = lambda: legacy_to_c_data(din, val)
+        cases['to_c'] = lambda: din.to_c_data(val)
+
+    cases['legacy from_c'] = lambda: legacy_from_c_data(dout, dout.dout)
+    cases['from_c'] = lambda: dout.from_c_data(dout.dout)
+
+    for name, f in cases.items():
+        dur = timeit.timeit(f, number=num)
+        print(f'{width:>5} {name:>14}: {dur / num * 1e9:>8.0f} ns/transfer')
+
+
+if __name__ == '__main__':
+    num = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+
+    for width in [32, 64, 512, 2048]:
+        bench(width, num)
@@ -0,0 +1,50 @@
+import sys
+import time
+import tracemalloc
+
+from pygears import Intf, clear, gear, reg
+from pygears.typing import Uint
+
+
+@gear
+def leaf(din) -> b'din':
+    pass
+
+
+def lane(din, depth, num):
+    # Locals of the callers are kept alive by the traces in the "full" mode
+    payload = [0] * 1000
+
+    if depth:
+        return lane(din, depth - 1, num)
+
+    for _ in range(num):
+        din = din | leaf
+
+    return din, payload
+
+
+def design(lanes, num):
+    for _ in range(lanes):
+        lane(Intf(Uint[8]), 10, num)
+
+
+def run(lanes, num, mode):
+    clear()
+    reg['trace/capture'] = mode
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    design(lanes, num)
+    total = time.perf_counter() - start
+    mem, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(f'{mode:<8}: {total:.2f}s elaboration, {mem / 2**20:.1f} MB')
+
+
+if __name__ == '__main__':
+    lanes = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+
+    for mode in ['full', 'compact', 'none']:
+        run(lanes, 10, mode)
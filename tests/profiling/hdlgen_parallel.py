@@ -0,0 +1,47 @@
+import os
+import sys
+import tempfile
+import time
+
+from pygears import Intf, clear, gear, reg
+from pygears.hdl import hdlgen
+from pygears.typing import Queue, Uint, code
+
+
+@gear(hdl={'compile': True})
+async def accum(din: Queue[Uint[16]], *, init) -> Uint[16]:
+    acc = Uint[16](init)
+    async for d, _ in din:
+        acc = code(acc + d, Uint[16])
+        if acc > init:
+            yield acc
+        else:
+            yield code(acc + 1, Uint[16])
+
+
+@gear
+def design(din, *, num):
+    dout = []
+    for i in range(num):
+        # Distinct parameter makes each gear a separate compilation
+        dout.append(accum(din, init=i))
+
+    return tuple(dout)
+
+
+def run(num, jobs):
+    clear()
+    reg['hls/cache_dir'] = None
+    design(Intf(Queue[Uint[16]]), num=num)
+
+    with tempfile.TemporaryDirectory() as outdir:
+        start = time.perf_counter()
+        hdlgen('/design', outdir=outdir, jobs=jobs)
+        return time.perf_counter() - start
+
+
+if __name__ == '__main__':
+    num = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+
+    for jobs in sorted({1, 2, 4, os.cpu_count()}):
+        print(f'jobs={jobs:>3}: {run(num, jobs):.2f}s for {num} gears')
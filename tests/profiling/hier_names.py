@@ -0,0 +1,47 @@
+import sys
+import time
+
+from pygears import Intf, clear, find, gear
+from pygears.typing import Uint
+
+
+@gear
+def leaf(din) -> b'din':
+    pass
+
+
+@gear
+def wide(din, *, num):
+    for _ in range(num):
+        din = din | leaf
+
+    return din
+
+
+def run(num):
+    clear()
+
+    start = time.perf_counter()
+    wide(Intf(Uint[8]), num=num)
+    elab = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for i in range(num):
+        find(f'/wide/leaf{i}')
+
+    lookup = time.perf_counter() - start
+
+    top = find('/wide')
+    start = time.perf_counter()
+    for c in top.child:
+        top.has_descendent(c)
+
+    desc = time.perf_counter() - start
+
+    print(f'{num} children: {elab:.2f}s elaboration, {lookup * 1e6 / num:.1f}us per find, '
+          f'{desc * 1e6 / num:.1f}us per has_descendent')
+
+
+if __name__ == '__main__':
+    num = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    run(num)
@@ -0,0 +1,84 @@
+import sys
+import time
+
+from pygears import Intf, clear, find, gear
+from pygears.core.hier_node import HierVisitorBase, HierYielderBase
+from pygears.typing import Queue, Tuple, Uint
+from pygears.typing.visitor import TypingVisitorBase
+
+
+@gear
+def leaf(din) -> b'din':
+    pass
+
+
+@gear
+def lane(din, *, depth):
+    if depth:
+        return din | lane(depth=depth - 1) | leaf
+
+    return din | leaf
+
+
+@gear
+def design(din, *, lanes, depth):
+    for _ in range(lanes):
+        din = din | lane(depth=depth)
+
+    return din
+
+
+class GearCount(HierVisitorBase):
+    def __init__(self):
+        self.count = 0
+
+    def Gear(self, node):
+        self.count += 1
+
+
+class GearYielder(HierYielderBase):
+    def Gear(self, node):
+        yield node
+
+
+class WidthVisitor(TypingVisitorBase):
+    def visit_Uint(self, type_, field, **kwds):
+        return type_.width
+
+
+def bench(name, func, number):
+    start = time.perf_counter()
+    for _ in range(number):
+        res = func()
+
+    total = time.perf_counter() - start
+    print(f'{name:<10}: {total * 1e3 / number:.2f}ms per walk ({res} nodes)')
+
+
+if __name__ == '__main__':
+    lanes = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+
+    clear()
+    design(Intf(Uint[8]), lanes=lanes, depth=10)
+    top = find('/design')
+
+    def visit():
+        v = GearCount()
+        v.visit(top)
+        return v.count
+
+    def yielder():
+        return sum(1 for _ in GearYielder().visit(top))
+
+    t = Tuple[Queue[Uint[8], 2], Uint[4], Tuple[Uint[1], Uint[2]]]
+
+    def typing():
+        v = WidthVisitor()
+        for _ in range(1000):
+            v.visit(t)
+
+        return 1000
+
+    bench('visitor', visit, 20)
+    bench('yielder', yielder, 20)
+    bench('typing', typing, 20)
@@ -0,0 +1,32 @@
+import sys
+import time
+
+from pygears import Intf, clear, reg
+from pygears.lib import ccat, decouple, fmap, qrange
+from pygears.typing import Uint
+
+
+def design(num):
+    for _ in range(num):
+        a = Intf(Uint[8])
+        b = Intf(Uint[8])
+        ccat(a, b) | decouple | fmap(f=(decouple, decouple))
+        qrange(a)
+
+
+def run(num, memoize):
+    clear()
+    reg['gear/infer_memoize'] = memoize
+
+    start = time.perf_counter()
+    design(num)
+    total = time.perf_counter() - start
+
+    print(f'memoize={memoize!s:<5}: {total:.2f}s elaboration, {reg["gear/infer_stats"]}')
+
+
+if __name__ == '__main__':
+    num = int(sys.argv[1]) if len(sys.argv) > 1 else 300
+
+    for memoize in [False, True]:
+        run(num, memoize)
@@ -0,0 +1,36 @@
+import sys
+import timeit
+
+from pygears import reg
+from pygears.conf import Inject, inject_async
+
+
+def pending_injections(num):
+    # Injections waiting for the paths that are never set
+    for i in range(num):
+
+        @inject_async
+        def func(val=Inject(f'bench/pending{i}')):
+            pass
+
+
+def bench(name, stmt, number):
+    total = timeit.timeit(stmt, globals=globals(), number=number)
+    print(f'{name:<34}: {number / total / 1e6:.2f} Mops/s')
+
+
+if __name__ == '__main__':
+    number = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+
+    pending_injections(1000)
+
+    reg['sim/timestep'] = 0
+    timestep = reg.handle('sim/timestep')
+    name = reg.handle('gear/params/extra/name')
+
+    bench('get sim/timestep', "reg['sim/timestep']", number)
+    bench('get gear/params/extra/name', "reg['gear/params/extra/name']", number)
+    bench('set sim/timestep', "reg['sim/timestep'] = 1", number)
+    bench('handle get sim/timestep', "timestep.get()", number)
+    bench('handle get gear/params/extra/name', "name.get()", number)
+    bench('handle set sim/timestep', "timestep.set(1)", number)
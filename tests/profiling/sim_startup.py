@@ -0,0 +1,73 @@
+import sys
+import time
+
+from pygears import gear, clear
+from pygears.typing import Uint
+from pygears.lib.verif import drv
+from pygears.lib import shred
+from pygears.sim import sim
+from pygears.sim.extens.sim_extend import SimExtend
+
+
+class SetupTimer(SimExtend):
+    def before_setup(self, sim):
+        self.exec_order_end = time.perf_counter()
+
+    def before_run(self, sim):
+        self.setup_end = time.perf_counter()
+
+
+@gear
+async def passthrough(din: Uint[16]) -> Uint[16]:
+    async with din as d:
+        yield d
+
+
+def chain(num):
+    d = drv(t=Uint[16], seq=[0])
+    for _ in range(num):
+        d = d | passthrough
+
+    d | shred
+
+
+def tree(num):
+    level = [drv(t=Uint[16], seq=[0])]
+    gear_num = 0
+    while gear_num < num:
+        next_level = []
+        for d in level:
+            # Each interface is broadcast to two consumers
+            next_level.append(d | passthrough)
+            next_level.append(d | passthrough)
+
+        gear_num += len(next_level)
+        level = next_level
+
+    for d in level:
+        d | shred
+
+
+def bench(design, num):
+    clear()
+
+    t = time.perf_counter()
+    design(num)
+    elab = time.perf_counter() - t
+
+    t = time.perf_counter()
+    timer = []
+    sim(timeout=0, extens=[lambda: timer.append(SetupTimer())])
+
+    timer = timer[0]
+    print(f'{design.__name__:>6} {num:>7}: elaboration {elab:8.3f}s, '
+          f'exec order {timer.exec_order_end - t:8.3f}s, '
+          f'setup {timer.setup_end - t:8.3f}s')
+
+
+if __name__ == '__main__':
+    sizes = [int(s) for s in sys.argv[1:]] or [1000, 10000, 100000]
+
+    for num in sizes:
+        for design in (chain, tree):
+            bench(design, num)
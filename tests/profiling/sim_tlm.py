@@ -0,0 +1,32 @@
+import sys
+import time
+
+from pygears import clear, reg
+from pygears.lib import drv, qcnt, shred
+from pygears.sim import sim
+from pygears.typing import Queue, Uint
+
+
+def bench(tlm, num):
+    clear()
+    reg['sim/tlm'] = tlm
+
+    seq = [list(range(num))]
+    drv(t=Queue[Uint[16]], seq=seq) \
+        | qcnt(running=True) \
+        | shred
+
+    t = time.perf_counter()
+    sim()
+    elapsed = time.perf_counter() - t
+
+    mode = 'tlm' if tlm else 'handshake'
+    print(f'{mode:>10}: {num} transfers in {elapsed:.3f}s, '
+          f'{num / elapsed:.0f} transfers/s, {reg["sim/timestep"]} timesteps')
+
+
+if __name__ == '__main__':
+    num = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+
+    for tlm in (False, True):
+        bench(tlm, num)
@@ -0,0 +1,41 @@
+import sys
+import timeit
+
+from pygears.typing import Fixp, Int, Ufixp, Uint
+
+a = Uint[8](0x12)
+b = Uint[8](0x34)
+i = Int[8](-0x12)
+f = Fixp[4, 16](-3.14)
+uf = Ufixp[4, 16](3.14)
+
+cases = {
+    'uint + uint': lambda: a + b,
+    'uint + int': lambda: a + i,
+    'uint - uint': lambda: a - b,
+    'uint * uint': lambda: a * b,
+    'int * int': lambda: i * i,
+    '-int': lambda: -i,
+    'uint << 3': lambda: a << 3,
+    'uint >> 3': lambda: a >> 3,
+    'uint[2:6]': lambda: a[2:6],
+    'uint[3]': lambda: a[3],
+    'uint @ uint': lambda: a @ b,
+    'fixp + fixp': lambda: f + f,
+    'fixp + ufixp': lambda: f + uf,
+    'fixp * fixp': lambda: f * f,
+    'fixp << 2': lambda: f << 2,
+}
+
+
+def bench(name, func, num):
+    func()
+    dur = timeit.timeit(func, number=num)
+    print(f'{name:>14}: {num / dur:>10.0f}/s')
+
+
+if __name__ == '__main__':
+    num = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+
+    for name, func in cases.items():
+        bench(name, func, num)
@@ -0,0 +1,34 @@
+import sys
+import timeit
+
+from pygears.typing import (Array, Fixp, Int, Queue, Tuple, Ufixp, Uint, cast, qround, saturate)
+
+cases = {
+    'uint -> uint': (Uint[8](0x12), Uint[16]),
+    'uint -> int': (Uint[8](0x12), Int),
+    'int -> int': (Int[8](-0x12), Int[16]),
+    'ufixp -> uint': (Ufixp[4, 8](3.5), Uint[8]),
+    'fixp -> int': (Fixp[4, 8](-3.5), Int[8]),
+    'uint -> fixp': (Uint[4](0x3), Fixp[8, 16]),
+    'int -> int(py)': (0x12, Int[8]),
+    'tuple': (Tuple[Uint[4], Int[4]]((1, -2)), Tuple[Int[8], Int[8]]),
+    'array': (Array[Uint[4], 4]((1, 2, 3, 4)), Array[Uint[8], 4]),
+    'queue': (Queue[Uint[4]]((3, 1)), Queue[Int[8]]),
+}
+
+
+def bench(name, func, num):
+    func()
+    dur = timeit.timeit(func, number=num)
+    print(f'{name:>14}: {num / dur:>10.0f}/s')
+
+
+if __name__ == '__main__':
+    num = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+
+    for name, (val, t) in cases.items():
+        bench(name, lambda: cast(val, t), num)
+
+    acc = Fixp[8, 16](12.25)
+    bench('saturate', lambda: saturate(acc, Fixp[4, 12]), num)
+    bench('qround', lambda: qround(acc), num)
@@ -0,0 +1,45 @@
+import sys
+import timeit
+
+from pygears.typing import Array, Fixp, Int, Queue, Tuple, Uint, Union
+from pygears.typing.codec import encoder, decoder
+
+Point = Tuple[{'x': Int[16], 'y': Int[16]}]
+
+types = {
+    'uint': Uint[16],
+    'int': Int[16],
+    'tuple': Point,
+    'array': Array[Point, 8],
+    'queue': Queue[Tuple[Point, Array[Uint[4], 4]], 2],
+    'union': Union[Point, Array[Uint[8], 3], Uint[12]],
+    'fixp': Queue[Tuple[Array[Fixp[4, 16], 8], Uint[3]], 2],
+    'nested': Tuple[Queue[Array[Point, 4], 3], Union[Uint[8], Int[16]],
+                    Array[Array[Uint[3], 3], 3]],
+}
+
+
+def bench(name, t, num):
+    val = t.decode((1 << t.width) // 3)
+    code = val.code()
+
+    encode = timeit.timeit(val.code, number=num)
+    decode = timeit.timeit(lambda: t.decode(code), number=num)
+
+    print(f'{name:>8} ({t.width:>4} bits): encode {num / encode:>10.0f}/s, '
+          f'decode {num / decode:>10.0f}/s')
+
+    enc_func = encoder(t)
+    dec_func = decoder(t)
+    encode = timeit.timeit(lambda: enc_func(val), number=num)
+    decode = timeit.timeit(lambda: dec_func(code), number=num)
+
+    print(f'{"compiled":>20}: encode {num / encode:>10.0f}/s, '
+          f'decode {num / decode:>10.0f}/s')
+
+
+if __name__ == '__main__':
+    num = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+
+    for name, t in types.items():
+        bench(name, t, num)
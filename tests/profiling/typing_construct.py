@@ -0,0 +1,28 @@
+import sys
+import timeit
+
+from pygears.typing import Bool, Fixp, Int, Ufixp, Uint
+
+cases = {
+    'uint(int)': (Uint[16], 0x1234),
+    'uint(uint)': (Uint[16], Uint[8](0x12)),
+    'int(int)': (Int[16], -0x1234),
+    'int(int64)': (Int[64], -(1 << 40)),
+    'fixp(float)': (Fixp[4, 16], -3.14),
+    'fixp(int)': (Fixp[4, 16], 3),
+    'ufixp(float)': (Ufixp[4, 16], 3.14),
+    'bool(int)': (Bool, 1),
+}
+
+
+def bench(name, t, val, num):
+    t(val)
+    dur = timeit.timeit(lambda: t(val), number=num)
+    print(f'{name:>14}: {num / dur:>10.0f}/s')
+
+
+if __name__ == '__main__':
+    num = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+
+    for name, (t, val) in cases.items():
+        bench(name, t, val, num)
@@ -0,0 +1,26 @@
+from pygears.typing import Uint
+
+
+class Api:
+    """Stands in for the function exported by the verilated model, recording
+    the arguments of the last call."""
+    def __init__(self):
+        self.args = None
+
+    def __call__(self, *args):
+        self.args = args
+        return 1
+
+
+class VeriLib:
+    def __getattr__(self, name):
+        api = Api()
+        setattr(self, name, api)
+        return api
+
+
+class Port:
+    def __init__(self, width):
+        self.basename = 'p'
+        self.name = '/dut.p'
+        self.dtype = Uint[width]
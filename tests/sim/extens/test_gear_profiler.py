@@ -0,0 +1,110 @@
+import json
+import os
+from types import SimpleNamespace
+
+from pygears import find, gear, reg
+from pygears.lib import delay, directed, drv, shred
+from pygears.sim import sim
+from pygears.sim.extens.gear_profiler import GearProfiler
+from pygears.sim.modules.cosim_port import InCosimPort, OutCosimPort
+from pygears.sim.sim_gear import SimGear
+from pygears.typing import Uint
+
+
+def test_gear_stats(tmpdir):
+    profiler = []
+
+    drv(t=Uint[8], seq=list(range(10))) \
+        | delay(2) \
+        | shred
+
+    sim(tmpdir, extens=[lambda: profiler.append(GearProfiler())])
+
+    prof = profiler[0]
+    gears = {sim_gear.gear.name: stats for sim_gear, stats in prof.gears.items()}
+
+    assert gears['/drv'].activations > 0
+    assert gears['/delay_gen'].forward > 0
+
+    intfs = {p.name: stats for p, stats in prof.intfs.items()}
+
+    assert intfs['/delay_gen.din'].transfers == 10
+    assert intfs['/delay_gen.din'].stalls >= 20
+
+    hier = prof.hier_stats()
+    assert hier['/'].total == sum(s.total for s in prof.gears.values())
+
+
+def test_outputs(tmpdir):
+    drv(t=Uint[8], seq=list(range(10))) | shred
+
+    sim(tmpdir, extens=[GearProfiler])
+
+    with open(os.path.join(tmpdir, 'profile.json')) as f:
+        res = json.load(f)
+
+    assert set(res['gears']) == {'/drv', '/shred'}
+    assert res['intfs']['/shred.din']['transfers'] == 10
+    assert res['hierarchy']['/']['activations'] == sum(
+        g['activations'] for g in res['gears'].values())
+
+    with open(os.path.join(tmpdir, 'profile.folded')) as f:
+        stacks = [l.split() for l in f.read().splitlines()]
+
+    assert [s[0] for s in stacks] == ['drv', 'shred']
+    assert all(int(s[1]) >= 0 for s in stacks)
+
+
+def test_child_sim_gears(tmpdir):
+    profiler = []
+
+    @gear
+    async def func(dina, dinb) -> b'Uint[2] * dina + dinb':
+        async with dina as a, dinb as b:
+            yield 2 * a + b
+
+    @gear
+    async def test() -> Uint[5]:
+        async with func(1, 4) as v:
+            yield v
+
+    directed(f=test(), ref=[6] * 10)
+    sim(tmpdir, timeout=10, extens=[lambda: profiler.append(GearProfiler())])
+
+    prof = profiler[0]
+    gears = {sim_gear.gear.name: stats for sim_gear, stats in prof.gears.items()}
+
+    # Time spent in the child sim gears is accounted to the gear that
+    # created them
+    assert not any('func' in name for name in gears)
+    assert gears['/test'].activations > 10
+
+
+def test_shared_gear(tmpdir):
+    @gear
+    def add(a, b):
+        return a + b
+
+    add(drv(t=Uint[8], seq=[1]), drv(t=Uint[8], seq=[2])) | shred
+
+    module = find('/add')
+    main = SimGear(module)
+    sim_gears = [main] + [InCosimPort(main, p) for p in module.in_ports] \
+        + [OutCosimPort(main, p) for p in module.out_ports]
+
+    reg['sim/simulator'] = SimpleNamespace(events={})
+    prof = GearProfiler(outdir=tmpdir)
+    prof.before_run(SimpleNamespace(sim_gears=sim_gears))
+
+    for sim_gear in sim_gears:
+        prof.gear_stats(sim_gear).activations += 1
+
+    res = prof.todict()
+
+    assert set(res['gears']) == {'/add', '/add.a', '/add.b', '/add.dout'}
+    assert all(g['activations'] == 1 for g in res['gears'].values())
+    assert res['hierarchy']['/add']['activations'] == 4
+
+    assert set(res['intfs']) == {'/add.a', '/add.b'}
+    assert len(prof.consumers) == 2
+    assert all(len(p.consumer.events['ack']) == 1 for p in module.in_ports)
@@ -0,0 +1,26 @@
+import ctypes
+
+import pytest
+
+from pygears.sim.modules.verilator import CInputDrv, COutputDrv
+
+from .c_drv_stubs import Port, VeriLib
+
+
+@pytest.mark.parametrize('width', [1, 32, 33, 64, 65, 512, 2048])
+def test_marshal(width):
+    din = CInputDrv(VeriLib(), Port(width))
+    dout = COutputDrv(VeriLib(), Port(width))
+
+    for val in [0, 1, (1 << width) - 1, 0x5a5a5a5a5a5a5a5a5a5a5a5a & ((1 << width) - 1)]:
+        din.send(val)
+        data = din.c_set_api.args[0]
+        if width > 64:
+            words = [data[i] for i in range(len(data))]
+            assert words == [(val >> (32 * i)) & 0xffffffff for i in range(len(data))]
+        else:
+            assert data == val
+
+        ctypes.memmove(dout.dout, val.to_bytes(ctypes.sizeof(dout.dout), 'little'),
+                       ctypes.sizeof(dout.dout))
+        assert dout.read() == val
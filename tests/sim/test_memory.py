@@ -0,0 +1,75 @@
+import os
+
+import pytest
+
+from pygears.sim.memory import Memory
+from pygears.typing import Int, Tuple, Uint
+
+
+def test_rw():
+    mem = Memory(Tuple[Int[4], Uint[4]], 16)
+
+    assert mem.size == 1
+    assert mem[3] == (0, 0)
+
+    mem[3] = (-1, 2)
+    assert mem[3] == (-1, 2)
+    assert mem.read_code(3) == 0x2f
+
+    with pytest.raises(IndexError):
+        mem[16]
+
+
+def test_wide():
+    mem = Memory(Uint[100], 4)
+
+    assert mem.size == 13
+
+    mem[Uint[2](1)] = 2**99 + 1
+    assert mem[1] == 2**99 + 1
+    assert mem[2] == 0
+
+
+def test_preload():
+    mem = Memory(Uint[16], 8)
+    mem.preload([1, 2, 3], offset=2)
+    mem.preload({7: 7})
+
+    assert mem.codes() == [0, 0, 1, 2, 3, 0, 0, 7]
+
+
+@pytest.mark.parametrize('ext', ['bin', 'hex'])
+def test_load_dump(tmpdir, ext):
+    fn = os.path.join(tmpdir, f'mem.{ext}')
+
+    mem = Memory(Uint[20], 8)
+    mem.preload(range(100, 108))
+    mem.dump(fn)
+
+    res = Memory(Uint[20], 8)
+    res.load(fn)
+
+    assert res.codes() == list(range(100, 108))
+
+
+def test_readmemh(tmpdir):
+    fn = os.path.join(tmpdir, 'mem.hex')
+    with open(fn, 'w') as f:
+        f.write('// comment\n1 2\n@6\nf_f\n')
+
+    mem = Memory(Uint[8], 8)
+    mem.load(fn)
+
+    assert mem.codes() == [1, 2, 0, 0, 0, 0, 0xff, 0]
+
+
+def test_mmap(tmpdir):
+    fn = os.path.join(tmpdir, 'mem.bin')
+
+    with Memory(Uint[32], 1024, fn=fn) as mem:
+        mem[1023] = 0xdeadbeef
+
+    assert os.path.getsize(fn) == 4096
+
+    with Memory(Uint[32], 1024, fn=fn, readonly=True) as mem:
+        assert mem[1023] == 0xdeadbeef
@@ -0,0 +1,71 @@
+import pytest
+
+from pygears import clear, gear, reg
+from pygears.lib import decouple, directed, drv, qcnt, shred
+from pygears.lib.delay import delay_rng
+from pygears.sim import sim
+from pygears.typing import Queue, Uint
+
+SEQ = [[list(range(3)), list(range(5))], [list(range(1)), list(range(8))]]
+
+
+@pytest.mark.parametrize('scheduler', ['hier', 'activity'])
+@pytest.mark.parametrize('din_delay', [0, 2])
+@pytest.mark.parametrize('dout_delay', [0, 3])
+def test_qcnt_pipeline(scheduler, din_delay, dout_delay):
+    reg['sim/scheduler'] = scheduler
+
+    directed(drv(t=Queue[Uint[16], 3], seq=[SEQ]) | delay_rng(din_delay, din_delay),
+             f=qcnt(running=True),
+             ref=[list(range(1, 18))],
+             delays=[delay_rng(dout_delay, dout_delay)])
+
+    sim()
+
+
+@pytest.mark.parametrize('din_delay', [0, 2])
+@pytest.mark.parametrize('dout_delay', [0, 3])
+def test_same_timing(din_delay, dout_delay):
+    timesteps = []
+    for scheduler in ['hier', 'activity']:
+        clear()
+        reg['sim/scheduler'] = scheduler
+
+        directed(drv(t=Uint[16], seq=list(range(20))) | delay_rng(din_delay, din_delay),
+                 f=decouple,
+                 ref=list(range(20)),
+                 delays=[delay_rng(dout_delay, dout_delay)])
+
+        sim()
+        timesteps.append(reg['sim/timestep'])
+
+    assert timesteps[0] == timesteps[1]
+
+
+def test_child_sim_gears():
+    reg['sim/scheduler'] = 'activity'
+
+    @gear
+    async def func(dina, dinb) -> b'Uint[2] * dina + dinb':
+        async with dina as a, dinb as b:
+            yield 2 * a + b
+
+    @gear
+    async def test() -> Uint[5]:
+        async with func(1, 4) as v:
+            yield v
+
+        async with func(2, 5) as v:
+            yield v
+
+    directed(f=test(), ref=[6, 9] * 10)
+    sim(timeout=2 * 10)
+
+
+def test_unknown_scheduler():
+    reg['sim/scheduler'] = 'unknown'
+
+    drv(t=Uint[16], seq=[1]) | shred
+
+    with pytest.raises(Exception, match='Unsupported simulation scheduler'):
+        sim()
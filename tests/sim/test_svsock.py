@@ -0,0 +1,70 @@
+import pytest
+
+from pygears import gear, reg
+from pygears.lib import ccat, collect
+from pygears.lib.verif import directed, drv
+from pygears.sim import sim
+from pygears.sim.extens.svsock_loopback import loopback
+from pygears.sim.modules.sim_socket import SimSocket
+from pygears.typing import Queue, Tuple, Uint
+
+
+procs = []
+
+
+def loopback_record(**kwds):
+    proc = loopback(**kwds)
+    procs.append(proc)
+    return proc
+
+
+@pytest.fixture(params=[False, True], ids=['single', 'batch'])
+def loopback_cosim(request):
+    reg['sim/svsock/backend'] = {'loopback': loopback_record}
+    reg['sim/svsock/batch_cmds'] = request.param
+    procs.clear()
+    yield request.param
+
+
+@pytest.mark.parametrize('dtype, seq', [
+    (Uint[16], list(range(10))),
+    (Uint[70], [i << 40 for i in range(10)]),
+    (Queue[Tuple[Uint[2], Uint[40]]], [[(1, i * 12) for i in range(4)], [(2, 3)]]),
+])
+def test_loopback(loopback_cosim, dtype, seq):
+    @gear
+    def wire(din: dtype) -> dtype:
+        return din
+
+    directed(drv(t=dtype, seq=seq), f=wire(sim_cls=SimSocket), ref=seq)
+
+    sim()
+
+
+def test_batch_round_trips(loopback_cosim):
+    seq = list(range(10))
+
+    @gear
+    def wire(a: Uint[8], b: Uint[8], c: Uint[8]) -> (Uint[8], Uint[8], Uint[8]):
+        return a, b, c
+
+    res = wire(drv(t=Uint[8], seq=seq),
+               drv(t=Uint[8], seq=seq),
+               drv(t=Uint[8], seq=seq),
+               sim_cls=SimSocket)
+
+    out = []
+    ccat(*res) | collect(result=out)
+
+    sim()
+
+    assert out == [(i, i, i) for i in seq]
+
+    cycles = reg['sim/timestep'] + 1
+    round_trips = procs[0].replies
+    if loopback_cosim:
+        # At most one round trip for the outputs and one for the inputs
+        assert round_trips <= 2 * cycles
+    else:
+        # At least one round trip per output
+        assert round_trips >= 3 * cycles
@@ -0,0 +1,33 @@
+from pygears import reg
+from pygears.lib import decouple, directed, drv, qcnt
+from pygears.lib.delay import delay_rng
+from pygears.sim import sim
+from pygears.typing import Queue, Uint
+
+SEQ = [[list(range(3)), list(range(5))], [list(range(1)), list(range(8))]]
+
+
+def test_qcnt_pipeline():
+    reg['sim/tlm'] = True
+
+    directed(drv(t=Queue[Uint[16], 3], seq=[SEQ] * 4),
+             f=qcnt(running=True),
+             ref=[list(range(1, 18))] * 4)
+
+    sim()
+
+    # Data is transferred in bursts, without a handshake per item
+    assert reg['sim/timestep'] < 17 * 4
+
+
+def test_delays():
+    reg['sim/tlm'] = True
+    reg['sim/tlm_depth'] = 2
+
+    seq = list(range(20))
+    directed(drv(t=Uint[16], seq=seq) | delay_rng(0, 3),
+             f=decouple,
+             ref=seq,
+             delays=[delay_rng(0, 3)])
+
+    sim()
@@ -0,0 +1,70 @@
+import pytest
+
+from pygears.sim.sim import topo_sort, SimCyclic
+
+
+class Node:
+    def __init__(self, name):
+        self.name = name
+
+    def __repr__(self):
+        return self.name
+
+
+def make_dag(edges, names):
+    nodes = {n: Node(n) for n in names}
+    dag = {nodes[n]: [] for n in names}
+    for src, dst in edges:
+        dag[nodes[src]].append(nodes[dst])
+
+    return dag
+
+
+def check_order(dag, order):
+    assert len(order) == len(dag)
+    pos = {g: i for i, g in enumerate(order)}
+    for g, consumers in dag.items():
+        for c in consumers:
+            assert pos[g] < pos[c]
+
+
+def test_diamond():
+    dag = make_dag([('a', 'b'), ('a', 'c'), ('b', 'd'), ('c', 'd')], 'abcd')
+    order = topo_sort(dag)
+
+    check_order(dag, order)
+    assert [g.name for g in order] == ['a', 'c', 'b', 'd']
+
+
+def test_multiple_roots():
+    dag = make_dag([('c', 'a'), ('b', 'a')], 'abc')
+    order = topo_sort(dag)
+
+    check_order(dag, order)
+    assert [g.name for g in order] == ['c', 'b', 'a']
+
+
+def test_cycle():
+    dag = make_dag([('a', 'b'), ('b', 'c'), ('c', 'd'), ('d', 'b')], 'abcd')
+
+    with pytest.raises(SimCyclic, match='b -> c -> d -> b'):
+        topo_sort(dag)
+
+
+def test_self_loop():
+    dag = make_dag([('a', 'a')], 'a')
+
+    with pytest.raises(SimCyclic, match='a -> a'):
+        topo_sort(dag)
+
+
+def test_long_chain():
+    num = 100000
+    names = [f'g{i}' for i in range(num)]
+    # Insert the vertices in reverse so that DFS needs to go the full depth
+    dag = make_dag([(names[i], names[i + 1]) for i in range(num - 1)], names[::-1])
+
+    order = topo_sort(dag)
+
+    check_order(dag, order)
+    assert order[0].name == 'g0'
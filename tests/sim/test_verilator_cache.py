@@ -0,0 +1,68 @@
+import os
+
+from pygears import reg
+from pygears.sim.modules.verilator import (build_hash, cache_entry, cache_evict, cache_fetch,
+                                           cache_store)
+
+
+def write(path, content):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w') as f:
+        f.write(content)
+
+
+def test_build_hash(tmpdir):
+    outdir = str(tmpdir)
+    write(os.path.join(outdir, 'top.sv'), 'module top; endmodule')
+    write(os.path.join(outdir, 'sim_main.cpp'), 'int main() {}')
+
+    key = build_hash(outdir, 'top', False)
+    assert build_hash(outdir, 'top', False) == key
+    assert build_hash(outdir, 'top', True) != key
+    assert build_hash(outdir, 'wrap', False) != key
+
+    write(os.path.join(outdir, 'top.sv'), 'module top(); endmodule')
+    assert build_hash(outdir, 'top', False) != key
+
+
+def test_build_hash_location(tmpdir):
+    for d in ('a', 'b'):
+        write(os.path.join(str(tmpdir), d, 'top.sv'), 'module top; endmodule')
+
+    assert (build_hash(os.path.join(str(tmpdir), 'a'), 'top', False) == build_hash(
+        os.path.join(str(tmpdir), 'b'), 'top', False))
+
+
+def test_cache_fetch(tmpdir):
+    cache_dir = os.path.join(str(tmpdir), 'cache')
+    dll_path = os.path.join(str(tmpdir), 'obj_dir', 'pygearslib')
+
+    assert not cache_fetch(cache_dir, 'key', dll_path)
+
+    write(dll_path, 'lib')
+    cache_store(cache_dir, 'key', dll_path)
+    os.remove(dll_path)
+
+    assert cache_fetch(cache_dir, 'key', dll_path)
+    with open(dll_path) as f:
+        assert f.read() == 'lib'
+
+
+def test_cache_evict(tmpdir):
+    cache_dir = os.path.join(str(tmpdir), 'cache')
+    dll_path = os.path.join(str(tmpdir), 'pygearslib')
+    write(dll_path, 'x' * 100)
+
+    for i, key in enumerate(['k0', 'k1', 'k2']):
+        cache_store(cache_dir, key, dll_path)
+        os.utime(os.path.dirname(cache_entry(cache_dir, key)), (i, i))
+
+    # Using an entry makes it the most recently used one
+    cache_fetch(cache_dir, 'k0', dll_path)
+
+    cache_evict(cache_dir, 250)
+    assert sorted(os.listdir(cache_dir)) == ['k0', 'k2']
+
+
+def test_cache_disabled_by_default():
+    assert reg['sim/verilator/cache_dir'] is None
@@ -0,0 +1,22 @@
+from functools import partial
+
+import pytest
+
+from pygears.lib import decouple, delay_rng, directed, drv
+from pygears.sim import sim
+from pygears.sim.modules import SimVerilated
+from pygears.typing import Queue, Uint
+
+
+@pytest.mark.parametrize('free_run', [1, 16, 1000])
+@pytest.mark.parametrize('fifo_depth', [2, 64])
+@pytest.mark.parametrize('dout_delay', [0, 3])
+def test_free_run(free_run, fifo_depth, dout_delay):
+    seq = [list(range(i)) for i in range(1, 20)]
+
+    directed(drv(t=Queue[Uint[70]], seq=seq),
+             f=decouple(sim_cls=partial(SimVerilated, free_run=free_run, fifo_depth=fifo_depth)),
+             ref=seq,
+             delays=[delay_rng(0, dout_delay)])
+
+    sim()
@@ -0,0 +1,77 @@
+import random
+
+import pytest
+from pygears.typing import Array, Bool, Fixp, Int, Maybe, Queue, Tuple, Uint, Ufixp, Union
+
+np = pytest.importorskip('numpy')
+
+bulk_types = [
+    Bool,
+    Uint[8],
+    Int[5],
+    Uint[64],
+    Int[64],
+    Int[70],
+    Fixp[4, 16],
+    Ufixp[3, 10],
+    Tuple[Int[4], Uint[4]],
+    Tuple[Uint[60], Int[20]],
+    Array[Tuple[Uint[3], Int[5]], 3],
+    Queue[Tuple[Array[Fixp[4, 16], 8], Uint[3]], 2],
+    Union[Uint[8], Int[8]],
+    Maybe[Uint[4]],
+]
+
+
+@pytest.mark.parametrize('dtype', bulk_types)
+def test_roundtrip(dtype):
+    rnd = random.Random(0)
+    codes = [dtype.decode(rnd.randrange(1 << dtype.width)).code() for _ in range(100)]
+
+    vals = dtype.decode_array(np.array(codes, dtype=object if dtype.width > 64 else np.uint64))
+
+    assert [int(c) for c in dtype.encode_array(vals)] == codes
+
+
+def test_decode_values():
+    vals = Tuple[Int[4], Array[Fixp[2, 4], 2]].decode_array([0x7f, 0xa81])
+
+    assert vals['f0'].tolist() == [-1, 1]
+    assert vals['f1'].tolist() == [[1.75, 0.0], [-2.0, -1.5]]
+
+
+def test_encode_values():
+    seq = [1.5, -2.25, 0.125, 7.9]
+    assert Fixp[4, 16].encode_array(seq).tolist() == [Fixp[4, 16](v).code() for v in seq]
+
+    t = Tuple[{'a': Uint[4], 'b': Int[4]}]
+    vals = np.array([(1, -1), (2, 3)], dtype=[('a', 'u1'), ('b', 'i1')])
+    assert t.encode_array(vals).tolist() == [t(v).code() for v in vals.tolist()]
+    assert t.encode_array([[1, -1], [2, 3]]).tolist() == [t(v).code() for v in vals.tolist()]
+
+
+def test_encode_type():
+    for t in (Uint[8], Uint[100]):
+        with pytest.raises(TypeError, match='Cannot encode'):
+            t.encode_array([1.5])
+
+        with pytest.raises(TypeError, match='Cannot encode'):
+            t.encode_array(np.array([1, 2.5], dtype=object))
+
+    assert Uint[100].encode_array([1, 1 << 90]).tolist() == [1, 1 << 90]
+    assert Uint[100].encode_array(np.array([3], dtype=np.uint8)).tolist() == [3]
+
+
+def test_overflow():
+    with pytest.raises(ValueError):
+        Uint[4].encode_array([3, 20])
+
+    with pytest.raises(ValueError):
+        Int[4].encode_array([-9])
+
+    with pytest.raises(ValueError):
+        Uint[4].encode_array([1], overflow='round')
+
+    assert Uint[4].encode_array([3, 20, -1], overflow='saturate').tolist() == [3, 15, 0]
+    assert Int[4].encode_array([-9, 8, 7], overflow='wrap').tolist() == [7, 8, 7]
+    assert Ufixp[2, 4].encode_array([5.0, -1.0], overflow='saturate').tolist() == [15, 0]
@@ -1,5 +1,8 @@
+import random
+
 import pytest
-from pygears.typing import Queue, Uint, Tuple, Array
+from pygears.typing import Queue, Uint, Int, Tuple, Array, Union, Maybe, Fixp, Ufixp, Unit, Bool
+from pygears.typing.codec import encoder, decoder, field_encoder, leaf_types
 
 
 def test_uint():
@@ -51,3 +54,108 @@ def test_tuple():
 @pytest.mark.xfail(raises=TypeError)
 def test_tuple_fail():
     Tuple[Uint[16], Uint[8], Uint[8]]((1, 2)).code()
+
+
+def test_int():
+    assert Int[8](-2).code() == 0xfe
+    assert Int[8].decode(0xfe) == -2
+    assert Int[8].decode(0x7f) == 127
+    assert Int[8].decode(0x80) == -128
+
+
+def test_union():
+    t = Union[Uint[8], Tuple[Uint[4], Int[4]], Uint[2]]
+
+    assert t((0x12, 0)).code() == 0x12
+    assert t(((0x3, -1), 1)).code() == 0x1f3
+    assert t.decode(0x1f3) == t(((0x3, -1), 1))
+    assert t.decode(0x203) == t((0x3, 2))
+
+
+def test_layout():
+    t = Tuple[Uint[16], Queue[Uint[7], 2], Array[Int[3], 2]]
+
+    assert t.layout.width == t.width == 31
+    assert t.layout.offsets == (0, 16, 25)
+    assert t.layout.widths == (16, 9, 6)
+    assert t.layout.masks == (0xffff, 0x1ff, 0x3f)
+    assert t.layout is t.layout
+
+    assert Uint[5].layout.mask == 0x1f
+    assert Uint[5].layout.types == ()
+
+
+def test_nested():
+    t = Tuple[Queue[Array[Tuple[Uint[3], Int[5]], 3], 2], Union[Uint[8], Int[16]]]
+    val = t((([(1, -2), (3, 4), (7, -16)], 2), (-3, 1)))
+
+    assert t.decode(val.code()) == val
+    assert t.decode(val.code()).code() == val.code()
+
+
+codec_types = [
+    Int[7],
+    Uint[9],
+    Fixp[4, 16],
+    Ufixp[2, 5],
+    Array[Int[3], 4],
+    Tuple[Unit, Uint[2], Bool],
+    Queue[Tuple[Array[Fixp[4, 16], 8], Uint[3]], 2],
+    Tuple[Queue[Array[Tuple[Uint[3], Int[5]], 3], 2], Union[Uint[8], Int[8]]],
+    Maybe[Queue[Uint[5]]],
+]
+
+
+@pytest.mark.parametrize('dtype', codec_types)
+def test_compiled_codec(dtype):
+    encode = encoder(dtype)
+    decode = decoder(dtype)
+
+    rnd = random.Random(0)
+    for _ in range(100):
+        val = dtype.decode(rnd.randrange(1 << dtype.width))
+
+        assert encode(val) == val.code()
+
+        res = decode(val.code())
+        assert res == val
+        assert type(res) is dtype
+
+
+def test_compiled_codec_cache():
+    assert encoder(Tuple[Uint[2], Int[3]]) is encoder(Tuple[Uint[2], Int[3]])
+    assert decoder(Tuple[Uint[2], Int[3]]) is decoder(Tuple[Uint[2], Int[3]])
+
+
+def test_compiled_codec_union_unused():
+    t = Union[Uint[2], Int[8]]
+
+    assert decoder(t)(0x1fe) == t((-2, 1))
+    assert decoder(t)(0x0fe) == t((2, 0))
+
+
+def test_compiled_codec_union_ctrl_range():
+    t = Union[Uint[8], Tuple[Uint[4], Int[4]], Uint[2]]
+
+    assert decoder(t)(0x203) == t((0x3, 2))
+    with pytest.raises(ValueError):
+        decoder(t)(0x303)
+
+
+def test_compiled_codec_array_none():
+    t = Array[Uint[4], 3]
+
+    assert encoder(t)(t((1, None, 3))) == 0x301
+
+
+def test_field_encoder():
+    t = Tuple[Queue[Int[4]], Union[Uint[8], Int[8]], Array[Uint[2], 2]]
+
+    assert leaf_types(t) == [Int[4], Uint[1], Uint[8], Uint[1], Uint[2], Uint[2]]
+    assert field_encoder(t)(t(((-2, 1), (-3, 1), (1, 2)))) == (0xe, 1, 0xfd, 1, 1, 2)
+
+
+def test_compiled_codec_bool():
+    # Bool and Uint[1] compare equal, but get their own codecs
+    assert type(decoder(Uint[1])(1)) is Uint[1]
+    assert type(decoder(Bool)(1)) is Bool
@@ -1,3 +1,4 @@
+import pytest
 from math import ceil, floor
 from pygears.typing import Fixp, Ufixp, Uint, Int
 
@@ -238,3 +239,19 @@ def test_sub_val():
     assert uq2_4.max - q3_4.min == q4_6(7.75)
     assert uq3_4.max - q3_5.min == q5_7(11.5)
     assert q2_4.min - uq3_4.max == q5_7(-9.5)
+
+
+def test_construct_range():
+    for t in (Fixp[1, 4], Fixp[4, 8], Ufixp[0, 4], Ufixp[4, 8]):
+        for val in (t.min, t.max):
+            res = t(float(val))
+            assert type(res) is t
+            assert res == val
+
+        with pytest.raises(ValueError):
+            t(float(t.max) + t.quant)
+
+    assert Fixp[4, 8](3) == Fixp[4, 8](3.0)
+
+    with pytest.raises(ValueError):
+        Ufixp[4, 8](-1)
@@ -208,4 +208,20 @@ def test_mul_int():
     assert res == -4
 
 
+def test_cached_type_ops():
+    # Second pass gets the result types from the cache
+    for _ in range(2):
+        assert Uint[8] + Int[8] == Int[10]
+        assert Int[8] + Uint[8] == Int[10]
+        assert -Uint[8] == Int[9]
+        assert Uint[8] << 2 == Uint[10]
+        assert Uint[8] << 3 == Uint[11]
+        assert Uint[8] >> 8 == Unit
+        assert Uint[4] @ Bool == Uint[5]
+        assert Bool @ Uint[4] == Uint[5]
+
+        res = Uint[4](0x5) @ Uint[2](0x3)
+        assert type(res) == Uint[6]
+        assert res == 0x17
+
 # print(Uint[2].max * 2)
@@ -1,4 +1,5 @@
-from pygears.typing import Int, Uint
+import pytest
+from pygears.typing import Int, Integer, Uint
 
 
 def test_abs():
@@ -39,3 +40,25 @@ def test_add():
     res = Uint[5].max + Int[5].max
     assert isinstance(res, Int[7])
     assert res == 46
+
+
+def test_construct_range():
+    for t in (Uint[0], Uint[1], Uint[8], Int[1], Int[8], Int[64]):
+        for val in (t.min, t.max):
+            res = t(int(val))
+            assert type(res) is t
+            assert res == val
+
+        with pytest.raises(ValueError):
+            t(int(t.max) + 1)
+
+    with pytest.raises(ValueError):
+        Uint[8](-1)
+
+    with pytest.raises(ValueError):
+        Int[8](-129)
+
+    # Mask of the sign agnostic type must not enable construction
+    Integer[8].mask
+    assert type(Integer[8](3)) is Uint[8]
+    assert type(Integer[8](-3)) is Int[8]
@@ -0,0 +1,30 @@
+from pygears.typing import Int, Integer, Queue, Tuple, Uint
+from pygears.typing.visitor import TypingVisitorBase
+
+
+class NameVisitor(TypingVisitorBase):
+    def visit_Int(self, type_, field, **kwds):
+        return 'int'
+
+    def visit_Uint(self, type_, field, **kwds):
+        return 'uint'
+
+
+def test_dispatch():
+    v = NameVisitor()
+
+    # Same results need to be returned when the dispatch is cached
+    for _ in range(2):
+        assert v.visit(Tuple[Uint[2], Int[2], Queue[Uint[4]]]) == {
+            'f0': 'uint',
+            'f1': 'int',
+            'f2': {
+                'data': 'uint',
+                'eot': 'uint'
+            }
+        }
+
+        # Unspecified types compare equal by their hashes
+        assert v.visit(Uint) == 'uint'
+        assert v.visit(Int) == 'int'
+        assert v.visit(Integer) is None